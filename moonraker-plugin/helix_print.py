@@ -29,15 +29,27 @@ Configuration (moonraker.conf):
 from __future__ import annotations
 
 import asyncio
-import glob as glob_module
-import json
+import inspect
 import logging
 import os
-import shutil
+import stat
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # orjson is optional; Moonraker doesn't require it
+
+    def _json_dumps(obj: Any) -> str:
+        import json
+
+        return json.dumps(obj)
+
 if TYPE_CHECKING:
     from moonraker.common import RequestType, WebRequest
     from moonraker.confighelper import ConfigHelper
@@ -46,9 +58,80 @@ if TYPE_CHECKING:
 # Database table name for tracking temp files
 HELIX_TEMP_TABLE = "helix_temp_files"
 
+# SQL statements, built once so Moonraker's sqlite3 statement cache
+# sees identical strings on every call
+SQL_CREATE_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {HELIX_TEMP_TABLE} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        original_filename TEXT NOT NULL,
+        temp_filename TEXT NOT NULL,
+        symlink_filename TEXT NOT NULL,
+        modifications TEXT,
+        job_id TEXT,
+        created_at REAL NOT NULL,
+        cleanup_scheduled_at REAL,
+        status TEXT DEFAULT 'active'
+    )
+"""
+# temp_filename is unique per print. Tables created by older plugin
+# versions may hold duplicates, which are dropped once, as a migration,
+# before the unique index first exists.
+HELIX_TEMP_INDEX = f"{HELIX_TEMP_TABLE}_temp_filename"
+SQL_INDEX_EXISTS = f"""
+    SELECT 1 FROM sqlite_master
+    WHERE type = 'index' AND name = '{HELIX_TEMP_INDEX}'
+"""
+SQL_DEDUPE = f"""
+    DELETE FROM {HELIX_TEMP_TABLE}
+    WHERE id NOT IN (
+        SELECT MAX(id) FROM {HELIX_TEMP_TABLE} GROUP BY temp_filename
+    )
+"""
+SQL_CREATE_UNIQUE_INDEX = f"""
+    CREATE UNIQUE INDEX IF NOT EXISTS {HELIX_TEMP_INDEX}
+    ON {HELIX_TEMP_TABLE} (temp_filename)
+"""
+# Every state transition writes the full row through this upsert
+SQL_UPSERT = f"""
+    INSERT INTO {HELIX_TEMP_TABLE}
+    (original_filename, temp_filename, symlink_filename,
+     modifications, created_at, cleanup_scheduled_at, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(temp_filename) DO UPDATE SET
+        original_filename = excluded.original_filename,
+        symlink_filename = excluded.symlink_filename,
+        modifications = excluded.modifications,
+        created_at = excluded.created_at,
+        cleanup_scheduled_at = excluded.cleanup_scheduled_at,
+        status = excluded.status
+"""
+SQL_UPDATE_CLEANED = f"""
+    UPDATE {HELIX_TEMP_TABLE}
+    SET status = ?
+    WHERE temp_filename = ?
+"""
+# Formatted with one "?" placeholder per row in the batch
+SQL_UPDATE_CLEANED_MANY = f"""
+    UPDATE {HELIX_TEMP_TABLE}
+    SET status = ?
+    WHERE temp_filename IN ({{}})
+"""
+SQL_SELECT_PENDING = f"""
+    SELECT temp_filename, symlink_filename
+    FROM {HELIX_TEMP_TABLE}
+    WHERE status = 'pending_cleanup' AND cleanup_scheduled_at < ?
+"""
+SQL_PURGE_CLEANED = f"""
+    DELETE FROM {HELIX_TEMP_TABLE}
+    WHERE status = 'cleaned' AND created_at < ?
+"""
+
 # Maximum age for cleaned database records before deletion (30 days)
 DB_RECORD_MAX_AGE = 30 * 86400
 
+# Maximum rows per batched UPDATE (SQLite's default bound-parameter limit is 999)
+SQL_BATCH_SIZE = 500
+
 # Plugin version - used for API version detection by clients
 PLUGIN_VERSION = "1.0.0"
 
@@ -56,9 +139,40 @@ PLUGIN_VERSION = "1.0.0"
 HELIX_NAMESPACE = "helix_temp_files"
 
 
+def _lstat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Return lstat() of path, or None if it does not exist."""
+    try:
+        return os.lstat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _thumb_stem(name: str) -> str:
+    """Return the G-code stem a thumbnail belongs to.
+
+    Moonraker names thumbnails "<stem>-<width>x<height>.png"; the size
+    suffix is stripped when present.
+    """
+    base = os.path.splitext(name)[0]
+    head, sep, size = base.rpartition("-")
+    if sep and size.replace("x", "", 1).isdigit() and "x" in size:
+        return head
+    return base
+
+
 class PrintInfo:
     """Tracks information about an active modified print."""
 
+    __slots__ = (
+        "original_filename",
+        "temp_filename",
+        "symlink_filename",
+        "modifications",
+        "start_time",
+        "job_id",
+        "db_id",
+    )
+
     def __init__(
         self,
         original_filename: str,
@@ -112,6 +226,15 @@ class HelixPrint:
         # State tracking
         self.active_prints: Dict[str, PrintInfo] = {}
         self.gc_path: Optional[Path] = None
+        self._gc_resolved: Optional[Path] = None  # Cached gc_path.resolve()
+        # Open gcodes directory; file ops use dir_fd-relative names so the
+        # kernel only resolves the path below the gcodes root
+        self._gc_fd: Optional[int] = None
+        self._initialized = False
+
+        # Thumbnail filenames in .thumbs keyed by G-code stem. Built lazily,
+        # dropped when the file list changes outside our own directories.
+        self._thumb_index: Optional[Dict[str, List[str]]] = None
 
         # Database backend flags (mutually exclusive, one will be True after init)
         self._use_sqlite = False      # Moonraker 0.9+ with execute_db_command
@@ -153,6 +276,9 @@ class HelixPrint:
         self.server.register_event_handler(
             "server:klippy_ready", self._on_klippy_ready
         )
+        self.server.register_event_handler(
+            "file_manager:filelist_changed", self._on_filelist_changed
+        )
 
         logging.info(
             f"HelixPrint v{PLUGIN_VERSION} initialized: temp={self.temp_dir}, "
@@ -196,7 +322,7 @@ class HelixPrint:
         # Resolve to absolute path (follows symlinks, resolves ..)
         try:
             resolved = path.resolve()
-            gc_resolved = self.gc_path.resolve()
+            gc_resolved = self._gc_resolved or self.gc_path.resolve()
         except (OSError, RuntimeError) as e:
             raise self.server.error(f"Invalid path: {e}", 400)
 
@@ -220,7 +346,13 @@ class HelixPrint:
     # =========================================================================
 
     async def component_init(self) -> None:
-        """Called after all components are loaded."""
+        """Called after all components are loaded.
+
+        Repeat calls are no-ops until close() has run.
+        """
+        if self._initialized:
+            return
+
         self.file_manager = self.server.lookup_component("file_manager")
         self.history = self.server.lookup_component("history", None)
         self.klippy = self.server.lookup_component("klippy_connection")
@@ -228,6 +360,10 @@ class HelixPrint:
 
         # Get gcodes path
         self.gc_path = Path(self.file_manager.get_directory("gcodes"))
+        self._gc_resolved = self.gc_path.resolve()
+        self._gc_fd = os.open(
+            self.gc_path, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC
+        )
 
         # Ensure directories exist
         await self._ensure_directories()
@@ -237,6 +373,14 @@ class HelixPrint:
 
         # Schedule startup cleanup
         self.eventloop.register_callback(self._startup_cleanup)
+        self._initialized = True
+
+    def close(self) -> None:
+        """Called by Moonraker on shutdown."""
+        if self._gc_fd is not None:
+            os.close(self._gc_fd)
+            self._gc_fd = None
+        self._initialized = False
 
     async def _ensure_directories(self) -> None:
         """Ensure temp and symlink directories exist."""
@@ -268,26 +412,15 @@ class HelixPrint:
         # Try SQLite API first (Moonraker 0.9+)
         if hasattr(self.database, "execute_db_command"):
             try:
-                await self.database.execute_db_command(
-                    f"""
-                    CREATE TABLE IF NOT EXISTS {HELIX_TEMP_TABLE} (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        original_filename TEXT NOT NULL,
-                        temp_filename TEXT NOT NULL,
-                        symlink_filename TEXT NOT NULL,
-                        modifications TEXT,
-                        job_id TEXT,
-                        created_at REAL NOT NULL,
-                        cleanup_scheduled_at REAL,
-                        status TEXT DEFAULT 'active'
-                    )
-                    """
-                )
+                await self.database.execute_db_command(SQL_CREATE_TABLE)
+            except Exception as e:
+                logging.warning(f"HelixPrint: SQLite init failed: {e}, trying namespace API")
+            else:
                 self._use_sqlite = True
+                await self._migrate_sqlite()
+                await self._tune_sqlite()
                 logging.info("HelixPrint: Using SQLite database for persistence")
                 return
-            except Exception as e:
-                logging.warning(f"HelixPrint: SQLite init failed: {e}, trying namespace API")
 
         # Fall back to namespace API (Moonraker 0.8.x)
         if hasattr(self.database, "insert_item"):
@@ -297,6 +430,55 @@ class HelixPrint:
 
         logging.warning("HelixPrint: No compatible database API found, persistence disabled")
 
+    async def _migrate_sqlite(self) -> None:
+        """Drop legacy duplicate rows and add the temp_filename unique index.
+
+        One-time migration: the full-table DELETE only runs while the
+        unique index has never been created. The schema is tracked through
+        our own index rather than PRAGMA user_version, which belongs to
+        Moonraker's shared database. Failures are logged but never change
+        the backend choice.
+        """
+        try:
+            if not await self._fetch_rows(SQL_INDEX_EXISTS):
+                await self.database.execute_db_command(SQL_DEDUPE)
+                await self.database.execute_db_command(SQL_CREATE_UNIQUE_INDEX)
+        except Exception as e:
+            logging.error(f"HelixPrint: SQLite migration failed: {e}")
+
+    async def _fetch_rows(self, sql: str, params: tuple = ()) -> List[Any]:
+        """Run a SELECT and return its rows as a list.
+
+        Moonraker returns a cursor proxy (always truthy, with a coroutine
+        fetchall()) rather than the rows themselves.
+        """
+        result = await self.database.execute_db_command(sql, params)
+        fetchall = getattr(result, "fetchall", None)
+        if fetchall is None:
+            return list(result or [])
+        rows = fetchall()
+        if inspect.isawaitable(rows):
+            rows = await rows
+        return list(rows)
+
+    async def _tune_sqlite(self) -> None:
+        """Switch the SQLite connection to WAL journaling.
+
+        WAL with synchronous=NORMAL avoids the exclusive lock and double
+        fsync of the default DELETE journal, so our writes don't stall other
+        Moonraker readers. Runs once at startup since Moonraker shares a
+        single connection. Failures are non-fatal (e.g. in-memory databases).
+        """
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA wal_autocheckpoint=1000",
+        ):
+            try:
+                await self.database.execute_db_command(pragma)
+            except Exception as e:
+                logging.debug(f"HelixPrint: {pragma} failed: {e}")
+
     # =========================================================================
     # API Handlers
     # =========================================================================
@@ -340,9 +522,10 @@ class HelixPrint:
         if self.gc_path is None:
             raise self.server.error("File manager not initialized", 500)
 
-        # Get and validate parameters
-        original_filename = web_request.get_str("original_filename")
-        temp_file_path = web_request.get_str("temp_file_path")
+        # Get and validate parameters (typed accessors reject wrong types)
+        get_str = web_request.get_str
+        original_filename = get_str("original_filename")
+        temp_file_path = get_str("temp_file_path")
         modifications = web_request.get_list("modifications", [])
         copy_metadata = web_request.get_boolean("copy_metadata", True)
 
@@ -354,13 +537,15 @@ class HelixPrint:
         original_path = self.gc_path / original_filename
         original_resolved = self._validate_path_within_gcodes(original_path)
 
-        if not original_resolved.exists():
+        # Single lstat covers both the existence and the symlink check
+        original_st = _lstat_or_none(original_path)
+        if original_st is None:
             raise self.server.error(
                 f"Original file not found: {original_filename}", 400
             )
 
         # Don't allow following symlinks for the original file
-        if original_path.is_symlink():
+        if stat.S_ISLNK(original_st.st_mode):
             raise self.server.error(
                 "Original file cannot be a symlink", 400
             )
@@ -390,22 +575,9 @@ class HelixPrint:
         symlink_filename = f"{self.symlink_dir}/{base_name}"
         symlink_path = self.gc_path / symlink_filename
 
-        # Validate symlink path
+        # Validate symlink path (directory is created by _ensure_directories)
         self._validate_path_within_gcodes(symlink_path.parent)
 
-        symlink_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create symlink atomically (handles race condition)
-        try:
-            self._create_symlink_atomic(symlink_path, temp_path)
-            logging.info(
-                f"HelixPrint: Created symlink {symlink_filename} -> {temp_filename}"
-            )
-        except Exception as e:
-            # Clean up temp file on symlink failure
-            temp_path.unlink(missing_ok=True)
-            raise self.server.error(f"Failed to create symlink: {e}", 500)
-
         # Track this print
         print_info = PrintInfo(
             original_filename=original_filename,
@@ -416,7 +588,21 @@ class HelixPrint:
         )
         self.active_prints[symlink_filename] = print_info
 
-        # Persist to database for crash recovery
+        # Create the symlink only now, right before klippy opens it, so
+        # nothing is left to clean up if an earlier step fails
+        try:
+            self._create_symlink_atomic(symlink_filename, temp_path)
+            logging.info(
+                f"HelixPrint: Created symlink {symlink_filename} -> {temp_filename}"
+            )
+        except Exception as e:
+            self._rollback(temp_filename)
+            del self.active_prints[symlink_filename]
+            raise self.server.error(f"Failed to create symlink: {e}", 500)
+
+        # Persist to database for crash recovery. Done after the symlink
+        # exists so a failed link never leaves an 'active' row behind;
+        # persistence failures are logged, not raised.
         await self._persist_print_info(print_info)
 
         # Start the print with symlink path (escape filename for G-code)
@@ -427,9 +613,7 @@ class HelixPrint:
             )
             logging.info(f"HelixPrint: Started print with {symlink_filename}")
         except Exception as e:
-            # Clean up on print start failure
-            symlink_path.unlink(missing_ok=True)
-            temp_path.unlink(missing_ok=True)
+            self._rollback(temp_filename, symlink_filename)
             del self.active_prints[symlink_filename]
             raise self.server.error(f"Failed to start print: {e}", 500)
 
@@ -440,19 +624,58 @@ class HelixPrint:
             "status": "printing",
         }
 
-    def _create_symlink_atomic(self, symlink_path: Path, target_path: Path) -> None:
+    def _rollback(
+        self, temp_filename: str, symlink_filename: Optional[str] = None
+    ) -> None:
+        """Remove the files of a print that failed to start.
+
+        Each file costs a single unlink; already-missing files are ignored.
+        """
+        if symlink_filename is not None:
+            self._unlink_if_exists(symlink_filename)
+        self._unlink_if_exists(temp_filename)
+
+    def _create_symlink_atomic(
+        self, symlink_filename: str, target_path: Path
+    ) -> None:
         """
         Create symlink atomically, handling existing files.
 
-        Uses try/except pattern to avoid TOCTOU race conditions.
+        symlink_filename is relative to the gcodes directory. The link is
+        created under a staging name and renamed over the final name, so an
+        existing link is replaced without a separate unlink and readers
+        never see the name missing. As with _unlink_if_exists, absolute
+        paths are used once close() has released the directory fd.
         """
+        target = str(target_path)
+        # Per-process staging name, so another writer can't collide with it
+        staging = f"{symlink_filename}.{os.getpid()}.tmp"
+        dir_fd = self._gc_fd
+        link_name, staging_name = symlink_filename, staging
+        if dir_fd is None:
+            if self.gc_path is None:
+                raise FileNotFoundError("gcodes directory is not available")
+            link_name = os.path.join(self.gc_path, symlink_filename)
+            staging_name = os.path.join(self.gc_path, staging)
         try:
-            symlink_path.symlink_to(target_path)
+            os.symlink(target, staging_name, dir_fd=dir_fd)
         except FileExistsError:
-            # Remove existing and retry
-            if symlink_path.is_symlink() or symlink_path.exists():
-                symlink_path.unlink()
-            symlink_path.symlink_to(target_path)
+            # Leftover from an interrupted request - remove and retry
+            self._unlink_if_exists(staging)
+            os.symlink(target, staging_name, dir_fd=dir_fd)
+        except FileNotFoundError:
+            # Symlink directory was removed after startup - recreate it
+            (self.gc_path / symlink_filename).parent.mkdir(
+                parents=True, exist_ok=True
+            )
+            os.symlink(target, staging_name, dir_fd=dir_fd)
+        try:
+            os.replace(
+                staging_name, link_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd
+            )
+        except OSError:
+            self._unlink_if_exists(staging)
+            raise
 
     # =========================================================================
     # Metadata Handling
@@ -465,30 +688,62 @@ class HelixPrint:
         if self.gc_path is None:
             return
 
-        thumbs_dir = self.gc_path / ".thumbs"
-        if not thumbs_dir.exists():
-            return
+        # Directory scan and symlink creation block; keep them off the loop
+        await self.eventloop.run_in_thread(
+            self._link_thumbnails, original_path.stem, temp_path.stem
+        )
 
-        original_stem = original_path.stem
-        temp_stem = temp_path.stem
+    def _link_thumbnails(self, original_stem: str, temp_stem: str) -> None:
+        """Symlink the original's thumbnails under the temp file's name."""
+        thumbs_dir = self.gc_path / ".thumbs"
 
-        # Escape glob special characters in the stem
-        escaped_stem = glob_module.escape(original_stem)
+        # Runs in a worker thread while the loop may drop self._thumb_index,
+        # so keep working on a local reference to the index
+        index = self._get_thumb_index()
+        thumb_names = index.get(original_stem)
+        if not thumb_names:
+            # Thumbnails may have been extracted after the index was built
+            self._thumb_index = None
+            index = self._get_thumb_index()
+            thumb_names = index.get(original_stem)
+            if not thumb_names:
+                return
 
         # Find and link thumbnails for the original file
-        for thumb in thumbs_dir.glob(f"{escaped_stem}*"):
+        for name in list(thumb_names):
             try:
                 # Create symlink to original thumbnail with new name
-                new_name = thumb.name.replace(original_stem, temp_stem)
+                new_name = temp_stem + name[len(original_stem):]
                 temp_thumb = thumbs_dir / new_name
                 if not temp_thumb.exists():
-                    temp_thumb.symlink_to(thumb)
+                    temp_thumb.symlink_to(thumbs_dir / name)
+                    index.setdefault(temp_stem, []).append(new_name)
                     logging.debug(
-                        f"HelixPrint: Linked thumbnail {new_name} -> {thumb.name}"
+                        f"HelixPrint: Linked thumbnail {new_name} -> {name}"
                     )
             except Exception as e:
                 logging.warning(f"HelixPrint: Failed to link thumbnail: {e}")
 
+    def _get_thumb_index(self) -> Dict[str, List[str]]:
+        """Return the thumbnail index, scanning .thumbs once if needed.
+
+        Returns the index object itself rather than re-reading the
+        attribute, which the event loop may reset concurrently.
+        """
+        index = self._thumb_index
+        if index is None:
+            index = {}
+            try:
+                with os.scandir(self.gc_path / ".thumbs") as entries:
+                    for entry in entries:
+                        index.setdefault(_thumb_stem(entry.name), []).append(
+                            entry.name
+                        )
+            except FileNotFoundError:
+                pass
+            self._thumb_index = index
+        return index
+
     # =========================================================================
     # Database Operations
     # =========================================================================
@@ -500,28 +755,17 @@ class HelixPrint:
             "temp_filename": print_info.temp_filename,
             "symlink_filename": print_info.symlink_filename,
             "modifications": print_info.modifications,
-            "created_at": time.time(),
+            # Same timestamp as the in-memory record, so history
+            # correlation against start_time is exact
+            "created_at": print_info.start_time,
             "cleanup_scheduled_at": None,
             "status": "active",
         }
 
         try:
             if self._use_sqlite:
-                result = await self.database.execute_db_command(
-                    f"""
-                    INSERT INTO {HELIX_TEMP_TABLE}
-                    (original_filename, temp_filename, symlink_filename,
-                     modifications, created_at, status)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record["original_filename"],
-                        record["temp_filename"],
-                        record["symlink_filename"],
-                        json.dumps(record["modifications"]),
-                        record["created_at"],
-                        record["status"],
-                    ),
+                result = await self._upsert_print_row(
+                    print_info, record["created_at"], None, record["status"]
                 )
                 print_info.db_id = result.lastrowid
             elif self._use_namespace:
@@ -534,6 +778,27 @@ class HelixPrint:
         except Exception as e:
             logging.warning(f"HelixPrint: Failed to persist print info: {e}")
 
+    async def _upsert_print_row(
+        self,
+        print_info: PrintInfo,
+        created_at: float,
+        cleanup_scheduled_at: Optional[float],
+        status: str,
+    ) -> Any:
+        """Insert or update the SQLite row for a print, keyed by temp file."""
+        return await self.database.execute_db_command(
+            SQL_UPSERT,
+            (
+                print_info.original_filename,
+                print_info.temp_filename,
+                print_info.symlink_filename,
+                _json_dumps(print_info.modifications),
+                created_at,
+                cleanup_scheduled_at,
+                status,
+            ),
+        )
+
     # =========================================================================
     # Event Handlers
     # =========================================================================
@@ -543,6 +808,16 @@ class HelixPrint:
         logging.debug("HelixPrint: Klipper ready, checking for interrupted prints")
         # Recovery logic would go here if needed
 
+    async def _on_filelist_changed(self, response: Dict[str, Any]) -> None:
+        """Drop the thumbnail index when G-code files change.
+
+        Changes inside our own temp/symlink directories don't affect
+        the original files' thumbnails and are ignored.
+        """
+        path = response.get("item", {}).get("path", "")
+        if not path.startswith((f"{self.temp_dir}/", f"{self.symlink_dir}/")):
+            self._thumb_index = None
+
     async def _on_job_state_changed(
         self,
         job_event: Any,
@@ -646,10 +921,10 @@ class HelixPrint:
             return
 
         # Immediately delete symlink (no longer needed)
-        symlink_path = self.gc_path / print_info.symlink_filename
-        if symlink_path.is_symlink():
-            symlink_path.unlink()
-            logging.debug(f"HelixPrint: Removed symlink {symlink_path}")
+        if self._unlink_if_exists(print_info.symlink_filename, symlink_only=True):
+            logging.debug(
+                f"HelixPrint: Removed symlink {print_info.symlink_filename}"
+            )
 
         # Also clean up thumbnail symlinks
         await self._cleanup_thumbnail_symlinks(print_info.temp_filename)
@@ -658,13 +933,10 @@ class HelixPrint:
         cleanup_time = time.time() + self.cleanup_delay
         try:
             if self._use_sqlite:
-                await self.database.execute_db_command(
-                    f"""
-                    UPDATE {HELIX_TEMP_TABLE}
-                    SET cleanup_scheduled_at = ?, status = ?
-                    WHERE temp_filename = ?
-                    """,
-                    (cleanup_time, "pending_cleanup", print_info.temp_filename),
+                # Upsert also recovers a row whose initial insert failed
+                await self._upsert_print_row(
+                    print_info, print_info.start_time, cleanup_time,
+                    "pending_cleanup",
                 )
             elif self._use_namespace:
                 # Update record in namespace storage
@@ -702,35 +974,49 @@ class HelixPrint:
         if self.gc_path is None:
             return
 
-        thumbs_dir = self.gc_path / ".thumbs"
-        if not thumbs_dir.exists():
-            return
+        await self.eventloop.run_in_thread(
+            self._remove_thumbnail_symlinks, temp_filename
+        )
 
+    def _remove_thumbnail_symlinks(self, temp_filename: str) -> None:
+        """Remove thumbnail symlinks for a temp file (blocking)."""
         temp_stem = Path(temp_filename).stem
 
-        # Escape glob special characters
-        escaped_stem = glob_module.escape(temp_stem)
+        # DirEntry.is_symlink() uses the d_type from the directory read,
+        # so only matching symlinks cost an extra syscall (the unlink)
+        try:
+            with os.scandir(self.gc_path / ".thumbs") as entries:
+                for entry in entries:
+                    if (
+                        entry.name.startswith(temp_stem)
+                        and entry.is_symlink()
+                        and _thumb_stem(entry.name) == temp_stem
+                    ):
+                        os.unlink(entry.path)
+                        logging.debug(
+                            f"HelixPrint: Removed thumbnail symlink {entry.path}"
+                        )
+        except FileNotFoundError:
+            pass  # No .thumbs directory, or a link vanished mid-scan
 
-        for thumb in thumbs_dir.glob(f"{escaped_stem}*"):
-            if thumb.is_symlink():
-                thumb.unlink()
-                logging.debug(f"HelixPrint: Removed thumbnail symlink {thumb}")
+        index = self._thumb_index
+        if index is not None:
+            index.pop(temp_stem, None)
 
     async def _cleanup_temp_file(self, temp_filename: str) -> None:
         """Delete a temp file after cleanup delay."""
         if self.gc_path is None:
             return
 
-        temp_path = self.gc_path / temp_filename
         file_deleted = False
         try:
-            if temp_path.exists():
-                temp_path.unlink()
-                file_deleted = True
+            if await self.eventloop.run_in_thread(
+                self._unlink_if_exists, temp_filename
+            ):
                 logging.info(f"HelixPrint: Cleaned up {temp_filename}")
-            else:
-                # File already gone (manual deletion or previous cleanup)
-                file_deleted = True
+            # Already-missing files (manual deletion or previous cleanup)
+            # count as deleted too
+            file_deleted = True
         except OSError as e:
             logging.error(f"HelixPrint: Failed to delete {temp_filename}: {e}")
             return  # Don't mark as cleaned if file delete failed
@@ -742,11 +1028,7 @@ class HelixPrint:
         try:
             if self._use_sqlite:
                 await self.database.execute_db_command(
-                    f"""
-                    UPDATE {HELIX_TEMP_TABLE}
-                    SET status = ?
-                    WHERE temp_filename = ?
-                    """,
+                    SQL_UPDATE_CLEANED,
                     ("cleaned", temp_filename),
                 )
             elif self._use_namespace:
@@ -763,6 +1045,44 @@ class HelixPrint:
         except Exception as e:
             logging.warning(f"HelixPrint: Failed to update cleanup status: {e}")
 
+    def _unlink_if_exists(self, filename: str, symlink_only: bool = False) -> bool:
+        """
+        Delete a gcodes-relative file, returning False if it was already gone.
+
+        With symlink_only, regular files at that path are left untouched.
+        Once close() has released the directory fd (e.g. for a cleanup
+        callback firing during shutdown), the absolute path is used so the
+        name never resolves against the process working directory.
+        """
+        dir_fd = self._gc_fd
+        if dir_fd is None:
+            if self.gc_path is None:
+                return False
+            filename = os.path.join(self.gc_path, filename)
+        try:
+            if symlink_only:
+                st = os.stat(filename, dir_fd=dir_fd, follow_symlinks=False)
+                if not stat.S_ISLNK(st.st_mode):
+                    return False
+            os.unlink(filename, dir_fd=dir_fd)
+        except FileNotFoundError:
+            return False
+        return True
+
+    async def _cleanup_row(self, record: Dict[str, Any]) -> None:
+        """Delete the files belonging to one stale database record."""
+        await self.eventloop.run_in_thread(
+            self._remove_print_files,
+            record["temp_filename"],
+            record["symlink_filename"],
+        )
+        await self._cleanup_thumbnail_symlinks(record["temp_filename"])
+
+    def _remove_print_files(self, temp_filename: str, symlink_filename: str) -> None:
+        """Delete a print's temp file and symlink (blocking)."""
+        self._unlink_if_exists(temp_filename)
+        self._unlink_if_exists(symlink_filename, symlink_only=True)
+
     async def _startup_cleanup(self) -> None:
         """Clean up stale temp files on startup."""
         if self.gc_path is None:
@@ -777,16 +1097,8 @@ class HelixPrint:
             pending_records: List[Dict[str, Any]] = []
 
             if self._use_sqlite:
-                rows = await self.database.execute_db_command(
-                    f"""
-                    SELECT temp_filename, symlink_filename
-                    FROM {HELIX_TEMP_TABLE}
-                    WHERE status = 'pending_cleanup' AND cleanup_scheduled_at < ?
-                    """,
-                    (now,),
-                )
-                if rows:
-                    pending_records = [dict(r) for r in rows]
+                rows = await self._fetch_rows(SQL_SELECT_PENDING, (now,))
+                pending_records = [dict(r) for r in rows]
 
             elif self._use_namespace:
                 # Get all items and filter in Python
@@ -803,34 +1115,25 @@ class HelixPrint:
                     ):
                         pending_records.append(record)
 
-            # Clean up each pending file
+            # Clean up pending files concurrently; rows are independent, so
+            # one failure must not stop the others from being marked cleaned
+            results = await asyncio.gather(
+                *map(self._cleanup_row, pending_records), return_exceptions=True
+            )
+
             cleaned_count = 0
-            for record in pending_records:
+            cleaned_filenames: List[str] = []
+            for record, outcome in zip(pending_records, results):
                 temp_filename = record["temp_filename"]
-                symlink_filename = record["symlink_filename"]
-
-                # Clean up files
-                temp_path = self.gc_path / temp_filename
-                symlink_path = self.gc_path / symlink_filename
-
-                if temp_path.exists():
-                    temp_path.unlink()
-                if symlink_path.is_symlink():
-                    symlink_path.unlink()
-
-                # Clean up thumbnail symlinks
-                await self._cleanup_thumbnail_symlinks(temp_filename)
+                if isinstance(outcome, Exception):
+                    logging.warning(
+                        f"HelixPrint: Failed to clean up {temp_filename}: {outcome}"
+                    )
+                    continue
 
-                # Update status
+                # Update status (SQLite rows are batched into one UPDATE below)
                 if self._use_sqlite:
-                    await self.database.execute_db_command(
-                        f"""
-                        UPDATE {HELIX_TEMP_TABLE}
-                        SET status = ?
-                        WHERE temp_filename = ?
-                        """,
-                        ("cleaned", temp_filename),
-                    )
+                    cleaned_filenames.append(temp_filename)
                 elif self._use_namespace:
                     record["status"] = "cleaned"
                     await self.database.update_item(
@@ -838,6 +1141,16 @@ class HelixPrint:
                     )
                 cleaned_count += 1
 
+            # One statement (and one commit) per batch of cleaned rows,
+            # kept under SQLite's bound-parameter limit
+            for i in range(0, len(cleaned_filenames), SQL_BATCH_SIZE):
+                batch = cleaned_filenames[i : i + SQL_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                await self.database.execute_db_command(
+                    SQL_UPDATE_CLEANED_MANY.format(placeholders),
+                    ("cleaned", *batch),
+                )
+
             if cleaned_count > 0:
                 logging.info(
                     f"HelixPrint: Startup cleanup removed {cleaned_count} stale files"
@@ -849,10 +1162,7 @@ class HelixPrint:
 
             if self._use_sqlite:
                 deleted = await self.database.execute_db_command(
-                    f"""
-                    DELETE FROM {HELIX_TEMP_TABLE}
-                    WHERE status = 'cleaned' AND created_at < ?
-                    """,
+                    SQL_PURGE_CLEANED,
                     (purge_cutoff,),
                 )
                 if deleted and deleted.rowcount > 0:
@@ -1204,6 +1514,7 @@ class HelixPrint:
         A production version would need to handle includes properly.
         """
         import re
+        import shutil
 
         config_dir = await self._get_config_dir()
         if not config_dir:
@@ -12,7 +12,10 @@ Run with: pytest tests/test_helix_print.py -v
 import asyncio
 import json
 import os
+import shutil
+import sqlite3
 import tempfile
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -30,20 +33,41 @@ from helix_print import HelixPrint, PrintInfo, load_component
 # Test Fixtures and Mocks
 # ============================================================================
 
+_MISSING = object()
+
+
 class MockWebRequest:
-    """Mock WebRequest for testing API endpoints."""
+    """Mock WebRequest for testing API endpoints.
+
+    Mirrors Moonraker's typed accessors: missing required arguments and
+    values of the wrong type raise instead of being coerced.
+    """
 
     def __init__(self, params: Dict[str, Any]):
         self._params = params
 
-    def get_str(self, key: str, default: str = "") -> str:
-        return str(self._params.get(key, default))
+    def _get(self, key: str, default: Any, dtype: type) -> Any:
+        if key not in self._params:
+            if default is _MISSING:
+                raise Exception(f"400: No data for argument: {key}")
+            return default
+        value = self._params[key]
+        if dtype is bool and isinstance(value, str):
+            if value.lower() not in ("true", "false"):
+                raise Exception(f"400: Invalid boolean for argument: {key}")
+            return value.lower() == "true"
+        if not isinstance(value, dtype):
+            raise Exception(f"400: Invalid type for argument: {key}")
+        return value
 
-    def get_list(self, key: str, default: list = None) -> list:
-        return self._params.get(key, default or [])
+    def get_str(self, key: str, default: Any = _MISSING) -> str:
+        return self._get(key, default, str)
 
-    def get_boolean(self, key: str, default: bool = False) -> bool:
-        return bool(self._params.get(key, default))
+    def get_list(self, key: str, default: Any = _MISSING) -> list:
+        return self._get(key, default, list)
+
+    def get_boolean(self, key: str, default: Any = _MISSING) -> bool:
+        return self._get(key, default, bool)
 
 
 class MockServer:
@@ -54,6 +78,12 @@ class MockServer:
         self.event_handlers = {}
         self.components = {}
         self._error_class = Exception
+        self._request = MockWebRequest({})
+
+    async def call(self, path: str, **args):
+        """Invoke a registered endpoint with the given request arguments."""
+        self._request._params = args
+        return await self.endpoints[path](self._request)
 
     def register_endpoint(self, path: str, methods: list, handler):
         self.endpoints[path] = handler
@@ -82,6 +112,9 @@ class MockEventLoop:
     def delay_callback(self, delay: float, callback, *args):
         pass
 
+    async def run_in_thread(self, callback, *args):
+        return callback(*args)
+
 
 class MockFileManager:
     """Mock file manager for testing."""
@@ -101,13 +134,49 @@ class MockDatabase:
     def __init__(self):
         self.data = {}
         self.tables_created = []
+        self.commands = []
+        self.select_rows = []  # Rows returned for SELECT queries
 
     async def execute_db_command(self, sql: str, params: tuple = None):
+        self.commands.append((sql, params))
         if sql.strip().upper().startswith("CREATE TABLE"):
             self.tables_created.append(sql)
+        if sql.strip().upper().startswith("SELECT"):
+            return self.select_rows
         return MagicMock(lastrowid=1)
 
 
+class SqliteCursorProxy:
+    """Mirrors Moonraker's SqliteCursorProxy: always truthy, async fetches."""
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+        self.lastrowid = cursor.lastrowid
+        self.rowcount = cursor.rowcount
+
+    async def fetchall(self):
+        return self._cursor.fetchall()
+
+
+class SqliteDatabase:
+    """In-memory SQLite database exposing Moonraker's execute_db_command."""
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+
+    async def execute_db_command(self, sql: str, params: tuple = ()):
+        cursor = self.conn.execute(sql, params)
+        if not sql.strip().upper().startswith("SELECT"):
+            self.conn.commit()
+        return SqliteCursorProxy(cursor)
+
+    def rows(self):
+        return [
+            dict(r) for r in self.conn.execute("SELECT * FROM helix_temp_files")
+        ]
+
+
 class MockKlippy:
     """Mock Klipper connection for testing."""
 
@@ -161,11 +230,44 @@ class MockConfigHelper:
         return bool(self._options.get(key, default))
 
 
+def write_files(root: str, files: Dict[str, str]) -> None:
+    """Create files (and any parent directories) below root in one pass."""
+    for dirname in {os.path.dirname(name) for name in files} - {""}:
+        os.makedirs(os.path.join(root, dirname), exist_ok=True)
+    for name, content in files.items():
+        fd = os.open(os.path.join(root, name),
+                     os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content.encode())
+        finally:
+            os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def gcodes_root(tmp_path_factory):
+    """Session-wide G-code directory, emptied before each test.
+
+    Placed on tmpfs (/dev/shm) when available so fixture I/O stays in RAM.
+    """
+    shm = Path("/dev/shm")
+    if not (shm.is_dir() and os.access(shm, os.W_OK)):
+        yield str(tmp_path_factory.mktemp("gcodes"))
+        return
+    root = tempfile.mkdtemp(prefix="helix_gcodes_", dir=shm)
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
 @pytest.fixture
-def temp_gcodes_dir():
-    """Create a temporary directory for G-code files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def temp_gcodes_dir(gcodes_root):
+    """Provide an empty G-code directory for the current test."""
+    with os.scandir(gcodes_root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    return gcodes_root
 
 
 @pytest.fixture
@@ -174,25 +276,59 @@ def mock_server():
     return MockServer()
 
 
-@pytest.fixture
-def helix_print_component(mock_server, temp_gcodes_dir):
-    """Create a HelixPrint component instance for testing."""
-    # Set up mock components
-    mock_server.components["file_manager"] = MockFileManager(temp_gcodes_dir)
-    mock_server.components["database"] = MockDatabase()
-    mock_server.components["klippy_connection"] = MockKlippy()
-    mock_server.components["history"] = MockHistory()
-
-    # Create config
-    config = MockConfigHelper(mock_server, {
+@pytest.fixture(scope="session")
+def helix_server():
+    """Mock Moonraker server owning the shared HelixPrint component."""
+    return MockServer()
+
+
+@pytest.fixture(scope="session")
+def _session_component(helix_server, gcodes_root):
+    """Create and initialize one HelixPrint component for the session."""
+    helix_server.components["file_manager"] = MockFileManager(gcodes_root)
+    helix_server.components["database"] = MockDatabase()
+    helix_server.components["klippy_connection"] = MockKlippy()
+    helix_server.components["history"] = MockHistory()
+
+    config = MockConfigHelper(helix_server, {
         "temp_dir": ".helix_temp",
         "symlink_dir": ".helix_print",
         "cleanup_delay": 3600,
         "enabled": True,
     })
 
-    # Create component
     component = load_component(config)
+    asyncio.run(component.component_init())
+    yield component
+    component.close()
+
+
+@pytest.fixture
+def helix_print_component(_session_component, helix_server, temp_gcodes_dir):
+    """Return the shared HelixPrint component with per-test state reset.
+
+    Mock collaborators are replaced and the plugin directories recreated
+    in the freshly emptied G-code directory; component_init() has
+    already run.
+    """
+    component = _session_component
+    component.active_prints.clear()
+    component._thumb_index = None
+    component._use_sqlite = True
+    component._use_namespace = False
+
+    for name, mock in (
+        ("database", MockDatabase()),
+        ("klippy_connection", MockKlippy()),
+        ("history", MockHistory()),
+    ):
+        helix_server.components[name] = mock
+    component.database = helix_server.components["database"]
+    component.klippy = helix_server.components["klippy_connection"]
+    component.history = helix_server.components["history"]
+
+    for dirname in (component.temp_dir, component.symlink_dir):
+        os.mkdir(os.path.join(temp_gcodes_dir, dirname))
     return component
 
 
@@ -234,6 +370,20 @@ class TestPrintInfo:
         info.job_id = "ABC123"
         assert info.job_id == "ABC123"
 
+    def test_uses_slots(self):
+        """Test PrintInfo has no per-instance __dict__."""
+        info = PrintInfo(
+            original_filename="test.gcode",
+            temp_filename="temp.gcode",
+            symlink_filename="symlink.gcode",
+            modifications=[],
+            start_time=0.0,
+        )
+
+        assert not hasattr(info, "__dict__")
+        with pytest.raises(AttributeError):
+            info.unknown_field = 1
+
 
 # ============================================================================
 # Component Initialization Tests
@@ -283,6 +433,75 @@ class TestHelixPrintInit:
         assert "/server/helix/print_modified" in mock_server.endpoints
         assert "/server/helix/status" in mock_server.endpoints
 
+    @pytest.mark.asyncio
+    async def test_close_releases_gcodes_fd(self, mock_server, temp_gcodes_dir):
+        """Test close() releases the gcodes directory descriptor."""
+        mock_server.components["file_manager"] = MockFileManager(temp_gcodes_dir)
+        component = load_component(MockConfigHelper(mock_server))
+        await component.component_init()
+        fd = component._gc_fd
+        assert fd is not None
+
+        component.close()
+
+        assert component._gc_fd is None
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    @pytest.mark.asyncio
+    async def test_unlink_after_close_stays_in_gcodes(self, mock_server,
+                                                      temp_gcodes_dir, tmp_path,
+                                                      monkeypatch):
+        """Test a late cleanup never resolves names against the CWD."""
+        mock_server.components["file_manager"] = MockFileManager(temp_gcodes_dir)
+        component = load_component(MockConfigHelper(mock_server))
+        await component.component_init()
+        component.close()
+
+        write_files(temp_gcodes_dir, {".helix_temp/mod.gcode": "G28\n"})
+        stray = tmp_path / ".helix_temp" / "mod.gcode"
+        stray.parent.mkdir()
+        stray.write_text("keep\n")
+        monkeypatch.chdir(tmp_path)
+
+        assert component._unlink_if_exists(".helix_temp/mod.gcode") is True
+        assert not (Path(temp_gcodes_dir) / ".helix_temp" / "mod.gcode").exists()
+        assert stray.exists()
+
+    @pytest.mark.asyncio
+    async def test_symlink_after_close_stays_in_gcodes(self, mock_server,
+                                                       temp_gcodes_dir,
+                                                       tmp_path, monkeypatch):
+        """Test a late symlink is created in gcodes, not in the CWD."""
+        mock_server.components["file_manager"] = MockFileManager(temp_gcodes_dir)
+        component = load_component(MockConfigHelper(mock_server))
+        await component.component_init()
+        component.close()
+
+        target = Path(temp_gcodes_dir) / ".helix_temp" / "mod.gcode"
+        write_files(temp_gcodes_dir, {".helix_temp/mod.gcode": "G28\n"})
+        monkeypatch.chdir(tmp_path)
+
+        component._create_symlink_atomic(".helix_print/job.gcode", target)
+
+        link = Path(temp_gcodes_dir) / ".helix_print" / "job.gcode"
+        assert os.readlink(link) == str(target)
+        assert not (tmp_path / ".helix_print").exists()
+
+    @pytest.mark.asyncio
+    async def test_component_init_is_idempotent(self, mock_server,
+                                                temp_gcodes_dir):
+        """Test repeat component_init() calls keep the first initialization."""
+        mock_server.components["file_manager"] = MockFileManager(temp_gcodes_dir)
+        component = load_component(MockConfigHelper(mock_server))
+        await component.component_init()
+        fd = component._gc_fd
+
+        await component.component_init()
+
+        assert component._gc_fd == fd
+        component.close()
+
     def test_event_handlers_registered(self, mock_server):
         """Test event handlers are registered."""
         config = MockConfigHelper(mock_server)
@@ -292,6 +511,216 @@ class TestHelixPrintInit:
         assert "server:klippy_ready" in mock_server.event_handlers
 
 
+# ============================================================================
+# Database Initialization Tests
+# ============================================================================
+
+class TestDatabaseInit:
+    """Tests for SQLite database initialization."""
+
+    @pytest.mark.asyncio
+    async def test_enables_wal_journal(self, helix_print_component, helix_server):
+        """Test WAL journaling is enabled after the table is created."""
+        await helix_print_component._init_database()
+
+        db = helix_server.components["database"]
+        sql = [cmd.strip() for cmd, _ in db.commands]
+        assert helix_print_component._use_sqlite is True
+        assert "PRAGMA journal_mode=WAL" in sql
+        assert "PRAGMA synchronous=NORMAL" in sql
+
+
+# ============================================================================
+# SQLite Persistence Tests
+# ============================================================================
+
+class TestSqlitePersistence:
+    """Tests for print lifecycle persistence against a real SQLite database."""
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_uses_single_row(self, helix_print_component):
+        """Test start and cleanup scheduling update the same row."""
+        db = SqliteDatabase()
+        helix_print_component.database = db
+        await helix_print_component._init_database()
+
+        info = PrintInfo(
+            original_filename="benchy.gcode",
+            temp_filename=".helix_temp/mod_benchy.gcode",
+            symlink_filename=".helix_print/benchy.gcode",
+            modifications=["bed_leveling_disabled"],
+            start_time=1000.0,
+        )
+        await helix_print_component._persist_print_info(info)
+        assert [r["status"] for r in db.rows()] == ["active"]
+
+        await helix_print_component._schedule_cleanup(info)
+
+        rows = db.rows()
+        assert len(rows) == 1
+        assert rows[0]["status"] == "pending_cleanup"
+        assert rows[0]["cleanup_scheduled_at"] is not None
+        assert rows[0]["created_at"] == info.start_time
+        assert json.loads(rows[0]["modifications"]) == ["bed_leveling_disabled"]
+
+    @pytest.mark.asyncio
+    async def test_init_dedupes_legacy_rows(self, helix_print_component):
+        """Test duplicate rows from older tables are removed before indexing."""
+        db = SqliteDatabase()
+        db.conn.execute(
+            """
+            CREATE TABLE helix_temp_files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                original_filename TEXT NOT NULL,
+                temp_filename TEXT NOT NULL,
+                symlink_filename TEXT NOT NULL,
+                modifications TEXT,
+                job_id TEXT,
+                created_at REAL NOT NULL,
+                cleanup_scheduled_at REAL,
+                status TEXT DEFAULT 'active'
+            )
+            """
+        )
+        for status in ("active", "cleaned"):
+            db.conn.execute(
+                "INSERT INTO helix_temp_files (original_filename, temp_filename,"
+                " symlink_filename, created_at, status) VALUES (?, ?, ?, ?, ?)",
+                ("a.gcode", ".helix_temp/a.gcode", ".helix_print/a.gcode", 1.0,
+                 status),
+            )
+        helix_print_component.database = db
+
+        await helix_print_component._init_database()
+
+        assert helix_print_component._use_sqlite is True
+        assert [r["status"] for r in db.rows()] == ["cleaned"]
+
+    @pytest.mark.asyncio
+    async def test_dedupe_runs_only_before_index_exists(self,
+                                                        helix_print_component):
+        """Test restarts skip the dedupe DELETE once the index is in place."""
+        db = SqliteDatabase()
+        helix_print_component.database = db
+        await helix_print_component._init_database()
+
+        execute = db.execute_db_command
+        issued = []
+
+        async def recording(sql, params=()):
+            issued.append(sql.strip().upper())
+            return await execute(sql, params)
+
+        with patch.object(db, "execute_db_command", recording):
+            await helix_print_component._init_database()
+
+        assert helix_print_component._use_sqlite is True
+        assert not [sql for sql in issued if sql.startswith("DELETE")]
+
+    @pytest.mark.asyncio
+    async def test_migration_failure_keeps_sqlite(self, helix_print_component):
+        """Test a failing migration statement does not switch backends."""
+        db = SqliteDatabase()
+        helix_print_component.database = db
+        helix_print_component._use_sqlite = False
+        execute = db.execute_db_command
+
+        async def failing_dedupe(sql, params=()):
+            if sql.strip().upper().startswith("DELETE"):
+                raise sqlite3.OperationalError("database is locked")
+            return await execute(sql, params)
+
+        with patch.object(db, "execute_db_command", failing_dedupe):
+            await helix_print_component._init_database()
+
+        assert helix_print_component._use_sqlite is True
+        assert helix_print_component._use_namespace is False
+
+    @pytest.mark.asyncio
+    async def test_startup_cleanup_reads_cursor_rows(self, helix_print_component,
+                                                     temp_gcodes_dir):
+        """Test pending rows are fetched from Moonraker's cursor proxy."""
+        db = SqliteDatabase()
+        helix_print_component.database = db
+        await helix_print_component._init_database()
+        write_files(temp_gcodes_dir, {".helix_temp/a.gcode": "G28\n"})
+        db.conn.execute(
+            "INSERT INTO helix_temp_files (original_filename, temp_filename,"
+            " symlink_filename, created_at, cleanup_scheduled_at, status)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            ("a.gcode", ".helix_temp/a.gcode", ".helix_print/a.gcode",
+             time.time(), 1.0, "pending_cleanup"),
+        )
+
+        await helix_print_component._startup_cleanup()
+
+        assert not (Path(temp_gcodes_dir) / ".helix_temp" / "a.gcode").exists()
+        assert [r["status"] for r in db.rows()] == ["cleaned"]
+
+
+# ============================================================================
+# Startup Cleanup Tests
+# ============================================================================
+
+class TestStartupCleanup:
+    """Tests for cleanup of stale temp files on startup."""
+
+    @pytest.mark.asyncio
+    async def test_batches_status_updates(self, helix_print_component, helix_server,
+                                          temp_gcodes_dir):
+        """Test stale rows are marked cleaned with a single UPDATE."""
+        db = helix_server.components["database"]
+        temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
+        for name in ("a.gcode", "b.gcode"):
+            (temp_dir / name).write_text("G28\n")
+            db.select_rows.append({
+                "temp_filename": f".helix_temp/{name}",
+                "symlink_filename": f".helix_print/{name}",
+            })
+
+        await helix_print_component._startup_cleanup()
+
+        assert not (temp_dir / "a.gcode").exists()
+        assert not (temp_dir / "b.gcode").exists()
+        updates = [
+            params for sql, params in db.commands
+            if sql.strip().upper().startswith("UPDATE")
+        ]
+        assert updates == [
+            ("cleaned", ".helix_temp/a.gcode", ".helix_temp/b.gcode")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_row_does_not_block_others(self, helix_print_component,
+                                                    helix_server, temp_gcodes_dir):
+        """Test a row whose cleanup raises is retried later, others are marked."""
+        db = helix_server.components["database"]
+        temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
+        for name in ("a.gcode", "b.gcode"):
+            (temp_dir / name).write_text("G28\n")
+            db.select_rows.append({
+                "temp_filename": f".helix_temp/{name}",
+                "symlink_filename": f".helix_print/{name}",
+            })
+
+        original = helix_print_component._remove_print_files
+
+        def fail_on_a(temp_filename, symlink_filename):
+            if temp_filename.endswith("a.gcode"):
+                raise PermissionError("denied")
+            original(temp_filename, symlink_filename)
+
+        with patch.object(helix_print_component, "_remove_print_files", fail_on_a):
+            await helix_print_component._startup_cleanup()
+
+        assert not (temp_dir / "b.gcode").exists()
+        updates = [
+            params for sql, params in db.commands
+            if sql.strip().upper().startswith("UPDATE")
+        ]
+        assert updates == [("cleaned", ".helix_temp/b.gcode")]
+
+
 # ============================================================================
 # Status API Tests
 # ============================================================================
@@ -300,12 +729,9 @@ class TestStatusAPI:
     """Tests for the /server/helix/status endpoint."""
 
     @pytest.mark.asyncio
-    async def test_status_returns_config(self, helix_print_component, mock_server):
+    async def test_status_returns_config(self, helix_print_component, helix_server):
         """Test status endpoint returns configuration."""
-        handler = mock_server.endpoints["/server/helix/status"]
-        request = MockWebRequest({})
-
-        result = await handler(request)
+        result = await helix_server.call("/server/helix/status")
 
         assert result["enabled"] is True
         assert result["temp_dir"] == ".helix_temp"
@@ -323,118 +749,89 @@ class TestPrintModifiedAPI:
     """Tests for the /server/helix/print_modified endpoint (path-based API)."""
 
     @pytest.mark.asyncio
-    async def test_rejects_missing_original(self, helix_print_component, mock_server,
+    async def test_rejects_missing_original(self, helix_print_component, helix_server,
                                             temp_gcodes_dir):
         """Test API rejects request when original file doesn't exist."""
-        # Initialize component
-        await helix_print_component.component_init()
-
         # Create temp file (simulating client upload)
         temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
         temp_dir.mkdir(parents=True, exist_ok=True)
         temp_file = temp_dir / "mod_benchy.gcode"
         temp_file.write_text("G28\n")
 
-        handler = mock_server.endpoints["/server/helix/print_modified"]
-        request = MockWebRequest({
-            "original_filename": "nonexistent.gcode",
-            "temp_file_path": ".helix_temp/mod_benchy.gcode",
-            "modifications": [],
-        })
-
         with pytest.raises(Exception) as exc_info:
-            await handler(request)
+            await helix_server.call(
+                "/server/helix/print_modified",
+                original_filename="nonexistent.gcode",
+                temp_file_path=".helix_temp/mod_benchy.gcode",
+                modifications=[],
+            )
 
         assert "not found" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    async def test_uses_uploaded_temp_file(self, helix_print_component, mock_server,
+    async def test_uses_uploaded_temp_file(self, helix_print_component, helix_server,
                                            temp_gcodes_dir):
         """Test API uses the pre-uploaded temp file."""
-        # Create original file
-        original = Path(temp_gcodes_dir) / "benchy.gcode"
-        original.write_text("G28\nBED_MESH_CALIBRATE\nG1 X0 Y0\n")
-
-        # Create temp file with modified content (simulating client upload)
-        temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = temp_dir / "mod_benchy.gcode"
-        temp_file.write_text("G28\n; BED_MESH_CALIBRATE disabled\nG1 X0 Y0\n")
-
-        # Initialize component
-        await helix_print_component.component_init()
-
-        handler = mock_server.endpoints["/server/helix/print_modified"]
-        request = MockWebRequest({
-            "original_filename": "benchy.gcode",
-            "temp_file_path": ".helix_temp/mod_benchy.gcode",
-            "modifications": ["bed_leveling_disabled"],
+        # Create original file and temp file (simulating client upload)
+        write_files(temp_gcodes_dir, {
+            "benchy.gcode": "G28\nBED_MESH_CALIBRATE\nG1 X0 Y0\n",
+            ".helix_temp/mod_benchy.gcode":
+                "G28\n; BED_MESH_CALIBRATE disabled\nG1 X0 Y0\n",
         })
 
-        result = await handler(request)
+        result = await helix_server.call(
+            "/server/helix/print_modified",
+            original_filename="benchy.gcode",
+            temp_file_path=".helix_temp/mod_benchy.gcode",
+            modifications=["bed_leveling_disabled"],
+        )
 
         assert result["original_filename"] == "benchy.gcode"
         assert result["status"] == "printing"
         assert result["temp_filename"] == ".helix_temp/mod_benchy.gcode"
 
     @pytest.mark.asyncio
-    async def test_creates_symlink(self, helix_print_component, mock_server,
+    async def test_creates_symlink(self, helix_print_component, helix_server,
                                    temp_gcodes_dir):
         """Test API creates symlink to temp file."""
-        # Create original file
-        original = Path(temp_gcodes_dir) / "benchy.gcode"
-        original.write_text("G28\n")
-
-        # Create temp file (simulating client upload)
-        temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = temp_dir / "mod_benchy.gcode"
-        temp_file.write_text("G28\n")
-
-        # Initialize component
-        await helix_print_component.component_init()
-
-        handler = mock_server.endpoints["/server/helix/print_modified"]
-        request = MockWebRequest({
-            "original_filename": "benchy.gcode",
-            "temp_file_path": ".helix_temp/mod_benchy.gcode",
-            "modifications": [],
+        # Create original file and temp file (simulating client upload)
+        write_files(temp_gcodes_dir, {
+            "benchy.gcode": "G28\n",
+            ".helix_temp/mod_benchy.gcode": "G28\n",
         })
 
-        result = await handler(request)
+        result = await helix_server.call(
+            "/server/helix/print_modified",
+            original_filename="benchy.gcode",
+            temp_file_path=".helix_temp/mod_benchy.gcode",
+            modifications=[],
+        )
 
-        # Verify symlink was created
+        # Verify symlink exists once the print has been dispatched
+        klippy = helix_server.components["klippy_connection"]
+        assert len(klippy.commands_sent) == 1
         symlink_path = Path(temp_gcodes_dir) / result["print_filename"]
         assert symlink_path.is_symlink()
 
     @pytest.mark.asyncio
-    async def test_starts_print_with_symlink(self, helix_print_component, mock_server,
+    async def test_starts_print_with_symlink(self, helix_print_component, helix_server,
                                              temp_gcodes_dir):
         """Test API starts print using symlink path."""
-        # Create original file
-        original = Path(temp_gcodes_dir) / "benchy.gcode"
-        original.write_text("G28\n")
-
-        # Create temp file (simulating client upload)
-        temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = temp_dir / "mod_benchy.gcode"
-        temp_file.write_text("G28\n")
-
-        # Initialize component
-        await helix_print_component.component_init()
-
-        handler = mock_server.endpoints["/server/helix/print_modified"]
-        request = MockWebRequest({
-            "original_filename": "benchy.gcode",
-            "temp_file_path": ".helix_temp/mod_benchy.gcode",
-            "modifications": [],
+        # Create original file and temp file (simulating client upload)
+        write_files(temp_gcodes_dir, {
+            "benchy.gcode": "G28\n",
+            ".helix_temp/mod_benchy.gcode": "G28\n",
         })
 
-        await handler(request)
+        await helix_server.call(
+            "/server/helix/print_modified",
+            original_filename="benchy.gcode",
+            temp_file_path=".helix_temp/mod_benchy.gcode",
+            modifications=[],
+        )
 
         # Verify print command was sent
-        klippy = mock_server.components["klippy_connection"]
+        klippy = helix_server.components["klippy_connection"]
         assert len(klippy.commands_sent) == 1
         assert ".helix_print/benchy.gcode" in klippy.commands_sent[0]
 
@@ -453,16 +850,78 @@ class TestPrintModifiedAPI:
         temp_file = temp_dir / "mod_test.gcode"
         temp_file.write_text("G28\n")
 
-        handler = mock_server.endpoints["/server/helix/print_modified"]
-        request = MockWebRequest({
-            "original_filename": "test.gcode",
-            "temp_file_path": ".helix_temp/mod_test.gcode",
+        with pytest.raises(Exception) as exc_info:
+            await mock_server.call(
+                "/server/helix/print_modified",
+                original_filename="test.gcode",
+                temp_file_path=".helix_temp/mod_test.gcode",
+            )
+
+        assert "disabled" in str(exc_info.value).lower()
+
+    @pytest.mark.asyncio
+    async def test_print_start_failure_rolls_back(self, helix_print_component,
+                                                  helix_server, temp_gcodes_dir):
+        """Test temp file and symlink are removed if the print fails to start."""
+        original = Path(temp_gcodes_dir) / "benchy.gcode"
+        original.write_text("G28\n")
+
+        temp_file = Path(temp_gcodes_dir) / ".helix_temp" / "mod_benchy.gcode"
+        temp_file.write_text("G28\n")
+
+        klippy = helix_server.components["klippy_connection"]
+        klippy.run_gcode = AsyncMock(side_effect=Exception("klippy down"))
+
+        with pytest.raises(Exception) as exc_info:
+            await helix_server.call(
+                "/server/helix/print_modified",
+                original_filename="benchy.gcode",
+                temp_file_path=".helix_temp/mod_benchy.gcode",
+                modifications=[],
+            )
+
+        assert "failed to start print" in str(exc_info.value).lower()
+        assert not temp_file.exists()
+        symlink = Path(temp_gcodes_dir) / ".helix_print" / "benchy.gcode"
+        assert not symlink.is_symlink()
+        assert helix_print_component.active_prints == {}
+
+    @pytest.mark.asyncio
+    async def test_symlink_failure_leaves_no_db_row(self, helix_print_component,
+                                                    helix_server, temp_gcodes_dir):
+        """Test a failed symlink rolls back without persisting an active row."""
+        write_files(temp_gcodes_dir, {
+            "benchy.gcode": "G28\n",
+            ".helix_temp/mod_benchy.gcode": "G28\n",
         })
 
+        with patch.object(helix_print_component, "_create_symlink_atomic",
+                          side_effect=OSError("read-only")):
+            with pytest.raises(Exception) as exc_info:
+                await helix_server.call(
+                    "/server/helix/print_modified",
+                    original_filename="benchy.gcode",
+                    temp_file_path=".helix_temp/mod_benchy.gcode",
+                    modifications=[],
+                )
+
+        assert "failed to create symlink" in str(exc_info.value).lower()
+        db = helix_server.components["database"]
+        assert not [sql for sql, _ in db.commands if "INSERT" in sql.upper()]
+        assert helix_print_component.active_prints == {}
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_string_filename(self, helix_print_component,
+                                               helix_server):
+        """Test a non-string original_filename is rejected, not coerced."""
         with pytest.raises(Exception) as exc_info:
-            await handler(request)
+            await helix_server.call(
+                "/server/helix/print_modified",
+                original_filename=123,
+                temp_file_path=".helix_temp/mod_benchy.gcode",
+            )
 
-        assert "disabled" in str(exc_info.value).lower()
+        assert "original_filename" in str(exc_info.value)
 
 
 # ============================================================================
@@ -473,18 +932,14 @@ class TestSymlinkConflicts:
     """Tests for symlink conflict handling."""
 
     @pytest.mark.asyncio
-    async def test_replaces_existing_symlink(self, helix_print_component, mock_server,
+    async def test_replaces_existing_symlink(self, helix_print_component, helix_server,
                                              temp_gcodes_dir):
         """Test that existing symlinks are replaced."""
-        # Create original file
-        original = Path(temp_gcodes_dir) / "benchy.gcode"
-        original.write_text("G28\n")
-
-        # Create temp file (simulating client upload)
-        temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = temp_dir / "mod_benchy.gcode"
-        temp_file.write_text("G28\n")
+        # Create original file and temp file (simulating client upload)
+        write_files(temp_gcodes_dir, {
+            "benchy.gcode": "G28\n",
+            ".helix_temp/mod_benchy.gcode": "G28\n",
+        })
 
         # Create existing symlink
         symlink_dir = Path(temp_gcodes_dir) / ".helix_print"
@@ -492,19 +947,147 @@ class TestSymlinkConflicts:
         existing_symlink = symlink_dir / "benchy.gcode"
         existing_symlink.symlink_to("/nonexistent")
 
-        # Initialize component
-        await helix_print_component.component_init()
-
-        handler = mock_server.endpoints["/server/helix/print_modified"]
-        request = MockWebRequest({
-            "original_filename": "benchy.gcode",
-            "temp_file_path": ".helix_temp/mod_benchy.gcode",
-            "modifications": [],
-        })
-
         # Should succeed, replacing the existing symlink
-        result = await handler(request)
+        result = await helix_server.call(
+            "/server/helix/print_modified",
+            original_filename="benchy.gcode",
+            temp_file_path=".helix_temp/mod_benchy.gcode",
+            modifications=[],
+        )
         assert result["status"] == "printing"
+        assert os.readlink(existing_symlink) != "/nonexistent"
+        assert sorted(p.name for p in symlink_dir.iterdir()) == ["benchy.gcode"]
+
+    @pytest.mark.asyncio
+    async def test_recreates_missing_symlink_dir(self, helix_print_component,
+                                                 helix_server, temp_gcodes_dir):
+        """Test the symlink directory is recreated if removed after startup."""
+        original = Path(temp_gcodes_dir) / "benchy.gcode"
+        original.write_text("G28\n")
+
+        temp_file = Path(temp_gcodes_dir) / ".helix_temp" / "mod_benchy.gcode"
+        temp_file.write_text("G28\n")
+        (Path(temp_gcodes_dir) / ".helix_print").rmdir()
+
+        result = await helix_server.call(
+            "/server/helix/print_modified",
+            original_filename="benchy.gcode",
+            temp_file_path=".helix_temp/mod_benchy.gcode",
+            modifications=[],
+        )
+        assert (Path(temp_gcodes_dir) / result["print_filename"]).is_symlink()
+
+    @pytest.mark.asyncio
+    async def test_rejects_symlinked_original(self, helix_print_component,
+                                              helix_server, temp_gcodes_dir):
+        """Test that a symlinked original file is rejected."""
+        real = Path(temp_gcodes_dir) / "real.gcode"
+        real.write_text("G28\n")
+        (Path(temp_gcodes_dir) / "benchy.gcode").symlink_to(real)
+
+        temp_file = Path(temp_gcodes_dir) / ".helix_temp" / "mod_benchy.gcode"
+        temp_file.write_text("G28\n")
+
+        with pytest.raises(Exception) as exc_info:
+            await helix_server.call(
+                "/server/helix/print_modified",
+                original_filename="benchy.gcode",
+                temp_file_path=".helix_temp/mod_benchy.gcode",
+                modifications=[],
+            )
+
+        assert "symlink" in str(exc_info.value).lower()
+
+
+# ============================================================================
+# Thumbnail Metadata Tests
+# ============================================================================
+
+class TestThumbnailMetadata:
+    """Tests for thumbnail symlink creation and cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_links_and_removes_thumbnails(self, helix_print_component,
+                                                temp_gcodes_dir):
+        """Test thumbnails are linked for the temp file and later removed."""
+        thumbs = Path(temp_gcodes_dir) / ".thumbs"
+        thumbs.mkdir()
+        (thumbs / "benchy-32x32.png").write_bytes(b"png")
+        (thumbs / "benchy-300x300.png").write_bytes(b"png")
+        (thumbs / "other-32x32.png").write_bytes(b"png")
+
+        await helix_print_component._copy_metadata(
+            Path(temp_gcodes_dir) / "benchy.gcode",
+            Path(temp_gcodes_dir) / ".helix_temp" / "mod_benchy.gcode",
+        )
+
+        assert (thumbs / "mod_benchy-32x32.png").is_symlink()
+        assert (thumbs / "mod_benchy-300x300.png").is_symlink()
+        assert not (thumbs / "mod_other-32x32.png").exists()
+
+        await helix_print_component._cleanup_thumbnail_symlinks(
+            ".helix_temp/mod_benchy.gcode"
+        )
+
+        assert not (thumbs / "mod_benchy-32x32.png").exists()
+        assert not (thumbs / "mod_benchy-300x300.png").exists()
+        assert (thumbs / "benchy-32x32.png").exists()
+
+    @pytest.mark.asyncio
+    async def test_index_matches_exact_stem(self, helix_print_component,
+                                            temp_gcodes_dir):
+        """Test thumbnails of files sharing a name prefix are not linked."""
+        thumbs = Path(temp_gcodes_dir) / ".thumbs"
+        thumbs.mkdir()
+        (thumbs / "my-part-32x32.png").write_bytes(b"png")
+        (thumbs / "my-part-v2-32x32.png").write_bytes(b"png")
+
+        await helix_print_component._copy_metadata(
+            Path(temp_gcodes_dir) / "my-part.gcode",
+            Path(temp_gcodes_dir) / ".helix_temp" / "mod.gcode",
+        )
+
+        assert (thumbs / "mod-32x32.png").is_symlink()
+        assert not (thumbs / "mod-v2-32x32.png").exists()
+
+    def test_index_reset_during_linking(self, helix_print_component,
+                                        temp_gcodes_dir):
+        """Test the loop dropping the index mid-link does not fail the link."""
+        thumbs = Path(temp_gcodes_dir) / ".thumbs"
+        thumbs.mkdir()
+        (thumbs / "benchy-32x32.png").write_bytes(b"png")
+        (thumbs / "benchy-300x300.png").write_bytes(b"png")
+
+        component = helix_print_component
+        original_symlink_to = Path.symlink_to
+
+        def symlink_then_reset(path, target):
+            original_symlink_to(path, target)
+            component._thumb_index = None  # _on_filelist_changed on the loop
+
+        with patch.object(Path, "symlink_to", symlink_then_reset), \
+                patch("helix_print.logging.warning") as warning:
+            component._link_thumbnails("benchy", "mod_benchy")
+
+        warning.assert_not_called()
+        assert (thumbs / "mod_benchy-32x32.png").is_symlink()
+        assert (thumbs / "mod_benchy-300x300.png").is_symlink()
+
+    @pytest.mark.asyncio
+    async def test_index_picks_up_new_thumbnails(self, helix_print_component,
+                                                 temp_gcodes_dir):
+        """Test thumbnails created after the index was built are found."""
+        thumbs = Path(temp_gcodes_dir) / ".thumbs"
+        thumbs.mkdir()
+        helix_print_component._get_thumb_index()
+        (thumbs / "benchy-32x32.png").write_bytes(b"png")
+
+        await helix_print_component._copy_metadata(
+            Path(temp_gcodes_dir) / "benchy.gcode",
+            Path(temp_gcodes_dir) / ".helix_temp" / "mod_benchy.gcode",
+        )
+
+        assert (thumbs / "mod_benchy-32x32.png").is_symlink()
 
 
 # ============================================================================
@@ -515,30 +1098,21 @@ class TestActivePrintTracking:
     """Tests for active print tracking."""
 
     @pytest.mark.asyncio
-    async def test_tracks_active_print(self, helix_print_component, mock_server,
+    async def test_tracks_active_print(self, helix_print_component, helix_server,
                                        temp_gcodes_dir):
         """Test that active prints are tracked."""
-        # Create original file
-        original = Path(temp_gcodes_dir) / "benchy.gcode"
-        original.write_text("G28\n")
-
-        # Create temp file (simulating client upload)
-        temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = temp_dir / "mod_benchy.gcode"
-        temp_file.write_text("G28\n")
-
-        # Initialize component
-        await helix_print_component.component_init()
-
-        handler = mock_server.endpoints["/server/helix/print_modified"]
-        request = MockWebRequest({
-            "original_filename": "benchy.gcode",
-            "temp_file_path": ".helix_temp/mod_benchy.gcode",
-            "modifications": ["test_mod"],
+        # Create original file and temp file (simulating client upload)
+        write_files(temp_gcodes_dir, {
+            "benchy.gcode": "G28\n",
+            ".helix_temp/mod_benchy.gcode": "G28\n",
         })
 
-        result = await handler(request)
+        result = await helix_server.call(
+            "/server/helix/print_modified",
+            original_filename="benchy.gcode",
+            temp_file_path=".helix_temp/mod_benchy.gcode",
+            modifications=["test_mod"],
+        )
 
         # Check active prints
         assert len(helix_print_component.active_prints) == 1
@@ -555,32 +1129,21 @@ class TestPathValidation:
     """Tests for path validation and security."""
 
     @pytest.mark.asyncio
-    async def test_handles_subdirectory_path(self, helix_print_component, mock_server,
+    async def test_handles_subdirectory_path(self, helix_print_component, helix_server,
                                              temp_gcodes_dir):
         """Test handling of files in subdirectories."""
-        # Create subdirectory and file
-        subdir = Path(temp_gcodes_dir) / "prints" / "2024"
-        subdir.mkdir(parents=True, exist_ok=True)
-        original = subdir / "benchy.gcode"
-        original.write_text("G28\n")
-
-        # Create temp file (simulating client upload)
-        temp_dir = Path(temp_gcodes_dir) / ".helix_temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = temp_dir / "mod_benchy.gcode"
-        temp_file.write_text("G28\n")
-
-        # Initialize component
-        await helix_print_component.component_init()
-
-        handler = mock_server.endpoints["/server/helix/print_modified"]
-        request = MockWebRequest({
-            "original_filename": "prints/2024/benchy.gcode",
-            "temp_file_path": ".helix_temp/mod_benchy.gcode",
-            "modifications": [],
+        # Create original file and temp file (simulating client upload)
+        write_files(temp_gcodes_dir, {
+            "prints/2024/benchy.gcode": "G28\n",
+            ".helix_temp/mod_benchy.gcode": "G28\n",
         })
 
-        result = await handler(request)
+        result = await helix_server.call(
+            "/server/helix/print_modified",
+            original_filename="prints/2024/benchy.gcode",
+            temp_file_path=".helix_temp/mod_benchy.gcode",
+            modifications=[],
+        )
         assert result["status"] == "printing"
 
 
@@ -826,10 +1389,7 @@ class TestPhaseTrackingEndpoints:
         # Initialize component to set up klippy reference
         await helix_with_klippy.component_init()
 
-        handler = mock_server.endpoints["/server/helix/phase_tracking/status"]
-        request = MockWebRequest({})
-
-        result = await handler(request)
+        result = await mock_server.call("/server/helix/phase_tracking/status")
 
         # Should report not enabled (klippy mock doesn't provide macros)
         assert result["enabled"] is False
@@ -6,19 +6,37 @@
 """
 Download printer images using headless browser
 This bypasses anti-hotlinking by actually rendering the page
+
+With playwright installed (pip install playwright), a single browser
+process renders every page; otherwise a browser is launched per image.
 """
 
+import asyncio
+import json
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
+import urllib.request
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
 
 # Target dimensions (matching existing images)
 TARGET_WIDTH = 750
 TARGET_HEIGHT = 930
 
+# Concurrent headless browser instances (each is its own process)
+MAX_PARALLEL_DOWNLOADS = 4
+
 # Image URLs and filenames (from user-provided Brave search results)
-PRINTER_IMAGES = [
+PRINTER_IMAGES = (
     # Voron family
     ("https://imgs.search.brave.com/P0wo4bnoXhVOuj0LOqgPcRjb52LdyeCBEMws2DqfZeY/rs:fit:860:0:0:0/g:ce/aHR0cHM6Ly92b3Jv/bmRlc2lnbi5jb20v/d3AtY29udGVudC91/cGxvYWRzLzIwMjEv/MDMvdm9yb24xLWhl/cm8tMS5qcGc", "voron-v1-legacy.png"),
     ("https://imgs.search.brave.com/Tc0CST0yBnIoD9QbunxHx-HICeUT4k7LEbkKjCcCwQc/rs:fit:860:0:0:0/g:ce/aHR0cHM6Ly92b3Jv/bmRlc2lnbi5jb20v/d3AtY29udGVudC91/cGxvYWRzLzIwMjEv/MDMvc3cxLmpwZw", "voron-switchwire.png"),
@@ -36,7 +54,7 @@ PRINTER_IMAGES = [
     ("https://imgs.search.brave.com/dK4KwZ-0lOD_Z0bDVEDfmmSljG9FY1eSl24tQ2aloh0/rs:fit:860:0:0:0/g:ce/aHR0cHM6Ly9jZG4u/bXlzaG9wLmNvbS90/aHVtYi81MTJ4NTEy/L2Fzc2V0cy9tZWRp/YS9pbWFnZS8wZi9k/Yy9kZTUyNTJkMmNl/NmJfUHJ1c2EtTUs0/LWZyb250LmpwZw", "prusa-mk4.png"),
     ("https://imgs.search.brave.com/IM4fpxRn6QVrHeZ2ETT1_0EwjVOwAjd0hd_jUPpp1Wo/rs:fit:500:0:0:0/g:ce/aHR0cHM6Ly93d3cu/Y29tcHV0ZXJhY3Rp/dmUuY28udWsvaW1h/Z2VzL3Byb2R1Y3Rz/L2xhcmdlL1BSVVNB/LU1JTkktMDA5LTEu/anBn", "prusa-mini.png"),
     ("https://imgs.search.brave.com/lAQvhainG_oDHsEhPtRmfMkX2FGbaE3XyJ0jY5TTNH4/rs:fit:860:0:0:0/g:ce/aHR0cHM6Ly9jZG4u/bXlzaG9wLmNvbS90/aHVtYi81MTJ4NTEy/L2Fzc2V0cy9tZWRp/YS9pbWFnZS82Mi8w/Ny84MTI4MzM5YjU4/NjNfUHJ1c2EteGwu/anBn", "prusa-xl.png"),
-]
+)
 
 def check_browser():
     """Check for Brave, Chrome, or Chromium"""
@@ -50,13 +68,10 @@ def check_browser():
         if Path(browser).exists():
             return browser
 
-    # Try command-line versions
+    # Try command-line versions (PATH lookup in-process, no `which` fork)
     for cmd in ['brave', 'google-chrome', 'chromium']:
-        try:
-            subprocess.run(['which', cmd], check=True, capture_output=True)
+        if shutil.which(cmd):
             return cmd
-        except:
-            continue
 
     return None
 
@@ -64,10 +79,14 @@ def download_with_browser(url, output_path, browser_path):
     """Download image using headless browser screenshot"""
     print(f"Downloading: {output_path.name}")
 
+    # Separate profile per instance so parallel browsers don't contend
+    # for the same profile lock
+    profile_dir = tempfile.mkdtemp(prefix="printer_images_profile_")
     cmd = [
         browser_path,
         '--headless',
         '--disable-gpu',
+        '--user-data-dir=' + profile_dir,
         '--screenshot=' + str(output_path),
         '--window-size=1920,1080',
         '--default-background-color=0',
@@ -89,73 +108,191 @@ def download_with_browser(url, output_path, browser_path):
     except Exception as e:
         print(f"  ERROR: {e}")
         return False
+    finally:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+async def download_all_with_playwright(items, browser_path):
+    """Screenshot (url, output_path) items as pages of one shared browser
+
+    Returns a list of success flags in the same order as items.
+    """
+    async with async_playwright() as pw:
+        launch_args = {"headless": True}
+        if browser_path:
+            launch_args["executable_path"] = shutil.which(browser_path) or browser_path
+        browser = await pw.chromium.launch(**launch_args)
+        limit = asyncio.Semaphore(MAX_PARALLEL_DOWNLOADS)
+
+        async def fetch(url, output_path):
+            async with limit:
+                print(f"Downloading: {output_path.name}")
+                page = await browser.new_page(viewport={"width": 1920, "height": 1080})
+                try:
+                    await page.goto(url, wait_until="networkidle", timeout=15000)
+                    await page.screenshot(path=str(output_path), omit_background=True)
+                except Exception as e:
+                    print(f"  ERROR: {output_path.name}: {e}")
+                    return False
+                finally:
+                    await page.close()
+            return output_path.exists() and output_path.stat().st_size > 0
 
-def resize_image(input_path, output_path):
-    """Resize image using ImageMagick to target dimensions"""
-    print(f"Resizing: {input_path.name} -> {output_path.name}")
+        try:
+            return await asyncio.gather(*(fetch(url, path) for url, path in items))
+        finally:
+            await browser.close()
+
+def fetch_validators(url):
+    """HEAD the URL and return its (ETag, Last-Modified), or None on failure"""
     try:
-        cmd = [
-            "magick", str(input_path),
-            "-resize", f"{TARGET_WIDTH}x{TARGET_HEIGHT}",
-            "-gravity", "center",
-            "-extent", f"{TARGET_WIDTH}x{TARGET_HEIGHT}",
-            "-background", "white",
-            str(output_path)
-        ]
-        subprocess.run(cmd, check=True, capture_output=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"  ERROR resizing: {e.stderr.decode()}")
-        return False
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=10) as response:
+            validators = [response.headers.get("ETag"),
+                          response.headers.get("Last-Modified")]
+    except Exception:
+        return None
+    return validators if any(validators) else None
+
+def load_validator_cache(cache_file):
+    """Load {filename: [etag, last_modified]} recorded by a previous run"""
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def resize_images(input_paths, output_dir):
+    """Resize images into output_dir with a single ImageMagick mogrify run
+
+    Output files keep the input basenames. Returns the set of paths that
+    were written successfully.
+    """
+    print(f"Resizing {len(input_paths)} image(s) -> {output_dir}")
+    cmd = [
+        "magick", "mogrify",
+        "-path", str(output_dir),
+        "-format", "png",
+        "-resize", f"{TARGET_WIDTH}x{TARGET_HEIGHT}",
+        "-gravity", "center",
+        "-extent", f"{TARGET_WIDTH}x{TARGET_HEIGHT}",
+        "-background", "white",
+        *map(str, input_paths)
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        print(f"  ERROR resizing: {result.stderr.decode()}")
+
+    # mogrify keeps going past bad inputs, so check each output
+    return {p for p in input_paths
+            if (output_dir / p.with_suffix(".png").name).exists()}
 
 def main():
-    # Check for browser
+    if not shutil.which("magick"):
+        print("ERROR: ImageMagick not found. Install it first.")
+        print("On macOS: brew install imagemagick")
+        sys.exit(1)
+
+    # Check for browser (playwright can fall back to its bundled Chromium)
     browser_path = check_browser()
-    if not browser_path:
+    if not browser_path and async_playwright is None:
         print("ERROR: No browser found. Install Brave, Chrome, or Chromium.")
         print("On macOS: brew install --cask brave-browser")
         sys.exit(1)
 
-    print(f"Using browser: {browser_path}\n")
+    print(f"Using browser: {browser_path or 'playwright chromium'}\n")
 
     # Create output directory
     output_dir = Path("assets/images/printers")
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Screenshots are kept here between runs, alongside the HTTP validators
+    # of the upstream image they were rendered from
     temp_dir = Path("/tmp/printer_images_browser")
     temp_dir.mkdir(exist_ok=True)
+    cache_file = temp_dir / ".cache.json"
+    validator_cache = load_validator_cache(cache_file)
 
     success_count = 0
     failed = []
 
-    for url, filename in PRINTER_IMAGES:
-        temp_file = temp_dir / f"temp_{filename}"
-        final_file = output_dir / filename
+    # One directory scan instead of a stat per image
+    with os.scandir(output_dir) as entries:
+        existing = {entry.name for entry in entries}
 
+    todo = []
+    for url, filename in PRINTER_IMAGES:
         # Skip if already exists
-        if final_file.exists():
+        if filename in existing:
             print(f"SKIP: {filename} already exists")
             success_count += 1
             continue
+        todo.append((url, filename))
 
-        # Download with headless browser
-        if not download_with_browser(url, temp_file, browser_path):
-            failed.append(filename)
-            continue
+    # HEAD the missing images, a few at a time; an unchanged upstream with a
+    # cached screenshot only needs resizing, not a fresh browser render
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as pool:
+        validators = dict(zip((f for _, f in todo),
+                              pool.map(fetch_validators, (u for u, _ in todo))))
+    reused = []
+    to_render = []
+    for url, filename in todo:
+        current = validators[filename]
+        if (current is not None and validator_cache.get(filename) == current
+                and (temp_dir / filename).exists()):
+            print(f"CACHED: {filename} unchanged upstream")
+            reused.append(temp_dir / filename)
+        else:
+            (temp_dir / filename).unlink(missing_ok=True)
+            to_render.append((url, filename))
+    todo = to_render
 
-        # Small delay to let file write complete
-        time.sleep(0.5)
+    downloaded = None
+    if async_playwright is not None and todo:
+        # One browser process, several pages at a time. Page errors are
+        # handled per image, so anything raised here means the driver or
+        # browser could not start (e.g. `playwright install` never run)
+        try:
+            downloaded = asyncio.run(download_all_with_playwright(
+                [(url, temp_dir / filename) for url, filename in todo],
+                browser_path))
+        except Exception as e:
+            print(f"WARNING: playwright failed to start ({e}), "
+                  "falling back to browser CLI")
+            if not browser_path:
+                print("ERROR: No browser found. Install Brave, Chrome, or Chromium.")
+                sys.exit(1)
+    if downloaded is None:
+        # Download with headless browsers, several at a time
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as pool:
+            downloaded = list(pool.map(
+                lambda item: download_with_browser(
+                    item[0], temp_dir / item[1], browser_path),
+                todo))
 
-        # Resize
-        if not resize_image(temp_file, final_file):
-            failed.append(filename)
-            temp_file.unlink(missing_ok=True)
-            continue
+        # Small delay to let file writes complete
+        if todo:
+            time.sleep(0.5)
+
+    fetched = reused + [temp_dir / filename
+                        for (url, filename), ok in zip(todo, downloaded) if ok]
+    failed.extend(filename
+                  for (url, filename), ok in zip(todo, downloaded) if not ok)
+
+    for (url, filename), ok in zip(todo, downloaded):
+        if ok and validators[filename] is not None:
+            validator_cache[filename] = validators[filename]
+        else:
+            validator_cache.pop(filename, None)
+    cache_file.write_text(json.dumps(validator_cache, indent=2, sort_keys=True))
+
+    # Resize everything in one ImageMagick process
+    resized = resize_images(fetched, output_dir) if fetched else set()
 
-        # Clean up temp file
-        temp_file.unlink(missing_ok=True)
-        success_count += 1
-        print(f"  ✓ Success: {filename}\n")
+    for temp_file in fetched:
+        if temp_file in resized:
+            success_count += 1
+            print(f"  ✓ Success: {temp_file.name}")
+        else:
+            failed.append(temp_file.name)
 
     print(f"\n{'='*60}")
     print(f"Processed {success_count}/{len(PRINTER_IMAGES)} images successfully")
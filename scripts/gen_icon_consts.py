@@ -15,8 +15,11 @@ The script injects generated content between marker comments in globals.xml:
     <!-- BEGIN GENERATED ICON CONSTS -->
     ...generated content...
     <!-- END GENERATED ICON CONSTS -->
+
+globals.xml is only rewritten when its generated block actually differs.
 """
 
+import codecs
 import re
 import sys
 from pathlib import Path
@@ -29,47 +32,43 @@ GLOBALS_XML = PROJECT_ROOT / "ui_xml" / "globals.xml"
 BEGIN_MARKER = "<!-- BEGIN GENERATED ICON CONSTS -->"
 END_MARKER = "<!-- END GENERATED ICON CONSTS -->"
 
+# Match lines like: {"arrow_down", "\xF3\xB0\x81\x85"},  // comment
+ICON_ENTRY_RE = re.compile(r'\{"([^"]+)",\s*"((?:\\x[0-9A-Fa-f]{2})+)"\}')
+
 
-def parse_codepoints_h(filepath: Path) -> list[tuple[str, bytes]]:
-    """Parse ui_icon_codepoints.h and extract icon name -> UTF-8 bytes mappings.
+def parse_codepoints_h(filepath: Path) -> list[tuple[str, str]]:
+    """Parse ui_icon_codepoints.h and extract icon name -> character mappings.
 
-    Returns list of (name, utf8_bytes) tuples.
+    Returns list of (name, char) tuples, decoded once at parse time.
     """
     content = filepath.read_text()
 
-    # Match lines like: {"arrow_down", "\xF3\xB0\x81\x85"},  // comment
-    pattern = r'\{"([^"]+)",\s*"((?:\\x[0-9A-Fa-f]{2})+)"\}'
-
-    icons = []
-    for match in re.finditer(pattern, content):
-        name = match.group(1)
-        hex_string = match.group(2)
-
-        # Convert \xF3\xB0\x81\x85 to actual bytes
-        utf8_bytes = bytes.fromhex(hex_string.replace("\\x", ""))
-        icons.append((name, utf8_bytes))
-
-    return icons
+    # Convert \xF3\xB0\x81\x85 to bytes in one C-level pass, then decode
+    # UTF-8 to the character
+    escape_decode = codecs.escape_decode
+    return [
+        (name, escape_decode(hex_string)[0].decode("utf-8"))
+        for name, hex_string in ICON_ENTRY_RE.findall(content)
+    ]
 
 
-def generate_xml_entries(icons: list[tuple[str, bytes]], indent: str = "    ") -> str:
+def generate_xml_entries(icons: list[tuple[str, str]], indent: str = "    ") -> str:
     """Generate XML <str> entries for icons.
 
     Format: <str name="icon_NAME" value="UTF8_CHAR"/>
     """
-    lines = []
-    for name, utf8_bytes in icons:
-        # Decode UTF-8 bytes to get the actual Unicode character
-        char = utf8_bytes.decode("utf-8")
-        # Escape for XML (though MDI chars don't need escaping)
-        lines.append(f'{indent}<str name="icon_{name}" value="{char}"/>')
-
-    return "\n".join(lines)
+    # No XML escaping: MDI chars never need it
+    return "\n".join(
+        f'{indent}<str name="icon_{name}" value="{char}"/>' for name, char in icons
+    )
 
 
 def inject_into_globals_xml(globals_path: Path, generated_content: str) -> bool:
     """Inject generated content between marker comments in globals.xml.
 
+    The file is left untouched if the injected block is already current,
+    so mtime-based build steps don't rebuild needlessly.
+
     Returns True if successful, False if markers not found.
     """
     content = globals_path.read_text()
@@ -84,17 +83,14 @@ def inject_into_globals_xml(globals_path: Path, generated_content: str) -> bool:
     # Calculate where content goes (after BEGIN marker, before END marker)
     begin_end = begin_idx + len(BEGIN_MARKER)
 
-    # Build new content
+    # Splice generated content between the markers; the END marker keeps
+    # its standard indentation
     new_content = (
-        content[:begin_end] +
-        "\n" + generated_content + "\n" +
-        content[end_idx:].lstrip()  # Remove leading whitespace before END marker
+        f"{content[:begin_end]}\n{generated_content}\n    {content[end_idx:]}"
     )
 
-    # Ensure proper indentation for END marker
-    new_content = new_content.replace("\n" + END_MARKER, "\n    " + END_MARKER)
-
-    globals_path.write_text(new_content)
+    if new_content != content:
+        globals_path.write_text(new_content)
     return True
 
 
@@ -18,10 +18,8 @@ Usage:
 """
 
 import argparse
-import os
-import subprocess
 import sys
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -30,6 +28,27 @@ except ImportError:
     print("Error: Pillow not found. Run: pip install Pillow", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy not found. Run: pip install numpy", file=sys.stderr)
+    sys.exit(1)
+
+# SciPy is optional - it labels background regions in C; without it the
+# flood fill falls back to pure Python
+try:
+    from scipy import ndimage
+except ImportError:
+    ndimage = None
+
+# LVGLImage.py lives next to this script; importing it once avoids an
+# interpreter start (and PIL/pypng imports) per output image
+try:
+    import LVGLImage
+except ImportError as e:
+    print(f"Error: {e}", file=sys.stderr)
+    sys.exit(1)
+
 
 # Screen size definitions matching regen_images.sh and prerendered_images.cpp
 # Format: (name, width, height, logo_size)
@@ -49,69 +68,35 @@ SOURCE_IMAGES = {
 }
 
 
-def sample_edge_color(img: Image.Image) -> tuple:
+def sample_edge_color(arr: np.ndarray) -> tuple:
     """Sample the canonical background color from image corners.
 
     Uses the median of the four corner pixels for a clean, representative color.
     The source images have slightly noisy edges, so averaging would give a
     color that doesn't match any actual pixel.
     """
-    rgb = img.convert("RGB")
-    w, h = rgb.size
-
-    corners = [
-        rgb.getpixel((0, 0)),
-        rgb.getpixel((w - 1, 0)),
-        rgb.getpixel((0, h - 1)),
-        rgb.getpixel((w - 1, h - 1)),
-    ]
-
-    r = sorted(c[0] for c in corners)[1]  # Median of 4 = avg of middle 2, take lower
-    g = sorted(c[1] for c in corners)[1]
-    b = sorted(c[2] for c in corners)[1]
+    corners = arr[[0, 0, -1, -1], [0, -1, 0, -1], :3]
 
-    return (r, g, b)
+    # Median of 4 = avg of middle 2, take lower
+    return tuple(int(c) for c in np.sort(corners, axis=0)[1])
 
 
-def find_content_bounds(img: Image.Image, bg_color: tuple, tolerance: int = 20) -> tuple:
+def find_content_bounds(arr: np.ndarray, bg_color: tuple, tolerance: int = 20) -> tuple:
     """Find the vertical bounds of non-background content in the image.
 
     Returns (top_y, bottom_y) of the first and last rows containing
     pixels that differ from the background color.
     """
-    rgb = img.convert("RGB")
-    w, h = rgb.size
-    bg_r, bg_g, bg_b = bg_color[:3]
+    # Sample every 4th pixel of each row, as a whole-array comparison
+    sampled = arr[:, ::4, :3].astype(np.int16)
+    bg = np.array(bg_color[:3], dtype=np.int16)
+    row_has_content = (np.abs(sampled - bg).max(axis=2) > tolerance).any(axis=1)
 
-    top = 0
-    bottom = h
-
-    # Scan from top
-    for y in range(h):
-        for x in range(0, w, 4):  # Sample every 4th pixel for speed
-            p = rgb.getpixel((x, y))
-            if (abs(p[0] - bg_r) > tolerance or
-                abs(p[1] - bg_g) > tolerance or
-                abs(p[2] - bg_b) > tolerance):
-                top = y
-                break
-        else:
-            continue
-        break
-
-    # Scan from bottom
-    for y in range(h - 1, -1, -1):
-        for x in range(0, w, 4):
-            p = rgb.getpixel((x, y))
-            if (abs(p[0] - bg_r) > tolerance or
-                abs(p[1] - bg_g) > tolerance or
-                abs(p[2] - bg_b) > tolerance):
-                bottom = y + 1
-                break
-        else:
-            continue
-        break
+    if not row_has_content.any():
+        return (0, arr.shape[0])
 
+    top = int(np.argmax(row_has_content))
+    bottom = len(row_has_content) - int(np.argmax(row_has_content[::-1]))
     return (top, bottom)
 
 
@@ -122,6 +107,9 @@ def uniformize_background(img: Image.Image, bg_color: tuple, tolerance: int = 8)
     (i.e., contiguous background regions touching the border). This avoids
     damaging the drop shadow or any interior detail of the logo.
     """
+    if ndimage is not None:
+        return _uniformize_background_labeled(img, bg_color, tolerance)
+
     pixels = img.load()
     w, h = img.size
     has_alpha = img.mode == "RGBA"
@@ -136,56 +124,114 @@ def uniformize_background(img: Image.Image, bg_color: tuple, tolerance: int = 8)
     # Flood-fill from all border pixels that match the bg color.
     # This finds only the contiguous background region around the logo,
     # not the drop shadow or interior areas.
-    visited = set()
-    queue = []
+    #
+    # Scanline fill: each popped seed fills its whole horizontal run, and
+    # only one seed per contiguous run above/below is pushed. Filled pixels
+    # still match is_bg, so a flat byte mask tracks what is done.
+    bg_pixel = (bg_r, bg_g, bg_b, 255) if has_alpha else (bg_r, bg_g, bg_b)
+    filled = bytearray(w * h)
+
+    def fillable(x: int, y: int) -> bool:
+        return not filled[y * w + x] and is_bg(x, y)
 
     # Seed from all four edges
+    stack = []
     for x in range(w):
-        if is_bg(x, 0):
-            queue.append((x, 0))
-        if is_bg(x, h - 1):
-            queue.append((x, h - 1))
+        stack.append((x, 0))
+        stack.append((x, h - 1))
     for y in range(1, h - 1):
-        if is_bg(0, y):
-            queue.append((0, y))
-        if is_bg(w - 1, y):
-            queue.append((w - 1, y))
-
-    # BFS flood fill
-    while queue:
-        cx, cy = queue.pop()
-        if (cx, cy) in visited:
-            continue
-        if cx < 0 or cx >= w or cy < 0 or cy >= h:
-            continue
-        if not is_bg(cx, cy):
-            continue
+        stack.append((0, y))
+        stack.append((w - 1, y))
 
-        visited.add((cx, cy))
-        # Replace with exact bg color
-        if has_alpha:
-            pixels[cx, cy] = (bg_r, bg_g, bg_b, 255)
-        else:
-            pixels[cx, cy] = (bg_r, bg_g, bg_b)
+    while stack:
+        x, y = stack.pop()
+        if not fillable(x, y):
+            continue
 
-        # Add 4-connected neighbors
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = cx + dx, cy + dy
-            if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited:
-                queue.append((nx, ny))
+        # Extend the run left and right
+        lx = x
+        while lx > 0 and fillable(lx - 1, y):
+            lx -= 1
+        rx = x
+        while rx < w - 1 and fillable(rx + 1, y):
+            rx += 1
+
+        # Replace the run with exact bg color
+        row = y * w
+        for fx in range(lx, rx + 1):
+            filled[row + fx] = 1
+            pixels[fx, y] = bg_pixel
+
+        # Seed each contiguous fillable run in the rows above and below
+        for ny in (y - 1, y + 1):
+            if 0 <= ny < h:
+                in_run = False
+                for fx in range(lx, rx + 1):
+                    if fillable(fx, ny):
+                        if not in_run:
+                            stack.append((fx, ny))
+                            in_run = True
+                    else:
+                        in_run = False
 
     return img
 
 
+def _uniformize_background_labeled(img: Image.Image, bg_color: tuple,
+                                   tolerance: int) -> Image.Image:
+    """uniformize_background via connected-component labeling (SciPy).
+
+    Labels 4-connected near-background regions and fills those that touch
+    the border, which is exactly the set the flood fill reaches.
+    """
+    arr = np.array(img)
+    bg = np.array(bg_color[:3], dtype=np.int16)
+    is_bg = np.abs(arr[..., :3].astype(np.int16) - bg).max(axis=2) <= tolerance
+
+    labels, _ = ndimage.label(is_bg)
+    border = np.unique(np.concatenate(
+        (labels[0], labels[-1], labels[:, 0], labels[:, -1])
+    ))
+    fill = np.isin(labels, border[border != 0])
+
+    arr[fill, :3] = bg
+    if img.mode == "RGBA":
+        arr[fill, 3] = 255
+    return Image.fromarray(arr, img.mode)
+
+
+def load_source(source_path: Path) -> tuple:
+    """Open a source logo and run the size-independent analysis once.
+
+    Returns (img, bg_color, (content_top, content_bottom)), or None if the
+    image can't be opened.
+    """
+    try:
+        img = Image.open(source_path).convert("RGBA")
+    except Exception as e:
+        print(f"  Error opening {source_path}: {e}", file=sys.stderr)
+        return None
+
+    # Both analysis passes share one pixel array instead of each
+    # converting the image to RGB again
+    arr = np.asarray(img)
+
+    # Sample background color from corners
+    bg_color = sample_edge_color(arr)
+
+    # Detect logo content bounds (rows with non-background pixels)
+    return img, bg_color, find_content_bounds(arr, bg_color)
+
+
 def generate_splash(
-    source_path: Path,
+    img: Image.Image,
+    bg_color: tuple,
+    content_bounds: tuple,
     output_dir: Path,
     output_name: str,
     screen_width: int,
     screen_height: int,
     logo_size: int,
-    lvgl_image_py: Path,
-    python_exe: str,
 ) -> bool:
     """Generate a full-screen splash image using crop-and-extend.
 
@@ -197,20 +243,13 @@ def generate_splash(
     This makes the logo fill much more of the widescreen display.
     The logo_size parameter is used as a safety limit — the logo graphic
     must not be cropped.
-    """
-    try:
-        img = Image.open(source_path).convert("RGBA")
-    except Exception as e:
-        print(f"  Error opening {source_path}: {e}", file=sys.stderr)
-        return False
 
+    img, bg_color and content_bounds come from load_source(), so the
+    source is decoded and analyzed once rather than once per size.
+    """
     src_w, src_h = img.size  # 1024x1024
 
-    # Sample background color from corners
-    bg_color = sample_edge_color(img)
-
-    # Detect logo content bounds (rows with non-background pixels)
-    content_top, content_bottom = find_content_bounds(img, bg_color)
+    content_top, content_bottom = content_bounds
     content_h = content_bottom - content_top
 
     # Scale factor: make the logo fill as much of the screen as possible
@@ -230,7 +269,12 @@ def generate_splash(
     # Scale the full source image
     scaled_w = int(src_w * scale_factor)
     scaled_h = int(src_h * scale_factor)
-    scaled = img.resize((scaled_w, scaled_h), Image.LANCZOS)
+    if scale_factor < 1:
+        # Downscale: integer-reduce first, then Lanczos over the remaining
+        # factor (>= 3x the target size, so visually indistinguishable)
+        scaled = img.resize((scaled_w, scaled_h), Image.LANCZOS, reducing_gap=3.0)
+    else:
+        scaled = img.resize((scaled_w, scaled_h), Image.LANCZOS)
 
     # Clean up noisy background pixels so they blend seamlessly
     scaled = uniformize_background(scaled, bg_color)
@@ -241,32 +285,27 @@ def generate_splash(
     y_offset = (screen_height - scaled_h) // 2
     canvas.paste(scaled, (x_offset, y_offset), scaled)
 
-    # Save to temp PNG, then convert with LVGLImage.py
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-        tmp_path = tmp.name
-        canvas.save(tmp_path)
-
+    # ARGB8888 is BGRA in memory (little-endian); hand the pixels straight
+    # to LVGLImage instead of round-tripping through a temp PNG
+    bgra = np.asarray(canvas)[..., [2, 1, 0, 3]]
     try:
-        result = subprocess.run(
-            [
-                python_exe,
-                str(lvgl_image_py),
-                "--cf", "ARGB8888",
-                "--ofmt", "BIN",
-                "--compress", "LZ4",
-                "-o", str(output_dir),
-                "--name", output_name,
-                tmp_path,
-            ],
-            capture_output=True,
-            text=True,
+        lvgl_img = LVGLImage.LVGLImage(
+            LVGLImage.ColorFormat.ARGB8888, screen_width, screen_height,
+            bgra.tobytes(),
+        )
+        lvgl_img.to_bin(
+            str(output_dir / f"{output_name}.bin"),
+            compress=LVGLImage.CompressMethod.LZ4,
         )
-        if result.returncode != 0:
-            print(f"  LVGLImage.py error: {result.stderr}", file=sys.stderr)
-            return False
         return True
-    finally:
-        os.unlink(tmp_path)
+    except Exception as e:
+        print(f"  LVGLImage error: {e}", file=sys.stderr)
+        return False
+
+
+def _generate_job(job: tuple) -> bool:
+    """ProcessPoolExecutor entry point: generate_splash(*job)."""
+    return generate_splash(*job)
 
 
 def main():
@@ -305,16 +344,6 @@ def main():
     output_dir = Path(args.output_dir) if args.output_dir else project_dir / "build" / "assets" / "images" / "prerendered"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # LVGLImage.py path
-    lvgl_image_py = project_dir / "scripts" / "LVGLImage.py"
-    if not lvgl_image_py.exists():
-        print(f"Error: LVGLImage.py not found at {lvgl_image_py}", file=sys.stderr)
-        sys.exit(1)
-
-    # Python executable (prefer venv)
-    venv_python = project_dir / ".venv" / "bin" / "python"
-    python_exe = str(venv_python) if venv_python.exists() else "python3"
-
     # Filter sizes
     valid_size_names = {s[0] for s in SCREEN_SIZES}
     if args.sizes:
@@ -342,25 +371,28 @@ def main():
     success = 0
     failed = 0
 
+    # Every (mode, size) combination is independent - render them in parallel
+    jobs = []
     for mode in modes:
-        source_rel = SOURCE_IMAGES[mode]
-        source_path = project_dir / source_rel
+        source_path = project_dir / SOURCE_IMAGES[mode]
         if not source_path.exists():
             print(f"  Error: Source not found: {source_path}", file=sys.stderr)
             failed += len(sizes)
             continue
-
-        print(f"\n  {mode}: {source_rel}")
+        source = load_source(source_path)
+        if source is None:
+            failed += len(sizes)
+            continue
         for name, width, height, logo_size in sizes:
             output_name = f"splash-3d-{mode}-{name}"
-            sys.stdout.write(f"    {name} ({width}x{height}, logo {logo_size}px)... ")
-            sys.stdout.flush()
-
-            if generate_splash(
-                source_path, output_dir, output_name,
-                width, height, logo_size,
-                lvgl_image_py, python_exe,
-            ):
+            jobs.append((*source, output_dir, output_name,
+                         width, height, logo_size))
+
+    with ProcessPoolExecutor() as pool:
+        for job, ok in zip(jobs, pool.map(_generate_job, jobs)):
+            output_name, width, height, logo_size = job[-4:]
+            sys.stdout.write(f"    {output_name} ({width}x{height}, logo {logo_size}px)... ")
+            if ok:
                 # Show file size
                 out_file = output_dir / f"{output_name}.bin"
                 size_kb = out_file.stat().st_size / 1024
@@ -18,13 +18,22 @@ Usage:
     python scripts/generate_gradient_bg.py --mode dark   # Dark variants only
     python scripts/generate_gradient_bg.py --mode light  # Light variants only
     python scripts/generate_gradient_bg.py --mode both   # Both (default)
+    python scripts/generate_gradient_bg.py --format rgb565  # 2 bytes/px output
 """
 
 import argparse
 import os
 import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    print("Error: NumPy not found. Run: pip install numpy", file=sys.stderr)
+    sys.exit(1)
+
 # Dark mode gradient colors (matching ui_gradient_canvas.cpp defaults)
 # Diagonal gradient: bright at top-right, dark at bottom-left
 DARK_START_GRAY = 123  # Top-right - brighter
@@ -43,6 +52,23 @@ BAYER_4X4 = [
     [15, 7, 13, 5]
 ]
 
+# Bayer dithering threshold tuned for RGB565, scaled to ±12 range
+BAYER_THRESHOLD = np.array(BAYER_4X4, dtype=np.int16) * 24 // 16 - 12
+
+# Opaque gray -> ARGB8888 word; little-endian, so BGRA in memory
+ARGB_LUT = np.array(
+    [(255 << 24) | (g << 16) | (g << 8) | g for g in range(256)], dtype="<u4"
+)
+
+# Output pixel formats: name -> (LVGL color format id, bytes per pixel)
+# The gradient is pure gray, so RGB565 and L8 lose nothing visible while
+# halving/quartering file size and blit bandwidth.
+OUTPUT_FORMATS = {
+    "argb8888": (0x10, 4),  # LV_COLOR_FORMAT_ARGB8888
+    "rgb565": (0x12, 2),    # LV_COLOR_FORMAT_RGB565
+    "l8": (0x06, 1),        # LV_COLOR_FORMAT_L8
+}
+
 # Gradient sizes for different UI elements
 # Format: (name, width, height)
 GRADIENT_SIZES = [
@@ -57,20 +83,10 @@ GRADIENT_SIZES = [
 ]
 
 
-def bayer_threshold(x: int, y: int) -> int:
-    """Apply Bayer dithering threshold tuned for RGB565."""
-    bayer_val = BAYER_4X4[y & 3][x & 3]
-    return (bayer_val * 24 // 16) - 12  # Scale to ±12 range
-
-
-def clamp(val: int, min_val: int, max_val: int) -> int:
-    return max(min_val, min(max_val, val))
-
-
 def generate_gradient(width: int, height: int, start_gray: int, end_gray: int,
-                      dither: bool = True) -> bytes:
+                      dither: bool = True, fmt: str = "argb8888") -> np.ndarray:
     """
-    Generate diagonal gradient pixel data in ARGB8888 format.
+    Generate diagonal gradient pixel data.
 
     Args:
         width: Image width in pixels
@@ -78,40 +94,52 @@ def generate_gradient(width: int, height: int, start_gray: int, end_gray: int,
         start_gray: Gray value at top-right (brighter end)
         end_gray: Gray value at bottom-left (darker end)
         dither: Enable Bayer dithering to reduce banding
+        fmt: Output pixel format, a key of OUTPUT_FORMATS
 
-    Returns bytes in LVGL draw buffer format (ARGB8888, row-major).
+    Returns an array in LVGL draw buffer format (row-major, C-contiguous).
     """
-    pixels = bytearray()
-
     # For diagonal gradient (top-right to bottom-left), max distance is width + height - 2
     max_dist = float(width + height - 2) if (width + height > 2) else 1.0
 
-    for y in range(height):
-        for x in range(width):
-            # Diagonal interpolation: top-right (bright) to bottom-left (dark)
-            # Distance from top-right corner: (width-1-x) + y
-            t = float((width - 1 - x) + y) / max_dist
+    y = np.arange(height)[:, None]
+    x = np.arange(width)[None, :]
 
-            # Interpolate gray value
-            gray = int(start_gray + t * (end_gray - start_gray))
+    # Diagonal interpolation: top-right (bright) to bottom-left (dark)
+    # Distance from top-right corner: (width-1-x) + y
+    t = ((width - 1 - x) + y) / max_dist
 
-            if dither:
-                threshold = bayer_threshold(x, y)
-                gray = clamp(gray + threshold, 0, 255)
+    # Interpolate gray value (astype truncates like int())
+    gray = (start_gray + t * (end_gray - start_gray)).astype(np.int16)
 
-            # ARGB8888: Blue, Green, Red, Alpha (little-endian BGRA in memory)
-            pixels.extend([gray, gray, gray, 255])
+    if dither:
+        bayer = np.tile(BAYER_THRESHOLD, ((height + 3) // 4, (width + 3) // 4))
+        gray = np.clip(gray + bayer[:height, :width], 0, 255)
 
-    return bytes(pixels)
+    gray = gray.astype(np.uint8)
+    if fmt == "l8":
+        return gray
+    if fmt == "rgb565":
+        g = gray.astype(np.uint16)
+        return ((g >> 3) << 11 | (g >> 2) << 5 | (g >> 3)).astype("<u2")
 
+    # ARGB8888: one opaque gray word per pixel via the lookup table
+    return ARGB_LUT[gray]
 
-def write_lvgl_bin(output_path: Path, width: int, height: int, pixel_data: bytes):
+
+def write_lvgl_bin(output_path: Path, width: int, height: int,
+                   pixel_data: np.ndarray | bytes,
+                   fmt: str = "argb8888") -> int:
     """
     Write LVGL 9.x native binary image format.
+
+    pixel_data may be an ndarray, which is written straight from its buffer
+    without an intermediate bytes copy.
+
+    Returns the size of the written file in bytes.
     
     Header format (12 bytes):
         - magic: 0x19 (1 byte) - LVGL 9 signature
-        - cf: color format (1 byte) - 0x10 = ARGB8888
+        - cf: color format (1 byte) - see OUTPUT_FORMATS
         - flags: image flags (2 bytes)
         - w: width (2 bytes)
         - h: height (2 bytes)
@@ -120,9 +148,9 @@ def write_lvgl_bin(output_path: Path, width: int, height: int, pixel_data: bytes
     """
     # LVGL 9.x header (matching LVGLImage.py format)
     magic = 0x19  # LVGL 9 signature
-    cf = 0x10     # LV_COLOR_FORMAT_ARGB8888 (from ColorFormat enum)
+    cf, bytes_per_pixel = OUTPUT_FORMATS[fmt]  # (from ColorFormat enum)
     flags = 0x00  # No special flags
-    stride = width * 4  # 4 bytes per pixel (ARGB8888)
+    stride = width * bytes_per_pixel
     reserved = 0
     
     header = struct.pack('<BBHHHHH',
@@ -137,9 +165,24 @@ def write_lvgl_bin(output_path: Path, width: int, height: int, pixel_data: bytes
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, 'wb') as f:
         f.write(header)
-        f.write(pixel_data)
-    
-    print(f"  Generated: {output_path} ({width}x{height}, {len(pixel_data) + len(header)} bytes)")
+        if isinstance(pixel_data, np.ndarray):
+            pixel_data.tofile(f)
+        else:
+            f.write(pixel_data)
+        size = f.tell()
+
+    return size
+
+
+def render_gradient(job: tuple) -> int:
+    """Generate and write one gradient; ProcessPoolExecutor entry point.
+
+    job is (output_path, width, height, start_gray, end_gray, dither, fmt).
+    """
+    output_path, width, height, start_gray, end_gray, dither, fmt = job
+    pixel_data = generate_gradient(width, height, start_gray, end_gray,
+                                   dither=dither, fmt=fmt)
+    return write_lvgl_bin(output_path, width, height, pixel_data, fmt=fmt)
 
 
 def main():
@@ -163,10 +206,15 @@ def main():
         default="both",
         help="Which theme variants to generate (default: both)"
     )
+    parser.add_argument(
+        "--format",
+        choices=sorted(OUTPUT_FORMATS),
+        default="argb8888",
+        help="Output pixel format (default: argb8888)"
+    )
     args = parser.parse_args()
 
     dither = not args.no_dither
-    count = 0
 
     # Mode configurations: (suffix, start_gray, end_gray)
     modes = []
@@ -177,16 +225,23 @@ def main():
 
     print(f"Generating gradient backgrounds (mode={args.mode})...")
 
-    for mode_suffix, start_gray, end_gray in modes:
-        print(f"\n  [{mode_suffix}] gray {start_gray} -> {end_gray}")
-        for name, width, height in GRADIENT_SIZES:
-            pixel_data = generate_gradient(width, height, start_gray, end_gray,
-                                           dither=dither)
-            output_path = args.output_dir / f"gradient-{name}-{mode_suffix}.bin"
-            write_lvgl_bin(output_path, width, height, pixel_data)
-            count += 1
-
-    print(f"\nDone! Generated {count} gradient images in {args.output_dir}")
+    # Every (mode, size) gradient is independent - render them in parallel
+    jobs = [
+        (args.output_dir / f"gradient-{name}-{mode_suffix}.bin",
+         width, height, start_gray, end_gray, dither, args.format)
+        for mode_suffix, start_gray, end_gray in modes
+        for name, width, height in GRADIENT_SIZES
+    ]
+    with ProcessPoolExecutor() as pool:
+        results = zip(jobs, pool.map(render_gradient, jobs))
+
+        for mode_suffix, start_gray, end_gray in modes:
+            print(f"\n  [{mode_suffix}] gray {start_gray} -> {end_gray}")
+            for _ in GRADIENT_SIZES:
+                (output_path, width, height, *_), size = next(results)
+                print(f"  Generated: {output_path} ({width}x{height}, {size} bytes)")
+
+    print(f"\nDone! Generated {len(jobs)} gradient images in {args.output_dir}")
 
 
 if __name__ == "__main__":
@@ -12,33 +12,64 @@ Usage:
 """
 
 import argparse
-import xml.etree.ElementTree as ET
+import functools
+import io
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TextIO
 
 import yaml
 
+try:
+    # libyaml-backed loader: same safe semantics, C-speed scanning/parsing
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 # =============================================================================
 # YAML Parsing
 # =============================================================================
 
 
-def parse_yaml_content(yaml_string: str) -> dict[str, Any]:
+def parse_yaml_content(yaml_string: str | BinaryIO) -> dict[str, Any]:
     """
     Parse YAML content and return dict with 'locale' and 'translations'.
 
     Args:
-        yaml_string: YAML content as a string
+        yaml_string: YAML content as a string, or an open binary file
 
     Returns:
         Dictionary with 'locale' (str) and 'translations' (dict) keys
     """
-    data = yaml.safe_load(yaml_string)
+    data = yaml.load(yaml_string, Loader=_SafeLoader)
+    translations = data.get("translations", {})
+    if isinstance(translations, dict):
+        translations = _intern_strings(translations)
     return {
         "locale": data.get("locale", ""),
-        "translations": data.get("translations", {}),
+        "translations": translations,
+    }
+
+
+def _intern_strings(mapping: dict[str, Any]) -> dict[str, Any]:
+    """Intern keys and string values (recursing into plural dicts).
+
+    Every locale repeats the same keys, and untranslated entries repeat the
+    English text, so interning shares one object per distinct string and
+    lets dict lookups and the escape caches hit on identity.
+    """
+    return {
+        sys.intern(key) if isinstance(key, str) else key: (
+            sys.intern(value) if isinstance(value, str)
+            else _intern_strings(value) if isinstance(value, dict)
+            else value
+        )
+        for key, value in mapping.items()
     }
 
 
@@ -55,63 +86,112 @@ def is_plural_entry(value: Any) -> bool:
     return isinstance(value, dict)
 
 
+@dataclass(frozen=True)
+class _TranslationIndex:
+    """Sorted locale/key order shared by the XML and C generators."""
+
+    sorted_locales: tuple[str, ...]
+    sorted_singular_keys: tuple[str, ...]
+    sorted_plural_keys: tuple[str, ...]
+    singular_key_to_idx: dict[str, int]
+    plural_key_to_idx: dict[str, int]
+
+
+def _index_translations(
+    singulars: dict[str, dict[str, str]],
+    plurals: dict[str, dict[str, dict[str, str]]],
+) -> _TranslationIndex:
+    """Collect and sort all locales and keys once for a translation set."""
+    # Each union is a single C-level call over all the locales' key views
+    all_locales = set().union(singulars.keys(), plurals.keys())
+    all_singular_keys = set().union(*singulars.values())
+    all_plural_keys = set().union(*plurals.values())
+
+    sorted_singular_keys = tuple(sorted(all_singular_keys))
+    sorted_plural_keys = tuple(sorted(all_plural_keys))
+    return _TranslationIndex(
+        sorted_locales=tuple(sorted(all_locales)),
+        sorted_singular_keys=sorted_singular_keys,
+        sorted_plural_keys=sorted_plural_keys,
+        singular_key_to_idx={key: i for i, key in enumerate(sorted_singular_keys)},
+        plural_key_to_idx={key: i for i, key in enumerate(sorted_plural_keys)},
+    )
+
+
 # =============================================================================
 # XML Generation
 # =============================================================================
 
 
+_XML_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"}
+_XML_ESCAPE_RE = re.compile(r"""[&<>"']""")
+
+
+def _xml_escape_match(match: re.Match) -> str:
+    return _XML_ESCAPES[match.group(0)]
+
+
+@functools.lru_cache(maxsize=4096)
 def escape_xml_attr(text: str) -> str:
     """Escape special characters for XML attributes."""
-    # Order matters - ampersand first
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
-    text = text.replace('"', "&quot;")
-    text = text.replace("'", "&apos;")
-    return text
+    # Single pass, so an already-produced "&amp;" is never re-escaped
+    return _XML_ESCAPE_RE.sub(_xml_escape_match, text)
 
 
-def generate_lvgl_xml(translations_dict: dict[str, dict[str, str]]) -> str:
+def generate_lvgl_xml(
+    translations_dict: dict[str, dict[str, str]],
+    index: _TranslationIndex | None = None,
+) -> str:
     """
     Generate LVGL XML format from translations dictionary.
 
     Args:
-        translations_dict: Dict of {locale: {key: value, ...}, ...}
+        translations_dict: Dict of {locale: {key: value, ...}, ...} holding
+            singular translations only (plural dicts split out beforehand)
+        index: Precomputed index of translations_dict as singulars, to reuse
+            its sorted keys instead of collecting them again
 
     Returns:
         XML string in LVGL translations format
     """
+    buf = io.StringIO()
+    stream_lvgl_xml(translations_dict, buf, index)
+    return buf.getvalue()
+
+
+def stream_lvgl_xml(
+    translations_dict: dict[str, dict[str, str]],
+    out: TextIO,
+    index: _TranslationIndex | None = None,
+) -> None:
+    """Write the LVGL XML for translations_dict to out (see generate_lvgl_xml)."""
     # Get all languages and sort them
     languages = sorted(translations_dict.keys())
     languages_str = " ".join(languages)
 
-    # Collect all keys (only singular translations, not plural dicts)
-    all_keys = set()
-    for locale_translations in translations_dict.values():
-        for key, value in locale_translations.items():
-            if not is_plural_entry(value):
-                all_keys.add(key)
-
-    # Sort keys alphabetically
-    sorted_keys = sorted(all_keys)
+    # Keys sorted alphabetically
+    if index is None:
+        index = _index_translations(translations_dict, {})
+    sorted_keys = index.sorted_singular_keys
 
     # Build XML
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        f'<translations languages="{languages_str}">',
-    ]
+    w = out.write
+    w(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<translations languages="{languages_str}">\n'
+    )
 
+    # Resolve each language's dict once instead of per key
+    lang_dicts = [(lang, translations_dict[lang]) for lang in languages]
     for key in sorted_keys:
-        attrs = [f'tag="{escape_xml_attr(key)}"']
-        for lang in languages:
-            value = translations_dict.get(lang, {}).get(key, "")
-            if value and not is_plural_entry(value):
-                attrs.append(f'{lang}="{escape_xml_attr(value)}"')
-        lines.append(f'  <translation {" ".join(attrs)}/>')
-
-    lines.append("</translations>")
+        lang_attrs = "".join(
+            f' {lang}="{escape_xml_attr(value)}"'
+            for lang, locale_translations in lang_dicts
+            if (value := locale_translations.get(key))
+        )
+        w(f'  <translation tag="{escape_xml_attr(key)}"{lang_attrs}/>\n')
 
-    return "\n".join(lines) + "\n"
+    w("</translations>\n")
 
 
 # =============================================================================
@@ -120,67 +200,68 @@ def generate_lvgl_xml(translations_dict: dict[str, dict[str, str]]) -> str:
 
 # Plural rules for different languages
 # Based on CLDR plural rules: https://unicode-org.github.io/cldr-staging/charts/latest/supplemental/language_plural_rules.html
-PLURAL_RULES = {
-    "en": """
-static uint8_t {locale}_plural_fn(int32_t num)
-{{
-    uint32_t n = op_n(num); UNUSED(n);
-    uint32_t i = op_i(n); UNUSED(i);
-    uint32_t v = op_v(n); UNUSED(v);
-
-    if ((i == 1 && v == 0)) return LV_I18N_PLURAL_TYPE_ONE;
-    return LV_I18N_PLURAL_TYPE_OTHER;
-}}
-""",
-    "de": """
-static uint8_t {locale}_plural_fn(int32_t num)
-{{
-    uint32_t n = op_n(num); UNUSED(n);
-    uint32_t i = op_i(n); UNUSED(i);
-    uint32_t v = op_v(n); UNUSED(v);
-
-    if ((i == 1 && v == 0)) return LV_I18N_PLURAL_TYPE_ONE;
-    return LV_I18N_PLURAL_TYPE_OTHER;
-}}
-""",
-    "es": """
-static uint8_t {locale}_plural_fn(int32_t num)
-{{
-    uint32_t n = op_n(num); UNUSED(n);
-    uint32_t i = op_i(n); UNUSED(i);
-    uint32_t v = op_v(n); UNUSED(v);
-
-    if ((i == 1 && v == 0)) return LV_I18N_PLURAL_TYPE_ONE;
-    return LV_I18N_PLURAL_TYPE_OTHER;
-}}
-""",
-    "fr": """
-static uint8_t {locale}_plural_fn(int32_t num)
-{{
-    uint32_t n = op_n(num); UNUSED(n);
-    uint32_t i = op_i(n); UNUSED(i);
-
-    if ((i == 0 || i == 1)) return LV_I18N_PLURAL_TYPE_ONE;
-    return LV_I18N_PLURAL_TYPE_OTHER;
-}}
-""",
-    "ru": """
-static uint8_t {locale}_plural_fn(int32_t num)
-{{
-    uint32_t n = op_n(num); UNUSED(n);
-    uint32_t v = op_v(n); UNUSED(v);
-    uint32_t i = op_i(n); UNUSED(i);
-    uint32_t i10 = i % 10;
-    uint32_t i100 = i % 100;
-    if ((v == 0 && i10 == 1 && i100 != 11)) return LV_I18N_PLURAL_TYPE_ONE;
-    if ((v == 0 && (2 <= i10 && i10 <= 4) && (!(12 <= i100 && i100 <= 14)))) return LV_I18N_PLURAL_TYPE_FEW;
-    if ((v == 0 && i10 == 0) || (v == 0 && (5 <= i10 && i10 <= 9)) || (v == 0 && (11 <= i100 && i100 <= 14))) return LV_I18N_PLURAL_TYPE_MANY;
-    return LV_I18N_PLURAL_TYPE_OTHER;
-}}
-""",
+# One/other split shared by most Germanic and Romance languages
+_ONE_OTHER_RULE = {
+    "operands": ["i", "v"],
+    "conditions": [("(i == 1 && v == 0)", "ONE")],
+}
+
+# Each rule is data: the plural operands it reads, any derived values, and
+# ordered (condition, plural type) checks; anything unmatched is OTHER.
+PLURAL_RULE_SPECS = {
+    "en": _ONE_OTHER_RULE,
+    "de": _ONE_OTHER_RULE,
+    "es": _ONE_OTHER_RULE,
+    "fr": {
+        "operands": ["i"],
+        "conditions": [("(i == 0 || i == 1)", "ONE")],
+    },
+    "ru": {
+        "operands": ["i", "v"],
+        "derived": [("i10", "i % 10"), ("i100", "i % 100")],
+        "conditions": [
+            ("(v == 0 && i10 == 1 && i100 != 11)", "ONE"),
+            ("(v == 0 && (2 <= i10 && i10 <= 4) && (!(12 <= i100 && i100 <= 14)))", "FEW"),
+            ("(v == 0 && i10 == 0) || (v == 0 && (5 <= i10 && i10 <= 9)) || "
+             "(v == 0 && (11 <= i100 && i100 <= 14))", "MANY"),
+        ],
+    },
 }
 
 
+def render_plural_fn(locale: str, spec: dict[str, Any]) -> str:
+    """Render the C plural-category function for a locale from its rule spec."""
+    lines = [
+        "",
+        f"static uint8_t {locale}_plural_fn(int32_t num)",
+        "{",
+        "    uint32_t n = op_n(num); UNUSED(n);",
+    ]
+    for op in spec["operands"]:
+        lines.append(f"    uint32_t {op} = op_{op}(n); UNUSED({op});")
+    for name, expr in spec.get("derived", []):
+        lines.append(f"    uint32_t {name} = {expr};")
+    lines.append("")
+    for condition, plural_type in spec["conditions"]:
+        lines.append(f"    if ({condition}) return LV_I18N_PLURAL_TYPE_{plural_type};")
+    lines.append("    return LV_I18N_PLURAL_TYPE_OTHER;")
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+# Recognized C escape pairs are matched first so they pass through intact;
+# any other backslash, quote, or control character is escaped
+_C_ESCAPE_RE = re.compile(r'\\[nrt\\"]|[\n\r\t"\\]')
+_C_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", '"': '\\"', "\\": "\\\\"}
+
+
+def _c_escape_match(match: re.Match) -> str:
+    text = match.group(0)
+    return _C_ESCAPES.get(text, text)
+
+
+@functools.lru_cache(maxsize=4096)
 def escape_c_string(text: str) -> str:
     """Escape special characters for C strings.
 
@@ -188,33 +269,7 @@ def escape_c_string(text: str) -> str:
     YAML single-quoted strings store \\n as two chars (backslash + n), which must
     stay as \\n in C (the compiler interprets it as a real newline at runtime).
     """
-    result = []
-    i = 0
-    while i < len(text):
-        ch = text[i]
-        if ch == "\n":
-            result.append("\\n")
-        elif ch == "\r":
-            result.append("\\r")
-        elif ch == "\t":
-            result.append("\\t")
-        elif ch == '"':
-            result.append('\\"')
-        elif ch == "\\" and i + 1 < len(text):
-            next_ch = text[i + 1]
-            if next_ch in ("n", "r", "t", "\\", '"'):
-                # Recognized C escape sequence — preserve as-is
-                result.append("\\")
-                result.append(next_ch)
-                i += 1
-            else:
-                result.append("\\\\")
-        elif ch == "\\":
-            result.append("\\\\")
-        else:
-            result.append(ch)
-        i += 1
-    return "".join(result)
+    return _C_ESCAPE_RE.sub(_c_escape_match, text)
 
 
 def get_plural_forms_for_locale(locale: str) -> list[str]:
@@ -230,6 +285,7 @@ def get_plural_forms_for_locale(locale: str) -> list[str]:
 def generate_lv_i18n_c(
     singulars: dict[str, dict[str, str]],
     plurals: dict[str, dict[str, dict[str, str]]],
+    index: _TranslationIndex | None = None,
 ) -> str:
     """
     Generate C code for lv_i18n library.
@@ -237,63 +293,80 @@ def generate_lv_i18n_c(
     Args:
         singulars: Dict of {locale: {key: value, ...}, ...} for singular translations
         plurals: Dict of {locale: {key: {form: value, ...}, ...}, ...} for plural translations
+        index: Precomputed _index_translations(singulars, plurals), if available
 
     Returns:
         C source code string
     """
-    lines = [
-        "// SPDX-License-Identifier: GPL-3.0-or-later",
-        "// Auto-generated by generate_translations.py - DO NOT EDIT",
-        "",
-        '#include "lv_i18n_translations.h"',
-        "#include <stddef.h>  // For NULL",
-        "#include <string.h>  // For strcmp",
-        "",
-        "////////////////////////////////////////////////////////////////////////////////",
-        "// Define plural operands",
-        "// http://unicode.org/reports/tr35/tr35-numbers.html#Operands",
-        "",
-        "#define UNUSED(x) (void)(x)",
-        "",
-        "static inline uint32_t op_n(int32_t val) { return (uint32_t)(val < 0 ? -val : val); }",
-        "static inline uint32_t op_i(uint32_t val) { return val; }",
-        "static inline uint32_t op_v(uint32_t val) { UNUSED(val); return 0; }",
-        "static inline uint32_t op_w(uint32_t val) { UNUSED(val); return 0; }",
-        "static inline uint32_t op_f(uint32_t val) { UNUSED(val); return 0; }",
-        "static inline uint32_t op_t(uint32_t val) { UNUSED(val); return 0; }",
-        "static inline uint32_t op_e(uint32_t val) { UNUSED(val); return 0; }",
-        "",
-    ]
+    buf = io.StringIO()
+    stream_lv_i18n_c(singulars, plurals, buf, index)
+    return buf.getvalue()
 
-    # Collect all locales
-    all_locales = set(singulars.keys()) | set(plurals.keys())
-    sorted_locales = sorted(all_locales)
 
-    # Collect all singular keys (sorted)
-    all_singular_keys = set()
-    for locale_data in singulars.values():
-        all_singular_keys.update(locale_data.keys())
-    sorted_singular_keys = sorted(all_singular_keys)
+def stream_lv_i18n_c(
+    singulars: dict[str, dict[str, str]],
+    plurals: dict[str, dict[str, dict[str, str]]],
+    out: TextIO,
+    index: _TranslationIndex | None = None,
+) -> None:
+    """Write the lv_i18n C source to out (see generate_lv_i18n_c)."""
+    w = out.write
+    w(
+        "// SPDX-License-Identifier: GPL-3.0-or-later\n"
+        "// Auto-generated by generate_translations.py - DO NOT EDIT\n"
+        "\n"
+        '#include "lv_i18n_translations.h"\n'
+        "#include <stddef.h>  // For NULL\n"
+        "#include <string.h>  // For strcmp\n"
+        "\n"
+        "////////////////////////////////////////////////////////////////////////////////\n"
+        "// Define plural operands\n"
+        "// http://unicode.org/reports/tr35/tr35-numbers.html#Operands\n"
+        "\n"
+        "#define UNUSED(x) (void)(x)\n"
+        "\n"
+        "static inline uint32_t op_n(int32_t val) { return (uint32_t)(val < 0 ? -val : val); }\n"
+        "static inline uint32_t op_i(uint32_t val) { return val; }\n"
+        "static inline uint32_t op_v(uint32_t val) { UNUSED(val); return 0; }\n"
+        "static inline uint32_t op_w(uint32_t val) { UNUSED(val); return 0; }\n"
+        "static inline uint32_t op_f(uint32_t val) { UNUSED(val); return 0; }\n"
+        "static inline uint32_t op_t(uint32_t val) { UNUSED(val); return 0; }\n"
+        "static inline uint32_t op_e(uint32_t val) { UNUSED(val); return 0; }\n"
+        "\n"
+    )
 
-    # Collect all plural keys (sorted)
-    all_plural_keys = set()
-    for locale_data in plurals.values():
-        all_plural_keys.update(locale_data.keys())
-    sorted_plural_keys = sorted(all_plural_keys)
+    if index is None:
+        index = _index_translations(singulars, plurals)
+    sorted_locales = index.sorted_locales
+    sorted_singular_keys = index.sorted_singular_keys
+    sorted_plural_keys = index.sorted_plural_keys
+    singular_key_to_idx = index.singular_key_to_idx
+    plural_key_to_idx = index.plural_key_to_idx
+
+    # Each array starts as all-NULL rows (formatted once, shared by every
+    # locale); only the keys a locale actually has are then filled in
+    singular_null_rows = [
+        f'    NULL, // {i}="{key}"\n' for i, key in enumerate(sorted_singular_keys)
+    ]
+    plural_null_rows = [
+        f'    NULL, // {i}="{key}"\n' for i, key in enumerate(sorted_plural_keys)
+    ]
 
-    # Generate singulars arrays for each locale
+    # Generate singulars arrays for each locale. A locale with no singular
+    # strings gets no array: its lang struct leaves .singulars unset.
     for locale in sorted_locales:
-        locale_singulars = singulars.get(locale, {})
-        if locale_singulars or locale in singulars:
-            lines.append(f"static const char * {locale}_singulars[] = {{")
-            for i, key in enumerate(sorted_singular_keys):
-                value = locale_singulars.get(key)
-                if value is not None:
-                    lines.append(f'    "{escape_c_string(value)}", // {i}="{key}"')
-                else:
-                    lines.append(f'    NULL, // {i}="{key}"')
-            lines.append("};")
-            lines.append("")
+        locale_singulars = singulars.get(locale)
+        if not locale_singulars:
+            continue
+
+        rows = singular_null_rows.copy()
+        for key, value in locale_singulars.items():
+            if value is not None:
+                i = singular_key_to_idx[key]
+                rows[i] = f'    "{escape_c_string(value)}", // {i}="{key}"\n'
+        w(f"static const char * {locale}_singulars[] = {{\n")
+        w("".join(rows))
+        w("};\n\n")
 
     # Generate plurals arrays for each locale and plural form
     for locale in sorted_locales:
@@ -310,16 +383,15 @@ def generate_lv_i18n_c(
             if form not in forms_used:
                 continue
 
-            lines.append(f"static const char * {locale}_plurals_{form}[] = {{")
-            for i, key in enumerate(sorted_plural_keys):
-                key_plurals = locale_plurals.get(key, {})
+            rows = plural_null_rows.copy()
+            for key, key_plurals in locale_plurals.items():
                 value = key_plurals.get(form)
                 if value is not None:
-                    lines.append(f'    "{escape_c_string(value)}", // {i}="{key}"')
-                else:
-                    lines.append(f'    NULL, // {i}="{key}"')
-            lines.append("};")
-            lines.append("")
+                    i = plural_key_to_idx[key]
+                    rows[i] = f'    "{escape_c_string(value)}", // {i}="{key}"\n'
+            w(f"static const char * {locale}_plurals_{form}[] = {{\n")
+            w("".join(rows))
+            w("};\n\n")
 
     # Generate plural functions for each locale that has plurals
     for locale in sorted_locales:
@@ -327,19 +399,19 @@ def generate_lv_i18n_c(
             continue
 
         # Use the locale-specific plural rule or fall back to English
-        rule_template = PLURAL_RULES.get(locale, PLURAL_RULES["en"])
-        lines.append(rule_template.format(locale=locale))
+        spec = PLURAL_RULE_SPECS.get(locale, PLURAL_RULE_SPECS["en"])
+        w(render_plural_fn(locale, spec) + "\n")
 
     # Generate language structs
     for locale in sorted_locales:
         locale_singulars = singulars.get(locale, {})
         locale_plurals = plurals.get(locale, {})
 
-        lines.append(f"static const lv_i18n_lang_t {locale}_lang = {{")
-        lines.append(f'    .locale_name = "{locale}",')
+        w(f"static const lv_i18n_lang_t {locale}_lang = {{\n")
+        w(f'    .locale_name = "{locale}",\n')
 
         if locale_singulars:
-            lines.append(f"    .singulars = {locale}_singulars,")
+            w(f"    .singulars = {locale}_singulars,\n")
 
         if locale_plurals:
             forms_used = set()
@@ -349,85 +421,76 @@ def generate_lv_i18n_c(
             for form in ["one", "two", "few", "many", "other"]:
                 if form in forms_used:
                     plural_type = f"LV_I18N_PLURAL_TYPE_{form.upper()}"
-                    lines.append(f"    .plurals[{plural_type}] = {locale}_plurals_{form},")
+                    w(f"    .plurals[{plural_type}] = {locale}_plurals_{form},\n")
 
-            lines.append(f"    .locale_plural_fn = {locale}_plural_fn")
-        lines.append("};")
-        lines.append("")
+            w(f"    .locale_plural_fn = {locale}_plural_fn\n")
+        w("};\n\n")
 
     # Generate language pack
-    lines.append("const lv_i18n_language_pack_t lv_i18n_language_pack[] = {")
+    w("const lv_i18n_language_pack_t lv_i18n_language_pack[] = {\n")
     for locale in sorted_locales:
-        lines.append(f"    &{locale}_lang,")
-    lines.append("    NULL // End mark")
-    lines.append("};")
-    lines.append("")
+        w(f"    &{locale}_lang,\n")
+    w("    NULL // End mark\n")
+    w("};\n\n")
 
     # Generate singular and plural index arrays (for runtime lookup)
-    lines.append("#ifndef LV_I18N_OPTIMIZE")
-    lines.append("")
+    w("#ifndef LV_I18N_OPTIMIZE\n\n")
 
     if sorted_singular_keys:
-        lines.append("static const char * singular_idx[] = {")
+        w("static const char * singular_idx[] = {\n")
         for key in sorted_singular_keys:
-            lines.append(f'    "{escape_c_string(key)}",')
-        lines.append("};")
-        lines.append("")
+            w(f'    "{escape_c_string(key)}",\n')
+        w("};\n\n")
 
     if sorted_plural_keys:
-        lines.append("static const char * plural_idx[] = {")
+        w("static const char * plural_idx[] = {\n")
         for key in sorted_plural_keys:
-            lines.append(f'    "{escape_c_string(key)}",')
-        lines.append("};")
-        lines.append("")
+            w(f'    "{escape_c_string(key)}",\n')
+        w("};\n\n")
 
-    lines.append("#endif")
-    lines.append("")
+    w("#endif\n\n")
 
     # Add runtime functions
-    lines.extend([
-        "////////////////////////////////////////////////////////////////////////////////",
-        "// Runtime API",
-        "////////////////////////////////////////////////////////////////////////////////",
-        "",
-        "// Internal state",
-        "static const lv_i18n_language_pack_t * current_lang_pack = NULL;",
-        "static const lv_i18n_lang_t * current_lang = NULL;",
-        "",
-        "int lv_i18n_init(const lv_i18n_language_pack_t * langs)",
-        "{",
-        "    if (langs == NULL) return -1;",
-        "    if (langs[0] == NULL) return -1;",
-        "",
-        "    current_lang_pack = langs;",
-        "    current_lang = langs[0];  // Default to first language",
-        "    return 0;",
-        "}",
-        "",
-        "int lv_i18n_set_locale(const char * l_name)",
-        "{",
-        "    if (current_lang_pack == NULL) return -1;",
-        "    if (l_name == NULL) return -1;",
-        "",
-        "    for (int i = 0; current_lang_pack[i] != NULL; i++) {",
-        "        if (strcmp(current_lang_pack[i]->locale_name, l_name) == 0) {",
-        "            current_lang = current_lang_pack[i];",
-        "            return 0;",
-        "        }",
-        "    }",
-        "",
-        "    return -1;  // Locale not found",
-        "}",
-        "",
-        "const char * lv_i18n_get_current_locale(void)",
-        "{",
-        "    if (current_lang == NULL) return NULL;",
-        "    return current_lang->locale_name;",
-        "}",
-        "",
-    ])
-
-    return "\n".join(lines)
+    w(
+        "////////////////////////////////////////////////////////////////////////////////\n"
+        "// Runtime API\n"
+        "////////////////////////////////////////////////////////////////////////////////\n"
+        "\n"
+        "// Internal state\n"
+        "static const lv_i18n_language_pack_t * current_lang_pack = NULL;\n"
+        "static const lv_i18n_lang_t * current_lang = NULL;\n"
+        "\n"
+        "int lv_i18n_init(const lv_i18n_language_pack_t * langs)\n"
+        "{\n"
+        "    if (langs == NULL) return -1;\n"
+        "    if (langs[0] == NULL) return -1;\n"
+        "\n"
+        "    current_lang_pack = langs;\n"
+        "    current_lang = langs[0];  // Default to first language\n"
+        "    return 0;\n"
+        "}\n"
+        "\n"
+        "int lv_i18n_set_locale(const char * l_name)\n"
+        "{\n"
+        "    if (current_lang_pack == NULL) return -1;\n"
+        "    if (l_name == NULL) return -1;\n"
+        "\n"
+        "    for (int i = 0; current_lang_pack[i] != NULL; i++) {\n"
+        "        if (strcmp(current_lang_pack[i]->locale_name, l_name) == 0) {\n"
+        "            current_lang = current_lang_pack[i];\n"
+        "            return 0;\n"
+        "        }\n"
+        "    }\n"
+        "\n"
+        "    return -1;  // Locale not found\n"
+        "}\n"
+        "\n"
+        "const char * lv_i18n_get_current_locale(void)\n"
+        "{\n"
+        "    if (current_lang == NULL) return NULL;\n"
+        "    return current_lang->locale_name;\n"
+        "}\n"
+    )
 
 
 def generate_lv_i18n_h(
@@ -444,71 +507,69 @@ def generate_lv_i18n_h(
     Returns:
         C header code string
     """
-    lines = [
-        "// SPDX-License-Identifier: GPL-3.0-or-later",
-        "// Auto-generated by generate_translations.py - DO NOT EDIT",
-        "",
-        "#ifndef LV_I18N_TRANSLATIONS_H",
-        "#define LV_I18N_TRANSLATIONS_H",
-        "",
-        "#ifdef __cplusplus",
-        'extern "C" {',
-        "#endif",
-        "",
-        "#include <stdint.h>",
-        "",
-        "////////////////////////////////////////////////////////////////////////////////",
-        "",
-        "typedef enum {",
-        "    LV_I18N_PLURAL_TYPE_ZERO,",
-        "    LV_I18N_PLURAL_TYPE_ONE,",
-        "    LV_I18N_PLURAL_TYPE_TWO,",
-        "    LV_I18N_PLURAL_TYPE_FEW,",
-        "    LV_I18N_PLURAL_TYPE_MANY,",
-        "    LV_I18N_PLURAL_TYPE_OTHER,",
-        "    _LV_I18N_PLURAL_TYPE_NUM,",
-        "} lv_i18n_plural_type_t;",
-        "",
-        "typedef struct {",
-        "    const char * locale_name;",
-        "    const char * * singulars;",
-        "    const char * * plurals[_LV_I18N_PLURAL_TYPE_NUM];",
-        "    uint8_t (*locale_plural_fn)(int32_t num);",
-        "} lv_i18n_lang_t;",
-        "",
-        "typedef const lv_i18n_lang_t * lv_i18n_language_pack_t;",
-        "",
-        "extern const lv_i18n_language_pack_t lv_i18n_language_pack[];",
-        "",
-        "/**",
-        " * Initialize the lv_i18n translation system with a language pack.",
-        " * @param langs Pointer to the array of languages (last element must be NULL)",
-        " * @return 0 on success, -1 on error",
-        " */",
-        "int lv_i18n_init(const lv_i18n_language_pack_t * langs);",
-        "",
-        "/**",
-        " * Change the current locale (language).",
-        " * @param l_name Name of the locale to use (e.g., \"en\", \"de\", \"fr\")",
-        " * @return 0 on success, -1 if locale not found",
-        " */",
-        "int lv_i18n_set_locale(const char * l_name);",
-        "",
-        "/**",
-        " * Get the name of the currently active locale.",
-        " * @return Locale name string, or NULL if not initialized",
-        " */",
-        "const char * lv_i18n_get_current_locale(void);",
-        "",
-        "#ifdef __cplusplus",
-        "} /* extern \"C\" */",
-        "#endif",
-        "",
-        "#endif /* LV_I18N_TRANSLATIONS_H */",
-        "",
-    ]
-
-    return "\n".join(lines)
+    # Fixed content: the tables themselves live in the .c file
+    return (
+        "// SPDX-License-Identifier: GPL-3.0-or-later\n"
+        "// Auto-generated by generate_translations.py - DO NOT EDIT\n"
+        "\n"
+        "#ifndef LV_I18N_TRANSLATIONS_H\n"
+        "#define LV_I18N_TRANSLATIONS_H\n"
+        "\n"
+        "#ifdef __cplusplus\n"
+        'extern "C" {\n'
+        "#endif\n"
+        "\n"
+        "#include <stdint.h>\n"
+        "\n"
+        "////////////////////////////////////////////////////////////////////////////////\n"
+        "\n"
+        "typedef enum {\n"
+        "    LV_I18N_PLURAL_TYPE_ZERO,\n"
+        "    LV_I18N_PLURAL_TYPE_ONE,\n"
+        "    LV_I18N_PLURAL_TYPE_TWO,\n"
+        "    LV_I18N_PLURAL_TYPE_FEW,\n"
+        "    LV_I18N_PLURAL_TYPE_MANY,\n"
+        "    LV_I18N_PLURAL_TYPE_OTHER,\n"
+        "    _LV_I18N_PLURAL_TYPE_NUM,\n"
+        "} lv_i18n_plural_type_t;\n"
+        "\n"
+        "typedef struct {\n"
+        "    const char * locale_name;\n"
+        "    const char * * singulars;\n"
+        "    const char * * plurals[_LV_I18N_PLURAL_TYPE_NUM];\n"
+        "    uint8_t (*locale_plural_fn)(int32_t num);\n"
+        "} lv_i18n_lang_t;\n"
+        "\n"
+        "typedef const lv_i18n_lang_t * lv_i18n_language_pack_t;\n"
+        "\n"
+        "extern const lv_i18n_language_pack_t lv_i18n_language_pack[];\n"
+        "\n"
+        "/**\n"
+        " * Initialize the lv_i18n translation system with a language pack.\n"
+        " * @param langs Pointer to the array of languages (last element must be NULL)\n"
+        " * @return 0 on success, -1 on error\n"
+        " */\n"
+        "int lv_i18n_init(const lv_i18n_language_pack_t * langs);\n"
+        "\n"
+        "/**\n"
+        " * Change the current locale (language).\n"
+        " * @param l_name Name of the locale to use (e.g., \"en\", \"de\", \"fr\")\n"
+        " * @return 0 on success, -1 if locale not found\n"
+        " */\n"
+        "int lv_i18n_set_locale(const char * l_name);\n"
+        "\n"
+        "/**\n"
+        " * Get the name of the currently active locale.\n"
+        " * @return Locale name string, or NULL if not initialized\n"
+        " */\n"
+        "const char * lv_i18n_get_current_locale(void);\n"
+        "\n"
+        "#ifdef __cplusplus\n"
+        "} /* extern \"C\" */\n"
+        "#endif\n"
+        "\n"
+        "#endif /* LV_I18N_TRANSLATIONS_H */\n"
+    )
 
 
 # =============================================================================
@@ -616,6 +677,15 @@ def validate_key_consistency(
 # =============================================================================
 
 
+def _load_translation_file(yaml_file: Path) -> tuple[str, dict[str, Any]]:
+    """Parse one YAML translation file into (locale, translations)."""
+    # Let the parser read the stream itself rather than decoding the
+    # whole file into a str first
+    with open(yaml_file, "rb") as f:
+        parsed = parse_yaml_content(f)
+    return parsed["locale"], parsed["translations"]
+
+
 def load_translations_from_directory(path: Path) -> dict[str, dict[str, Any]]:
     """
     Load all YAML translation files from a directory.
@@ -626,37 +696,48 @@ def load_translations_from_directory(path: Path) -> dict[str, dict[str, Any]]:
     Returns:
         Dict of {locale: {key: value, ...}, ...}
     """
-    result = {}
-    path = Path(path)
-
-    for yaml_file in path.glob("*.yml"):
-        content = yaml_file.read_text(encoding="utf-8")
-        parsed = parse_yaml_content(content)
-        locale = parsed["locale"]
-        result[locale] = parsed["translations"]
+    # scandir reuses the directory entry's type info instead of a stat per file
+    with os.scandir(path) as it:
+        yaml_files = [
+            Path(entry.path)
+            for entry in it
+            if entry.name.endswith(".yml") and entry.is_file()
+        ]
+    if not yaml_files:
+        return {}
 
-    return result
+    # Locale files are independent; overlap their reads and parses
+    workers = min(8, os.cpu_count() or 1, len(yaml_files))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(_load_translation_file, yaml_files))
 
 
-def write_xml_file(translations: dict[str, dict[str, str]], output_path: Path) -> None:
+def write_xml_file(
+    translations: dict[str, dict[str, str]],
+    output_path: Path,
+    index: _TranslationIndex | None = None,
+) -> None:
     """
     Write translations to an XML file.
 
     Args:
         translations: Dict of {locale: {key: value, ...}, ...}
         output_path: Path to write the XML file
+        index: Optional precomputed index, passed to generate_lvgl_xml
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    xml_content = generate_lvgl_xml(translations)
-    output_path.write_text(xml_content, encoding="utf-8")
+    # Stream straight to disk rather than building the whole file in memory
+    with open(output_path, "w", encoding="utf-8") as f:
+        stream_lvgl_xml(translations, f, index)
 
 
 def write_lv_i18n_files(
     singulars: dict[str, dict[str, str]],
     plurals: dict[str, dict[str, dict[str, str]]],
     output_dir: Path,
+    index: _TranslationIndex | None = None,
 ) -> None:
     """
     Write lv_i18n C source and header files.
@@ -665,14 +746,16 @@ def write_lv_i18n_files(
         singulars: Dict of {locale: {key: value, ...}, ...} for singular translations
         plurals: Dict of {locale: {key: {form: value, ...}, ...}, ...} for plural translations
         output_dir: Directory to write the files
+        index: Optional precomputed index, passed to generate_lv_i18n_c
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    c_content = generate_lv_i18n_c(singulars, plurals)
-    h_content = generate_lv_i18n_h(singulars, plurals)
+    # Stream the (large) C source straight to disk
+    with open(output_dir / "lv_i18n_translations.c", "w", encoding="utf-8") as f:
+        stream_lv_i18n_c(singulars, plurals, f, index)
 
-    (output_dir / "lv_i18n_translations.c").write_text(c_content, encoding="utf-8")
+    h_content = generate_lv_i18n_h(singulars, plurals)
     (output_dir / "lv_i18n_translations.h").write_text(h_content, encoding="utf-8")
 
 
@@ -734,20 +817,22 @@ def generate_all(
 
     # Check for missing translations
     missing = find_missing_translations(singulars, base_locale)
-    if missing:
-        for locale, keys in missing.items():
-            for key in keys:
-                result.warnings.append(f"Missing '{key}' in {locale}")
+    for locale, keys in missing.items():
+        # One line per locale rather than one per missing key
+        result.warnings.append(f"Missing in {locale} ({len(keys)}): {', '.join(keys)}")
 
     # Validate key consistency
     issues = validate_key_consistency(translations, base_locale)
     result.warnings.extend(issues)
 
+    # Sort locales and keys once for both outputs
+    index = _index_translations(singulars, plurals)
+
     # Generate XML
-    write_xml_file(singulars, xml_output_dir / "translations.xml")
+    write_xml_file(singulars, xml_output_dir / "translations.xml", index)
 
     # Generate C code
-    write_lv_i18n_files(singulars, plurals, c_output_dir)
+    write_lv_i18n_files(singulars, plurals, c_output_dir, index)
 
     return result
 
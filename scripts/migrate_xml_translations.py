@@ -24,6 +24,26 @@ from typing import NamedTuple
 import xml.etree.ElementTree as ET
 
 
+# Map of attribute names to their corresponding tag attribute names
+# Format: attr_name -> tag_attr_name
+TEXT_ATTR_TAGS = {
+    'text': 'translation_tag',
+    'placeholder_text': 'placeholder_tag',
+    'label': 'label_tag',
+    'title': 'title_tag',
+    'description': 'description_tag',
+    'message': 'message_tag',
+    'value': 'value_tag',  # for setting_info_row
+}
+
+# Patterns used per attribute, compiled once
+TEXT_ATTR_RE = re.compile(rf'\b({"|".join(TEXT_ATTR_TAGS)})="([^"]*)"')
+ELEMENT_END_RE = re.compile(r'/?>')
+NUMERIC_RE = re.compile(r'^-?\d+(\.\d+)?$')
+HEX_RE = re.compile(r'^0x[0-9a-fA-F]+$')
+PERCENT_RE = re.compile(r'^-?\d+%$')
+
+
 class Migration(NamedTuple):
     """A single migration change."""
     file: Path
@@ -63,15 +83,15 @@ def should_skip_text(text: str) -> bool:
         return True
 
     # Skip pure numeric values
-    if re.match(r'^-?\d+(\.\d+)?$', text):
+    if NUMERIC_RE.match(text):
         return True
 
     # Skip things that look like CSS/hex colors
-    if re.match(r'^0x[0-9a-fA-F]+$', text):
+    if HEX_RE.match(text):
         return True
 
     # Skip percentage values
-    if re.match(r'^-?\d+%$', text):
+    if PERCENT_RE.match(text):
         return True
 
     # Skip obviously technical strings (file paths, etc)
@@ -99,28 +119,12 @@ def find_text_attributes(content: str) -> list[tuple[int, int, str, str, str]]:
     """
     results = []
 
-    # Map of attribute names to their corresponding tag attribute names
-    # Format: attr_name -> tag_attr_name
-    attr_map = {
-        'text': 'translation_tag',
-        'placeholder_text': 'placeholder_tag',
-        'label': 'label_tag',
-        'title': 'title_tag',
-        'description': 'description_tag',
-        'message': 'message_tag',
-        'value': 'value_tag',  # for setting_info_row
-    }
-
-    # Build regex pattern for all attribute names
-    attr_names = '|'.join(attr_map.keys())
-    pattern = rf'\b({attr_names})="([^"]*)"'
-
-    for match in re.finditer(pattern, content):
+    for match in TEXT_ATTR_RE.finditer(content):
         attr_name = match.group(1)
         text_value = match.group(2)
         start = match.start()
         end = match.end()
-        tag_attr = attr_map[attr_name]
+        tag_attr = TEXT_ATTR_TAGS[attr_name]
         results.append((start, end, attr_name, text_value, tag_attr))
 
     return results
@@ -128,16 +132,13 @@ def find_text_attributes(content: str) -> list[tuple[int, int, str, str, str]]:
 
 def already_has_tag_attr(content: str, text_attr_end: int, tag_attr_name: str) -> bool:
     """Check if the element already has the corresponding tag attribute."""
-    # Look ahead in the same element (up to the closing > or />)
-    remaining = content[text_attr_end:]
-
-    # Find the end of this element/tag
-    close_match = re.search(r'/?>', remaining)
+    # Look ahead in the same element (up to the closing > or />), searching
+    # in place rather than slicing off the rest of the file per attribute
+    close_match = ELEMENT_END_RE.search(content, text_attr_end)
     if not close_match:
         return False
 
-    element_rest = remaining[:close_match.start()]
-    return f'{tag_attr_name}=' in element_rest
+    return content.find(f'{tag_attr_name}=', text_attr_end, close_match.start()) != -1
 
 
 def migrate_file(
@@ -19,18 +19,33 @@ import argparse
 import hashlib
 import json
 import os
+import re
 import sys
 import urllib.request
 import urllib.error
-from bisect import bisect_right
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    from json import loads as _json_loads
 
 
 # ---------------------------------------------------------------------------
 # Symbol table
 # ---------------------------------------------------------------------------
 
+_TEXT_SYMBOL_RE = re.compile(r"^[ \t]*([0-9a-fA-F]+)[ \t]+[TtWw][ \t]+(\S.*)$", re.MULTILINE)
+
+
 class SymbolTable:
     """Parsed nm -nC output with binary-search lookup."""
 
@@ -47,62 +62,93 @@ class SymbolTable:
         "completed.0",
     })
 
-    def __init__(self, entries: list[tuple[int, str]]):
-        # entries: sorted list of (address, demangled_name)
-        self.addrs = [a for a, _ in entries]
-        self.names = [n for _, n in entries]
+    def __init__(self, addrs: np.ndarray, names: list[str]):
+        # addrs: sorted int64 addresses, names: matching demangled names.
+        # Garbage symbols are blanked once here so lookups skip the set probe.
+        self.addrs = addrs
+        self.names = ["" if n in self.GARBAGE_SYMBOLS else n for n in names]
         self.crash_handler_offset: Optional[int] = None
         self._find_crash_handler()
 
     @classmethod
     def from_file(cls, path: Path) -> "SymbolTable":
-        entries: list[tuple[int, str]] = []
-        with open(path, "r") as f:
-            for line in f:
-                line = line.rstrip("\n")
-                if not line:
-                    continue
-                # nm output: "00000000004xxxxx T function_name" or
-                # "                 U external_symbol"
-                parts = line.split(None, 2)
-                if len(parts) < 3:
-                    continue
-                addr_str, sym_type, name = parts[0], parts[1], parts[2]
-                # Only keep text (code) symbols
-                if sym_type not in ("T", "t", "W", "w"):
-                    continue
-                try:
-                    addr = int(addr_str, 16)
-                except ValueError:
-                    continue
-                if addr == 0:
-                    continue
-                entries.append((addr, name))
-        entries.sort(key=lambda x: x[0])
-        return cls(entries)
+        # nm output: "00000000004xxxxx T function_name" or
+        # "                 U external_symbol". Only text (code) symbols match.
+        entries = [
+            (addr, name)
+            for addr_str, name in _TEXT_SYMBOL_RE.findall(path.read_text())
+            if (addr := int(addr_str, 16))
+        ]
+        entries.sort(key=itemgetter(0))
+        addrs = np.fromiter((a for a, _ in entries), dtype=np.int64, count=len(entries))
+        return cls(addrs, [n for _, n in entries])
+
+    @classmethod
+    def load(cls, path: Path) -> "SymbolTable":
+        """Like from_file(), but reuses a pre-parsed .sym.npz copy when current.
+
+        The copy records the .sym file's size and mtime, so a re-downloaded
+        file is parsed again.
+        """
+        st = path.stat()
+        stamp = [st.st_size, st.st_mtime_ns]
+        npz_path = path.with_name(path.name + ".npz")
+        try:
+            with np.load(npz_path) as data:
+                if data["stamp"].tolist() == stamp:
+                    return cls(data["addrs"], data["names"].tobytes().decode().split("\n"))
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            pass
+
+        table = cls.from_file(path)
+        if len(table.addrs):
+            # Names never contain newlines (one nm line each), so store them
+            # as one joined UTF-8 blob instead of a pickled object array.
+            names = np.frombuffer("\n".join(table.names).encode(), dtype=np.uint8)
+            try:
+                np.savez(npz_path, stamp=np.array(stamp, dtype=np.int64), addrs=table.addrs, names=names)
+            except OSError:
+                pass
+        return table
 
     def _find_crash_handler(self) -> None:
-        for addr, name in zip(self.addrs, self.names):
+        for idx, name in enumerate(self.names):
             if "crash_signal_handler" in name:
-                self.crash_handler_offset = addr
+                self.crash_handler_offset = int(self.addrs[idx])
                 return
 
     def lookup(self, file_offset: int) -> str:
         """Resolve a file offset to 'func_name+0xNN'."""
-        if not self.addrs:
-            return f"0x{file_offset:x}"
-        idx = bisect_right(self.addrs, file_offset) - 1
+        return self.lookup_many([file_offset])[0]
+
+    def lookup_many(self, file_offsets: list[int]) -> list[str]:
+        """Resolve many file offsets with a single searchsorted call."""
+        if not len(self.addrs):
+            return [f"0x{off:x}" for off in file_offsets]
+        # Clamp into the table's range so out-of-range offsets (negative, or
+        # past int64 with a bogus platform) still land on the right index.
+        lo = int(self.addrs[0]) - 1
+        hi = int(self.addrs[-1])
+        clamped = np.fromiter(
+            (min(max(off, lo), hi) for off in file_offsets),
+            dtype=np.int64,
+            count=len(file_offsets),
+        )
+        idxs = np.searchsorted(self.addrs, clamped, side="right") - 1
+        return [self._format(off, idx) for off, idx in zip(file_offsets, idxs.tolist())]
+
+    def _format(self, file_offset: int, idx: int) -> str:
         if idx < 0:
             return f"0x{file_offset:x}"
-        base = self.addrs[idx]
+        base = int(self.addrs[idx])
         name = self.names[idx]
-        # Filter garbage linker boundary symbols (data_start, _edata, etc.)
-        if name in self.GARBAGE_SYMBOLS:
+        # Garbage linker boundary symbols (data_start, _edata, etc.)
+        if not name:
             return f"(unknown @ 0x{file_offset:x})"
         offset = file_offset - base
         if offset == 0:
             return name
-        return f"{name}+0x{offset:x}"
+        return sys.intern(f"{name}+0x{offset:x}")
 
 
 # ---------------------------------------------------------------------------
@@ -119,11 +165,68 @@ class SymbolCache:
     def __init__(self):
         self._tables: dict[str, Optional[SymbolTable]] = {}
         self._warnings: list[str] = []
+        self._download_errors: dict[str, str] = {}
+        self._fetched: set[str] = set()  # keys downloaded during this run
 
     @property
     def warnings(self) -> list[str]:
         return self._warnings
 
+    def prefetch(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Download symbol files for several (version, platform) pairs concurrently.
+
+        Failures are reported by get() when the pair is first requested.
+        """
+        missing = []
+        for version, platform in dict.fromkeys(pairs):
+            key = f"{version}/{platform}"
+            if key in self._tables or key in self._download_errors:
+                continue
+            if not (CACHE_DIR / f"v{version}" / f"{platform}.sym").exists():
+                print(f"  Downloading symbols for v{version}/{platform}...", file=sys.stderr)
+                missing.append((version, platform))
+        if not missing:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool:
+            errors = list(pool.map(lambda pair: self._download(*pair), missing))
+        for (version, platform), error in zip(missing, errors):
+            if error:
+                self._download_errors[f"{version}/{platform}"] = error
+
+    def _download(self, version: str, platform: str) -> Optional[str]:
+        """Fetch one .sym file into the cache. Returns a warning on failure.
+
+        If the file is already cached with a stored ETag, the request is
+        conditional and a 304 leaves the cached copy in place.
+        """
+        sym_path = CACHE_DIR / f"v{version}" / f"{platform}.sym"
+        etag_path = sym_path.with_name(sym_path.name + ".etag")
+        sym_path.parent.mkdir(parents=True, exist_ok=True)
+        url = f"{R2_BASE_URL}/v{version}/{platform}.sym"
+        headers = {"User-Agent": "helixscreen-crashes/1.0"}
+        if sym_path.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text().strip()
+        try:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req) as resp:
+                body = resp.read()
+                etag = resp.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            return f"v{version}/{platform}: symbols not available (HTTP {e.code})"
+        except urllib.error.URLError as e:
+            return f"v{version}/{platform}: download failed ({e.reason})"
+
+        self._fetched.add(f"{version}/{platform}")
+        sym_path.write_bytes(body)
+        if etag:
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
+        return None
+
     def get(self, version: str, platform: str) -> Optional[SymbolTable]:
         key = f"{version}/{platform}"
         if key in self._tables:
@@ -131,23 +234,20 @@ class SymbolCache:
 
         sym_path = CACHE_DIR / f"v{version}" / f"{platform}.sym"
 
-        # Download if not cached
-        if not sym_path.exists():
-            sym_path.parent.mkdir(parents=True, exist_ok=True)
-            url = f"{R2_BASE_URL}/v{version}/{platform}.sym"
-            try:
-                print(f"  Downloading symbols for v{version}/{platform}...", file=sys.stderr)
-                req = urllib.request.Request(url, headers={"User-Agent": "helixscreen-crashes/1.0"})
-                with urllib.request.urlopen(req) as resp, open(sym_path, "wb") as out:
-                    out.write(resp.read())
-            except urllib.error.HTTPError as e:
-                self._warnings.append(f"v{version}/{platform}: symbols not available (HTTP {e.code})")
-                self._tables[key] = None
-                return None
-            except urllib.error.URLError as e:
-                self._warnings.append(f"v{version}/{platform}: download failed ({e.reason})")
-                self._tables[key] = None
-                return None
+        # Download if not cached (or report a failed prefetch)
+        error = self._download_errors.pop(key, None)
+        if error is None and not sym_path.exists():
+            print(f"  Downloading symbols for v{version}/{platform}...", file=sys.stderr)
+            error = self._download(version, platform)
+        elif error is None and key not in self._fetched and sym_path.stat().st_size == 0:
+            # Released symbols never change, but a broken (empty) upload may
+            # have been fixed since. Re-check it; unchanged costs only a 304.
+            print(f"  Re-checking empty symbols for v{version}/{platform}...", file=sys.stderr)
+            self._download(version, platform)
+        if error:
+            self._warnings.append(error)
+            self._tables[key] = None
+            return None
 
         # Validate non-empty
         if sym_path.stat().st_size == 0:
@@ -155,8 +255,8 @@ class SymbolCache:
             self._tables[key] = None
             return None
 
-        table = SymbolTable.from_file(sym_path)
-        if not table.addrs:
+        table = SymbolTable.load(sym_path)
+        if not len(table.addrs):
             self._warnings.append(f"v{version}/{platform}: no text symbols found in .sym file")
             self._tables[key] = None
             return None
@@ -178,18 +278,22 @@ def is_shared_lib_addr(addr: int, platform: str) -> bool:
     aarch64 (pi): binary at 0x0000aaaa..., shared libs at 0x0000ffff...
     armhf (pi32): binary at low addresses, shared libs at 0xf0000000+
     """
+    return shared_lib_test(platform)(addr)
+
+
+def shared_lib_test(platform: str) -> Callable[[int], bool]:
+    """is_shared_lib_addr() with the platform check done once up front."""
     if platform in ("pi", "rpi4_64bit"):
         # aarch64 PIE: our binary is loaded at 0x0000aaaa_XXXXXXXX
         # Shared libs live at 0x0000ffff_XXXXXXXX
-        top_word = (addr >> 32) & 0xFFFF
-        return top_word >= 0xFFFF
-    elif platform == "pi32":
+        return lambda addr: (addr >> 32) & 0xFFFF >= 0xFFFF
+    if platform == "pi32":
         # armhf: shared libs mapped at 0xf0000000+
-        return addr >= 0xF0000000
-    return False
+        return lambda addr: addr >= 0xF0000000
+    return lambda addr: False
 
 
-def detect_platform_from_addrs(backtrace: list[int]) -> str:
+def detect_platform_from_addrs(backtrace: Iterable[int]) -> str:
     """Heuristic: 64-bit pi addresses have 0xaaaa or 0xffff in upper bits."""
     for addr in backtrace:
         if addr > 0xFFFFFFFF:
@@ -197,66 +301,80 @@ def detect_platform_from_addrs(backtrace: list[int]) -> str:
     return "pi32"
 
 
+class Frame:
+    """One resolved backtrace frame (slotted: a run keeps thousands of these)."""
+
+    __slots__ = ("addr", "resolved", "is_shared_lib")
+
+    def __init__(self, addr: str, resolved: str, is_shared_lib: bool):
+        self.addr = addr
+        self.resolved = resolved
+        self.is_shared_lib = is_shared_lib
+
+    def as_dict(self) -> dict:
+        return {"addr": self.addr, "resolved": self.resolved, "is_shared_lib": self.is_shared_lib}
+
+
 def resolve_backtrace(
     backtrace: list[str],
     platform: str,
     symbols: Optional[SymbolTable],
-) -> list[dict]:
-    """Resolve a crash backtrace to named frames.
+) -> list[Frame]:
+    """Resolve a crash backtrace to named frames."""
+    return resolve_backtraces([backtrace], platform, symbols)[0]
 
-    Returns list of {addr, resolved, is_shared_lib} dicts.
-    """
-    if not backtrace:
-        return []
 
-    addrs = []
-    for addr_str in backtrace:
-        try:
-            addrs.append(int(addr_str, 16))
-        except ValueError:
-            addrs.append(0)
+def resolve_backtraces(
+    backtraces: list[list[str]],
+    platform: str,
+    symbols: Optional[SymbolTable],
+) -> list[list[Frame]]:
+    """Resolve several backtraces that share one symbol table.
 
-    frames: list[dict] = []
+    All file offsets are looked up in one batch; see resolve_backtrace().
+    """
+    is_lib_addr = shared_lib_test(platform)
+    parsed: list[list[tuple[int, bool]]] = []
+    for backtrace in backtraces:
+        addrs = []
+        for addr_str in backtrace:
+            try:
+                addr = int(addr_str, 16)
+            except ValueError:
+                addr = 0
+            addrs.append((addr, is_lib_addr(addr)))
+        parsed.append(addrs)
 
     if symbols is None or symbols.crash_handler_offset is None:
         # Can't resolve — return raw addresses
-        for i, addr in enumerate(addrs):
-            is_lib = is_shared_lib_addr(addr, platform)
-            frames.append({
-                "addr": f"0x{addr:x}",
-                "resolved": "<shared lib>" if is_lib else f"0x{addr:x}",
-                "is_shared_lib": is_lib,
-            })
-        return frames
+        return [
+            [Frame(f"0x{addr:x}", "<shared lib>" if is_lib else f"0x{addr:x}", is_lib) for addr, is_lib in addrs]
+            for addrs in parsed
+        ]
 
     # Frame 0 is crash_signal_handler — use it to compute ASLR base
-    base_address = addrs[0] - symbols.crash_handler_offset
-
-    for i, addr in enumerate(addrs):
-        is_lib = is_shared_lib_addr(addr, platform)
-        if is_lib:
-            frames.append({
-                "addr": f"0x{addr:x}",
-                "resolved": "<shared lib>",
-                "is_shared_lib": True,
-            })
-        else:
-            file_offset = addr - base_address
-            resolved = symbols.lookup(file_offset)
-            frames.append({
-                "addr": f"0x{addr:x}",
-                "resolved": resolved,
-                "is_shared_lib": False,
-            })
+    offsets: list[int] = []
+    for addrs in parsed:
+        if not addrs:
+            continue
+        base_address = addrs[0][0] - symbols.crash_handler_offset
+        offsets.extend(addr - base_address for addr, is_lib in addrs if not is_lib)
+    names = iter(symbols.lookup_many(offsets))
 
-    return frames
+    results = []
+    for addrs in parsed:
+        results.append([
+            Frame(f"0x{addr:x}", "<shared lib>" if is_lib else next(names), is_lib)
+            for addr, is_lib in addrs
+        ])
+    return results
 
 
 # ---------------------------------------------------------------------------
 # Stack signature
 # ---------------------------------------------------------------------------
 
-def compute_signature(frames: list[dict]) -> str:
+def compute_signature(frames: list[Frame]) -> str:
     """Hash resolved function names (no offsets) to group identical crashes.
 
     Skips frame 0 (crash_signal_handler) and shared lib frames.
@@ -266,7 +384,7 @@ def compute_signature(frames: list[dict]) -> str:
     sig_parts = []
     # Check if we have resolved symbols (any frame has a non-hex name)
     has_symbols = any(
-        not f["is_shared_lib"] and not f["resolved"].startswith("0x")
+        not f.is_shared_lib and not f.resolved.startswith("0x")
         for f in frames[1:]  # skip frame 0
     )
 
@@ -274,9 +392,9 @@ def compute_signature(frames: list[dict]) -> str:
         for i, frame in enumerate(frames):
             if i == 0:
                 continue
-            if frame["is_shared_lib"]:
+            if frame.is_shared_lib:
                 continue
-            name = frame["resolved"]
+            name = frame.resolved
             plus_idx = name.rfind("+0x")
             if plus_idx > 0:
                 name = name[:plus_idx]
@@ -286,9 +404,9 @@ def compute_signature(frames: list[dict]) -> str:
         # This makes ASLR-randomized addresses produce the same signature
         base_addr = None
         for frame in frames:
-            if not frame["is_shared_lib"]:
+            if not frame.is_shared_lib:
                 try:
-                    base_addr = int(frame["addr"], 16)
+                    base_addr = int(frame.addr, 16)
                 except ValueError:
                     pass
                 break
@@ -296,18 +414,24 @@ def compute_signature(frames: list[dict]) -> str:
             for i, frame in enumerate(frames):
                 if i == 0:
                     continue
-                if frame["is_shared_lib"]:
+                if frame.is_shared_lib:
                     continue
                 try:
-                    addr = int(frame["addr"], 16)
+                    addr = int(frame.addr, 16)
                     rel = addr - base_addr
                     sig_parts.append(f"rel+{rel:#x}")
                 except ValueError:
-                    sig_parts.append(frame["resolved"])
+                    sig_parts.append(frame.resolved)
 
     if not sig_parts:
         return "unknown"
 
+    return _signature_hash(tuple(sig_parts))
+
+
+@lru_cache(maxsize=None)
+def _signature_hash(sig_parts: tuple[str, ...]) -> str:
+    # Most crashes in a batch share a handful of stacks, so memoize by parts
     sig_str = "\n".join(sig_parts)
     return hashlib.sha256(sig_str.encode()).hexdigest()[:8]
 
@@ -325,14 +449,84 @@ def find_project_root() -> Path:
     return Path.cwd()
 
 
+def _find_json_files(root: str) -> list[str]:
+    """Recursive *.json listing with os.scandir, ordered like sorted(rglob())."""
+    found: list[str] = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        found.append(entry.path)
+        except OSError:
+            continue
+    # Path ordering compares component by component, not the raw string
+    found.sort(key=lambda p: p.split(os.sep))
+    return found
+
+
+_UTC_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T[\d:.]+(?:Z|\+00:00)$")
+
+# Below this many files the process pool costs more than it saves
+PARALLEL_LOAD_MIN_FILES = 200
+
+
+def _load_event_file(
+    fpath: str,
+    since_dt: Optional[datetime],
+    until_dt: Optional[datetime],
+) -> tuple[list[dict], list[dict]]:
+    """Parse one event file and apply the date filter. Returns (crashes, sessions)."""
+    crashes: list[dict] = []
+    sessions: list[dict] = []
+    try:
+        with open(fpath, "rb") as f:
+            data = _json_loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return crashes, sessions
+
+    since_day = since_dt.date().isoformat() if since_dt else None
+    until_day = until_dt.date().isoformat() if until_dt else None
+
+    events = data if isinstance(data, list) else [data]
+    for ev in events:
+        # Date filter
+        ts_str = ev.get("timestamp")
+        if ts_str and (since_dt or until_dt):
+            if _UTC_TIMESTAMP_RE.match(ts_str):
+                # UTC ISO-8601 timestamps sort as strings, so the date prefix
+                # is enough to compare against whole-day bounds
+                day = ts_str[:10]
+                if since_day and day < since_day:
+                    continue
+                if until_day and day > until_day:
+                    continue
+            else:
+                try:
+                    ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+                    if since_dt and ts < since_dt:
+                        continue
+                    if until_dt and ts > until_dt:
+                        continue
+                except ValueError:
+                    pass
+
+        if ev.get("event") == "crash":
+            crashes.append(ev)
+        elif ev.get("event") == "session":
+            sessions.append(ev)
+    return crashes, sessions
+
+
 def load_events(
     data_dir: str,
     since: Optional[str] = None,
     until: Optional[str] = None,
 ) -> tuple[list[dict], list[dict]]:
     """Load crash and session events. Returns (crashes, sessions)."""
-    from datetime import datetime, timezone
-
     data_path = Path(data_dir)
     if not data_path.exists():
         print(f"Data directory not found: {data_path}", file=sys.stderr)
@@ -340,7 +534,6 @@ def load_events(
 
     crashes: list[dict] = []
     sessions: list[dict] = []
-    file_count = 0
 
     # Parse date filters
     since_dt = None
@@ -352,34 +545,21 @@ def load_events(
         # Include the entire "until" day
         until_dt = until_dt.replace(hour=23, minute=59, second=59)
 
-    for fpath in sorted(data_path.rglob("*.json")):
-        file_count += 1
-        try:
-            with open(fpath, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            continue
-
-        events = data if isinstance(data, list) else [data]
-        for ev in events:
-            # Date filter
-            ts_str = ev.get("timestamp")
-            if ts_str and (since_dt or until_dt):
-                try:
-                    ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                    if since_dt and ts < since_dt:
-                        continue
-                    if until_dt and ts > until_dt:
-                        continue
-                except ValueError:
-                    pass
+    paths = _find_json_files(str(data_path))
+    load = partial(_load_event_file, since_dt=since_dt, until_dt=until_dt)
+    if len(paths) < PARALLEL_LOAD_MIN_FILES:
+        results = list(map(load, paths))
+    else:
+        # JSON parsing is CPU-bound; map() keeps results in file order
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(load, paths, chunksize=max(1, len(paths) // (workers * 4))))
 
-            if ev.get("event") == "crash":
-                crashes.append(ev)
-            elif ev.get("event") == "session":
-                sessions.append(ev)
+    for file_crashes, file_sessions in results:
+        crashes.extend(file_crashes)
+        sessions.extend(file_sessions)
 
-    print(f"Loaded {len(crashes)} crashes, {len(sessions)} sessions from {file_count} files", file=sys.stderr)
+    print(f"Loaded {len(crashes)} crashes, {len(sessions)} sessions from {len(paths)} files", file=sys.stderr)
     return crashes, sessions
 
 
@@ -412,21 +592,42 @@ def get_platform(
     did = crash.get("device_id", "")
     if did in device_map:
         return device_map[did]
-    # Fallback: heuristic from addresses
-    bt = crash.get("backtrace", [])
-    addrs = []
-    for a in bt:
+    # Fallback: heuristic from addresses. Parsed lazily so the usual 64-bit
+    # case stops at the first frame.
+    return detect_platform_from_addrs(_parse_hex_addrs(crash.get("backtrace", [])))
+
+
+def _parse_hex_addrs(backtrace: list[str]) -> Iterator[int]:
+    """Yield the parseable hex addresses of a backtrace, skipping the rest."""
+    for a in backtrace:
         try:
-            addrs.append(int(a, 16))
+            yield int(a, 16)
         except ValueError:
             pass
-    return detect_platform_from_addrs(addrs)
 
 
 # ---------------------------------------------------------------------------
 # Analysis
 # ---------------------------------------------------------------------------
 
+def top_function(frames: list[Frame]) -> str:
+    """Top-of-stack preview: first non-handler, non-shared-lib resolved frame."""
+    for frame in frames[1:]:
+        if not frame.is_shared_lib and not frame.resolved.startswith("0x"):
+            top_func = frame.resolved
+            # Strip offset for preview
+            plus_idx = top_func.rfind("+0x")
+            if plus_idx > 0:
+                top_func = top_func[:plus_idx]
+            return top_func
+    return "?"
+
+
+def _intern(value):
+    """Share one string object per distinct value across thousands of crashes."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def analyze_crashes(
     crashes: list[dict],
     sessions: list[dict],
@@ -444,21 +645,32 @@ def analyze_crashes(
 
     signatures: dict[str, dict] = {}  # sig_hash → group info
 
-    for crash in crashes:
-        version = crash.get("app_version", "unknown")
-        platform = get_platform(crash, device_map, platform_override)
-        backtrace = crash.get("backtrace", [])
+    # Resolve backtraces in one batch per (version, platform) symbol table
+    crash_keys: list[tuple[str, str]] = []
+    buckets: dict[tuple[str, str], list[int]] = {}
+    for i, crash in enumerate(crashes):
+        key = (
+            _intern(crash.get("app_version", "unknown")),
+            _intern(get_platform(crash, device_map, platform_override)),
+        )
+        crash_keys.append(key)
+        buckets.setdefault(key, []).append(i)
+
+    symbol_cache.prefetch(buckets)
+    crash_frames: list[list[Frame]] = [[] for _ in crashes]
+    for (version, platform), indices in buckets.items():
+        symbols = symbol_cache.get(version, platform)
+        backtraces = [crashes[i].get("backtrace", []) for i in indices]
+        for i, frames in zip(indices, resolve_backtraces(backtraces, platform, symbols)):
+            crash_frames[i] = frames
+
+    for crash, (version, platform), frames in zip(crashes, crash_keys, crash_frames):
         device_id = crash.get("device_id", "")
+        device = _intern(device_id[:8])
         uptime = crash.get("uptime_sec", 0)
-        signal_name = crash.get("signal_name", "?")
+        signal_name = _intern(crash.get("signal_name", "?"))
         timestamp = crash.get("timestamp", "")
 
-        # Get symbols
-        symbols = symbol_cache.get(version, platform)
-
-        # Resolve backtrace
-        frames = resolve_backtrace(backtrace, platform, symbols)
-
         # Compute signature
         sig = compute_signature(frames)
 
@@ -466,42 +678,44 @@ def analyze_crashes(
         if sig_filter and not sig.startswith(sig_filter):
             continue
 
-        # Warn about pi32 shallow backtraces
-        non_lib_frames = [f for f in frames if not f["is_shared_lib"]]
-        shallow = len(non_lib_frames) <= 2
-
-        if sig not in signatures:
-            signatures[sig] = {
+        group = signatures.get(sig)
+        if group is None:
+            # Per-group columns are filled in from the instances below
+            group = signatures[sig] = {
                 "sig": sig,
                 "count": 0,
                 "signal": signal_name,
-                "versions": set(),
-                "devices": set(),
-                "platforms": set(),
-                "uptimes": [],
-                "timestamps": [],
+                "versions": None,
+                "devices": None,
+                "platforms": None,
+                "uptimes": None,
+                "timestamps": None,
                 "frames": frames,  # representative backtrace
-                "shallow": shallow,
+                "top_func": top_function(frames),
+                # Warn about pi32 shallow backtraces
+                "shallow": sum(not f.is_shared_lib for f in frames) <= 2,
                 "instances": [],
             }
 
-        group = signatures[sig]
-        group["count"] += 1
-        group["versions"].add(version)
-        group["devices"].add(device_id[:8])
-        group["platforms"].add(platform)
-        group["uptimes"].append(uptime)
-        group["timestamps"].append(timestamp)
         group["instances"].append({
             "version": version,
             "platform": platform,
-            "device": device_id[:8],
+            "device": device,
             "uptime": uptime,
             "signal": signal_name,
             "timestamp": timestamp,
             "frames": frames,
         })
 
+    for group in signatures.values():
+        instances = group["instances"]
+        group["count"] = len(instances)
+        group["versions"] = {inst["version"] for inst in instances}
+        group["devices"] = {inst["device"] for inst in instances}
+        group["platforms"] = {inst["platform"] for inst in instances}
+        group["uptimes"] = [inst["uptime"] for inst in instances]
+        group["timestamps"] = [inst["timestamp"] for inst in instances]
+
     # Sort by count descending
     sorted_sigs = sorted(signatures.values(), key=lambda g: -g["count"])
 
@@ -517,10 +731,10 @@ def analyze_crashes(
 # Output formatting
 # ---------------------------------------------------------------------------
 
-def format_frame(frame: dict, index: int) -> str:
+def format_frame(frame: Frame, index: int) -> str:
     """Format a single backtrace frame."""
     marker = "→" if index == 0 else " "
-    return f"  {marker} #{index:<2} {frame['addr']:>20s}  {frame['resolved']}"
+    return f"  {marker} #{index:<2} {frame.addr:>20s}  {frame.resolved}"
 
 
 def format_terminal(result: dict, detail: bool = False) -> str:
@@ -550,19 +764,7 @@ def format_terminal(result: dict, detail: bool = False) -> str:
         platforms = sorted(group["platforms"])
         uptimes = group["uptimes"]
 
-        # Top-of-stack preview (first non-handler, non-shared-lib frame)
-        top_func = "?"
-        for i, frame in enumerate(group["frames"]):
-            if i == 0:
-                continue
-            if not frame["is_shared_lib"] and not frame["resolved"].startswith("0x"):
-                top_func = frame["resolved"]
-                # Strip offset for preview
-                plus_idx = top_func.rfind("+0x")
-                if plus_idx > 0:
-                    top_func = top_func[:plus_idx]
-                break
-
+        top_func = group["top_func"]
         lines.append(f"  [{sig}] {count}x {signal} — {top_func}")
         lines.append(f"    versions: {', '.join(f'v{v}' for v in versions)}  |  "
                       f"platforms: {', '.join(platforms)}  |  "
@@ -606,10 +808,12 @@ def format_terminal(result: dict, detail: bool = False) -> str:
 
 
 def format_json_output(result: dict) -> str:
-    """JSON output with sets converted to lists."""
+    """JSON output with sets converted to lists and frames to objects."""
     def serialize(obj):
         if isinstance(obj, set):
             return sorted(obj)
+        if isinstance(obj, Frame):
+            return obj.as_dict()
         return str(obj)
     return json.dumps(result, indent=2, default=serialize)
 
@@ -20,29 +20,50 @@ Skips:
 - Code-like strings (paths, format strings, log messages)
 """
 
+import os
 import re
 import xml.etree.ElementTree as ET
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Set, Dict, List, Tuple, Optional
+from typing import Callable, Iterator, Set, Dict, List, Tuple, Optional, TypeVar
+
+T = TypeVar("T")
 
 # Attributes that contain translatable text
 TEXT_ATTRIBUTES = {"text", "label", "description", "title", "subtitle"}
 
+# attr="value" for each text attribute, including compound forms like
+# primary_text="value" (bind_ variants are filtered by the callers)
+TEXT_ATTRIBUTE_PATTERNS = {attr: re.compile(rf'{attr}="([^"]*)"') for attr in TEXT_ATTRIBUTES}
+
+# Line breaks, for mapping match offsets to line numbers
+NEWLINE_PATTERN = re.compile(r"\n")
+
+# A start tag up to its closing ">", stepping over quoted attribute values
+# so a ">" inside one doesn't end the tag early
+XML_START_TAG_PATTERN = re.compile(r"""<(?:[^<>"']|"[^"]*"|'[^']*')*""")
+# Attribute names within a start tag
+XML_ATTR_NAME_PATTERN = re.compile(r"""([^\s=<>/"']+)\s*=\s*(?:"[^"]*"|'[^']*')""")
+
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_SCAN_MIN_FILES = 1000
+
 # Patterns to skip
 VARIABLE_PATTERN = re.compile(r"\$\w+")  # $variable
-ICON_PATTERN = re.compile(r"^#icon_")  # #icon_xxx
 NUMERIC_PATTERN = re.compile(r"^[\d.]+%?$")  # 123 or 100%
-# XML numeric character references: &#xF0026; or &#983078;
-XML_NUMERIC_ENTITY_PATTERN = re.compile(r"&#x([0-9A-Fa-f]+);|&#(\d+);")
+# XML entities: named (&amp; etc.) and numeric character references
+# (&#xF0026; or &#983078;)
+XML_ENTITY_PATTERN = re.compile(r"&(?:(amp|lt|gt|quot|apos)|#x([0-9A-Fa-f]+)|#(\d+));")
+XML_NAMED_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
 FONT_NAME_PATTERN = re.compile(r"^(mdi_icons_|noto_sans_)\w+$")  # Font names
 HEX_COLOR_PATTERN = re.compile(r"^#[0-9A-Fa-f]{6}$")  # #RRGGBB hex colors
 SIZE_ATTR_PATTERN = re.compile(r'^size=')  # XML size attribute values
 XML_ATTR_VALUE_PATTERN = re.compile(r'(?:value|height)\s*=')  # Test/debug attribute strings
-SIGNED_NUMERIC_PATTERN = re.compile(r'^[+-]\.?\d*\.?\d*$')  # +.005, -1, +0, -.1
+SIGNED_NUMERIC_PATTERN = re.compile(r'^[+-](?!$)\.?\d*\.?\d*$')  # +.005, -1, +0, -.1 (not bare +/-)
 PAREN_TECH_PATTERN = re.compile(r'^\(.{0,8}\)$')  # Short parenthesized tech values
-CARET_DIRECTION_PATTERN = re.compile(r'^\^')  # Direction labels like ^ FRONT
 SNAKE_CASE_PATTERN = re.compile(r'^[a-z][a-z0-9]*(_[a-z0-9]+)+$')  # snake_case identifiers
-URL_PATTERN = re.compile(r'https?://')  # URLs
 MATERIAL_TEMP_PATTERN = re.compile(r'^[A-Z]+ \d+$')  # Material presets like "PLA 205", "ABS 100"
 # Temperature values: "60°C", "200°C", "210°C / 60°C", "200-230°C"
 TEMP_VALUE_PATTERN = re.compile(r'^\d[\d\-–]*°C(\s*/\s*\d+°C)?$')
@@ -51,6 +72,30 @@ MEASUREMENT_PATTERN = re.compile(r'^\d+(\.\d+)?\s*(mm|cm|g|kg|ml|l|s|ms)$')
 # Numeric data placeholders: " 0 / 0", "0 / 0"
 NUMERIC_PLACEHOLDER_PATTERN = re.compile(r'^\s*\d+\s*/\s*\d+\s*$')
 
+
+def _any_of(*patterns: re.Pattern) -> re.Pattern:
+    """Fuse anchored patterns into one alternation (one regex call instead of N)."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns))
+
+
+# Skip patterns matched against the raw text: font names, hex colors, size attributes
+TEXT_SKIP_PATTERN = _any_of(FONT_NAME_PATTERN, HEX_COLOR_PATTERN, SIZE_ATTR_PATTERN)
+# Skip patterns matched against the stripped text. The numeric ones can only
+# match text starting with a digit, sign or dot (NUMERIC_LEADING_CHARS)
+NUMERIC_SKIP_PATTERN = _any_of(
+    NUMERIC_PATTERN,
+    SIGNED_NUMERIC_PATTERN,
+    TEMP_VALUE_PATTERN,
+    MEASUREMENT_PATTERN,
+    NUMERIC_PLACEHOLDER_PATTERN,
+)
+NUMERIC_LEADING_CHARS = "+-."
+STRIPPED_SKIP_PATTERN = _any_of(
+    PAREN_TECH_PATTERN,
+    SNAKE_CASE_PATTERN,
+    MATERIAL_TEMP_PATTERN,
+)
+
 # Short tokens and non-translatable exact strings
 NON_TRANSLATABLE = {"true", "false", "xl", "lg", "md", "sm", "xs", "#RRGGBB"}
 
@@ -62,32 +107,45 @@ LANGUAGE_NAMES = {
     "Čeština", "Magyar", "Română", "Українська", "Ελληνικά",
 }
 
-# C++ patterns that indicate translatable text
+# C++ patterns that indicate translatable text, each with a literal it
+# requires so files without that call skip the regex scan entirely
 CPP_TRANSLATABLE_PATTERNS = [
     # lv_tr("text") - explicitly marked for translation (handles escaped quotes)
-    r'lv_tr\s*\(\s*"((?:[^"\\]|\\.)+)"',
+    ("lv_tr", re.compile(r'lv_tr\s*\(\s*"((?:[^"\\]|\\.)+)"')),
     # lv_label_set_text(label, "text")
-    r'lv_label_set_text\s*\([^,]+,\s*"((?:[^"\\]|\\.)+)"',
+    ("lv_label_set_text", re.compile(r'lv_label_set_text\s*\([^,]+,\s*"((?:[^"\\]|\\.)+)"')),
     # return "Status Text"  (for status strings)
-    r'return\s+"([A-Z][a-z][^"]{2,30})"',
+    ("return", re.compile(r'return\s+"([A-Z][a-z][^"]{2,30})"')),
 ]
 
 # C++ patterns to skip (not user-facing)
 CPP_SKIP_PATTERNS = [
-    r"spdlog::",  # Logging
-    r"LOG_",  # Logging macros
-    r"fmt::",  # Format strings
-    r"\.c_str\(\)",  # Variable strings
-    r"\{\}",  # Format placeholders
-    r"\\x[0-9a-fA-F]",  # Hex escapes (icons)
-    r"^[a-z_]+$",  # snake_case identifiers
-    r"^/",  # Paths
-    r"\.(cpp|h|xml|json|yml|py)$",  # File extensions
-    r"^\[",  # Log prefixes like [Application]
-    r"^https?://",  # URLs
-    r"^\d",  # Starts with digit
-    r"^%",  # Format strings
+    re.compile(r"spdlog::"),  # Logging
+    re.compile(r"LOG_"),  # Logging macros
+    re.compile(r"fmt::"),  # Format strings
+    re.compile(r"\.c_str\(\)"),  # Variable strings
+    re.compile(r"\{\}"),  # Format placeholders
+    re.compile(r"\\x[0-9a-fA-F]"),  # Hex escapes (icons)
+    re.compile(r"^[a-z_]+$"),  # snake_case identifiers
+    re.compile(r"^/"),  # Paths
+    re.compile(r"\.(cpp|h|xml|json|yml|py)$"),  # File extensions
+    re.compile(r"^\["),  # Log prefixes like [Application]
+    re.compile(r"^https?://"),  # URLs
+    re.compile(r"^\d"),  # Starts with digit
+    re.compile(r"^%"),  # Format strings
 ]
+# All of the above as one alternation, so each string is scanned once
+CPP_SKIP_PATTERN = re.compile("|".join(p.pattern for p in CPP_SKIP_PATTERNS))
+# The logging/formatting patterns, also checked against the code around a match
+CPP_CONTEXT_SKIP_PATTERNS = tuple(CPP_SKIP_PATTERNS[:4])
+
+
+def _replace_xml_entity(m: re.Match) -> str:
+    if m.group(1):  # named: &amp; etc.
+        return XML_NAMED_ENTITIES[m.group(1)]
+    if m.group(2):  # hex: &#xNNNN;
+        return chr(int(m.group(2), 16))
+    return chr(int(m.group(3)))  # decimal: &#NNNN;
 
 
 def _decode_xml_entities(text: str) -> str:
@@ -95,28 +153,18 @@ def _decode_xml_entities(text: str) -> str:
 
     Handles named entities (&amp; etc.) and numeric references
     (&#xF0026; hex, &#983078; decimal) used for icon codepoints.
+    Decoding is a single pass, so "&amp;lt;" yields "&lt;" as in XML.
     """
-    # Decode named entities
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
-    text = text.replace("&quot;", '"')
-    text = text.replace("&apos;", "'")
-
-    # Decode numeric character references (&#xHEX; and &#DECIMAL;)
-    def _replace_numeric_entity(m):
-        if m.group(1):  # hex: &#xNNNN;
-            return chr(int(m.group(1), 16))
-        else:  # decimal: &#NNNN;
-            return chr(int(m.group(2)))
-
-    text = XML_NUMERIC_ENTITY_PATTERN.sub(_replace_numeric_entity, text)
-    return text
+    if "&" not in text:
+        return text
+    return XML_ENTITY_PATTERN.sub(_replace_xml_entity, text)
 
 
+@lru_cache(maxsize=65536)
 def should_skip_text(text: str) -> bool:
     """Determine if text should be skipped (not translatable)."""
-    if not text or not text.strip():
+    stripped = text.strip()
+    if not stripped:
         return True
 
     # Skip variable references
@@ -128,17 +176,14 @@ def should_skip_text(text: str) -> bool:
         return True
 
     # Skip icon font references
-    if ICON_PATTERN.match(text):
-        return True
-
-    # Skip pure numeric values
-    if NUMERIC_PATTERN.match(text.strip()):
+    if text.startswith("#icon_"):
         return True
 
     # Skip icon codepoints (Unicode Private Use Area ranges)
     # BMP PUA: U+E000–U+F8FF, Supplementary PUA-A: U+F0000–U+FFFFD,
-    # Supplementary PUA-B: U+100000–U+10FFFD
-    if text and all(
+    # Supplementary PUA-B: U+100000–U+10FFFD. Nothing below U+E000 can
+    # qualify, which rules out ordinary text on its first character.
+    if text[0] >= "\ue000" and all(
         (0xE000 <= ord(c) <= 0xF8FF)
         or (0xF0000 <= ord(c) <= 0xFFFFD)
         or (0x100000 <= ord(c) <= 0x10FFFD)
@@ -147,11 +192,7 @@ def should_skip_text(text: str) -> bool:
         return True
 
     # Skip font names, hex colors, size attributes
-    if FONT_NAME_PATTERN.match(text):
-        return True
-    if HEX_COLOR_PATTERN.match(text):
-        return True
-    if SIZE_ATTR_PATTERN.match(text):
+    if TEXT_SKIP_PATTERN.match(text):
         return True
 
     # Skip known non-translatable tokens
@@ -163,26 +204,13 @@ def should_skip_text(text: str) -> bool:
         return True
 
     # Skip punctuation-only strings that are 3 chars or fewer
-    stripped = text.strip()
     if len(stripped) <= 3 and not any(c.isalpha() or c.isdigit() for c in stripped):
         return True
 
-    # Skip signed numeric step values like +.005, -1, +0
-    if SIGNED_NUMERIC_PATTERN.match(stripped) and stripped not in ('', '+', '-'):
-        return True
-
     # Skip language names (always displayed in native script)
     if text in LANGUAGE_NAMES:
         return True
 
-    # Skip short parenthesized technical values like (0), (2.4GHz)
-    if PAREN_TECH_PATTERN.match(stripped):
-        return True
-
-    # Skip direction labels with caret like ^ FRONT
-    if CARET_DIRECTION_PATTERN.match(stripped):
-        return True
-
     # Skip strings containing literal \n (multi-line dropdown option labels)
     if r"\n" in text:
         return True
@@ -191,43 +219,40 @@ def should_skip_text(text: str) -> bool:
     if "\n" in text:
         return True
 
-    # Skip snake_case identifiers (subject names like update_version_text)
-    if SNAKE_CASE_PATTERN.match(stripped):
-        return True
-
     # Skip strings containing URLs (shell commands, links)
-    if URL_PATTERN.search(text):
-        return True
-
-    # Skip material+temperature presets like "PLA 205", "ABS 100"
-    if MATERIAL_TEMP_PATTERN.match(stripped):
+    if "http://" in text or "https://" in text:
         return True
 
-    # Skip temperature values like "60°C", "200-230°C", "210°C / 60°C"
-    if TEMP_VALUE_PATTERN.match(stripped):
+    # Skip pure and signed numeric values (123, 100%, +.005, -1),
+    # temperatures like "200-230°C", measurements like "10mm" (unit
+    # formatting belongs to formatter utilities, not translation strings)
+    # and numeric placeholders like " 0 / 0". Most text starts with a
+    # letter, so check the first character before running the regex.
+    first = stripped[0]
+    if (first.isdigit() or first in NUMERIC_LEADING_CHARS) and NUMERIC_SKIP_PATTERN.match(stripped):
         return True
 
-    # Skip pure measurement values like "10mm", "850g" (unit formatting is locale-specific
-    # but should be handled by formatter utilities, not in translation strings)
-    if MEASUREMENT_PATTERN.match(stripped):
+    # Skip caret direction labels like ^ FRONT
+    if stripped.startswith("^"):
         return True
 
-    # Skip numeric data placeholders like " 0 / 0"
-    if NUMERIC_PLACEHOLDER_PATTERN.match(stripped):
+    # Skip short parenthesized tech values like (2.4GHz), snake_case
+    # identifiers and material presets like "PLA 205"
+    if STRIPPED_SKIP_PATTERN.match(stripped):
         return True
 
     return False
 
 
+@lru_cache(maxsize=65536)
 def should_skip_cpp_text(text: str) -> bool:
     """Determine if C++ text should be skipped (not user-facing)."""
     if should_skip_text(text):
         return True
 
     # Check against skip patterns
-    for pattern in CPP_SKIP_PATTERNS:
-        if re.search(pattern, text):
-            return True
+    if CPP_SKIP_PATTERN.search(text):
+        return True
 
     # Skip very short strings (likely not user-facing)
     if len(text) < 2:
@@ -240,6 +265,18 @@ def should_skip_cpp_text(text: str) -> bool:
     return False
 
 
+def _scan_files(scan: Callable[[Path], T], paths: List[Path]) -> List[T]:
+    """Run a per-file extractor over paths, in parallel for large trees.
+
+    Results are returned in path order either way.
+    """
+    if len(paths) < PARALLEL_SCAN_MIN_FILES:
+        return [scan(path) for path in paths]
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan, paths, chunksize=max(1, len(paths) // (workers * 4))))
+
+
 def extract_strings_from_cpp(cpp_path: Path) -> Set[str]:
     """
     Extract translatable strings from a C++ source file.
@@ -261,9 +298,11 @@ def extract_strings_from_cpp(cpp_path: Path) -> Set[str]:
         print(f"Warning: Failed to read {cpp_path}: {e}")
         return result
 
-    for pattern in CPP_TRANSLATABLE_PATTERNS:
-        is_lv_tr = "lv_tr" in pattern
-        for match in re.finditer(pattern, content):
+    for needle, pattern in CPP_TRANSLATABLE_PATTERNS:
+        if needle not in content:
+            continue
+        is_lv_tr = needle == "lv_tr"
+        for match in pattern.finditer(content):
             text = match.group(1)
 
             # lv_tr() strings are explicitly marked - always include them
@@ -272,15 +311,15 @@ def extract_strings_from_cpp(cpp_path: Path) -> Set[str]:
                     result.add(text)
                 continue
 
-            # Get surrounding context to check for skip patterns
+            # Surrounding context to check for skip patterns, searched in
+            # place rather than sliced out
             start = max(0, match.start() - 50)
             end = min(len(content), match.end() + 50)
-            context = content[start:end]
 
             # Skip if context indicates non-translatable
             skip = False
-            for skip_pattern in CPP_SKIP_PATTERNS[:4]:  # Check first few patterns on context
-                if re.search(skip_pattern, context):
+            for skip_pattern in CPP_CONTEXT_SKIP_PATTERNS:
+                if skip_pattern.search(content, start, end):
                     skip = True
                     break
 
@@ -308,84 +347,100 @@ def extract_strings_from_cpp_directory(
     """
     result = set()
 
-    patterns = ["*.cpp", "*.h"]
-    for pattern in patterns:
-        if recursive:
-            cpp_files = directory.rglob(pattern)
-        else:
-            cpp_files = directory.glob(pattern)
-
-        for cpp_path in cpp_files:
-            # Skip generated files
-            if "generated" in str(cpp_path):
-                continue
-            strings = extract_strings_from_cpp(cpp_path)
-            result.update(strings)
+    # One walk for both suffixes; generated directories are pruned whole
+    cpp_files = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if recursive and "generated" not in d]
+        cpp_files.extend(
+            Path(root) / name
+            for name in files
+            if name.endswith((".cpp", ".h")) and "generated" not in os.path.join(root, name)
+        )
+
+    for strings in _scan_files(extract_strings_from_cpp, cpp_files):
+        result.update(strings)
 
     return result
 
 
-def extract_strings_from_xml(xml_path: Path) -> Set[str]:
+def _iter_xml_strings(xml_path: Path) -> Iterator[Tuple[str, int]]:
     """
-    Extract all translatable strings from an XML file.
+    Yield (text, line_number) for each translatable string in an XML file.
 
-    Uses regex-based extraction to handle LVGL's non-standard XML syntax
-    (e.g., style_foo:state attributes with colons).
+    Shared by the set and location extractors so both apply the same
+    filtering and each file is scanned once per call.
 
     Args:
         xml_path: Path to the XML file
 
-    Returns:
-        Set of unique translatable strings
+    Yields:
+        Decoded string and the 1-based line it was found on
     """
-    result = set()
-
     try:
         with open(xml_path, "r", encoding="utf-8") as f:
             content = f.read()
     except IOError as e:
         print(f"Warning: Failed to read {xml_path}: {e}")
-        return result
-
-    # Check for bind_text on a per-element basis using regex
-    # Elements with bind_text should not have their text extracted
-    # Pattern: <tag ... bind_text="..." ... text="value" ...> or reverse order
-    # We'll extract all text attributes, then filter out those on bind_text elements
+        return
+
+    # Only run the patterns whose attr=" literal occurs in the file; pure
+    # layout/style files skip the regex scan entirely
+    patterns = [
+        pattern
+        for attr, pattern in TEXT_ATTRIBUTE_PATTERNS.items()
+        if f'{attr}="' in content
+    ]
+    if not patterns:
+        return
+
+    # Newline offsets, so a match's line number is a bisect rather than a
+    # count over everything before it
+    newlines = [m.start() for m in NEWLINE_PATTERN.finditer(content)]
 
-    # First, find all elements with bind_text (these should skip text extraction)
-    # This is a simplification - we extract text from the whole file and skip bind_text elements
-
-    for attr in TEXT_ATTRIBUTES:
+    for pattern in patterns:
         # Match attr="value" including compound forms like primary_text="value"
         # but NOT bind_attr="value" (bind_text, bind_description, etc.)
-        pattern = rf'{attr}="([^"]*)"'
-        for match in re.finditer(pattern, content):
+        for match in pattern.finditer(content):
             # Check if this is a bind_ variant (not translatable)
             prefix_start = max(0, match.start() - 5)
             prefix = content[prefix_start:match.start()]
             if prefix.endswith("bind_"):
                 continue
 
-            text = match.group(1)
-
-            # Get the line containing this match to check for bind_text
-            line_start = content.rfind("\n", 0, match.start()) + 1
-            line_end = content.find("\n", match.end())
-            if line_end == -1:
-                line_end = len(content)
-            line = content[line_start:line_end]
-
-            # Skip if this element has bind_text (overrides static text)
-            if "bind_text=" in line:
-                continue
+            # Skip if this element has bind_text (overrides static text),
+            # unless it also carries a translation_tag: the label is then
+            # translated at runtime until the binding updates it. Only the
+            # attributes of the matched start tag count, wherever they sit
+            # across its lines.
+            tag = XML_START_TAG_PATTERN.match(
+                content, content.rfind("<", 0, match.start())
+            )
+            if tag is not None and "bind_text" in tag.group():
+                attrs = set(XML_ATTR_NAME_PATTERN.findall(tag.group()))
+                if "bind_text" in attrs and "translation_tag" not in attrs:
+                    continue
 
             # Decode XML entities (named + numeric character references)
-            text = _decode_xml_entities(text)
+            text = _decode_xml_entities(match.group(1))
 
             if not should_skip_text(text):
-                result.add(text)
+                yield text, bisect_right(newlines, match.start()) + 1
 
-    return result
+
+def extract_strings_from_xml(xml_path: Path) -> Set[str]:
+    """
+    Extract all translatable strings from an XML file.
+
+    Uses regex-based extraction to handle LVGL's non-standard XML syntax
+    (e.g., style_foo:state attributes with colons).
+
+    Args:
+        xml_path: Path to the XML file
+
+    Returns:
+        Set of unique translatable strings
+    """
+    return {text for text, _ in _iter_xml_strings(xml_path)}
 
 
 def extract_strings_with_locations(xml_path: Path) -> Dict[str, List[Tuple[str, int]]]:
@@ -400,43 +455,11 @@ def extract_strings_with_locations(xml_path: Path) -> Dict[str, List[Tuple[str,
     """
     result: Dict[str, List[Tuple[str, int]]] = {}
 
-    # We need to track line numbers, so parse differently
-    # ElementTree doesn't preserve line numbers well, so we'll use a simple approach
-    try:
-        with open(xml_path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except IOError as e:
-        print(f"Warning: Failed to read {xml_path}: {e}")
-        return result
-
     filename = str(xml_path.name)
-
-    # Parse with line tracking
-    # Simple regex-based extraction for line numbers
-    for attr in TEXT_ATTRIBUTES:
-        # Match attr="value" including compound forms, but skip bind_ variants
-        pattern = rf'{attr}="([^"]*)"'
-        for match in re.finditer(pattern, content):
-            # Check if this is a bind_ variant (not translatable)
-            prefix_start = max(0, match.start() - 5)
-            prefix = content[prefix_start:match.start()]
-            if prefix.endswith("bind_"):
-                continue
-
-            text = match.group(1)
-
-            # Decode XML entities (named + numeric character references)
-            text = _decode_xml_entities(text)
-
-            if should_skip_text(text):
-                continue
-
-            # Calculate line number
-            line_num = content[: match.start()].count("\n") + 1
-
-            if text not in result:
-                result[text] = []
-            result[text].append((filename, line_num))
+    for text, line_num in _iter_xml_strings(xml_path):
+        if text not in result:
+            result[text] = []
+        result[text].append((filename, line_num))
 
     return result
 
@@ -462,8 +485,7 @@ def extract_strings_from_directory(
     else:
         xml_files = directory.glob(pattern)
 
-    for xml_path in xml_files:
-        strings = extract_strings_from_xml(xml_path)
+    for strings in _scan_files(extract_strings_from_xml, list(xml_files)):
         result.update(strings)
 
     return result
@@ -490,8 +512,7 @@ def extract_strings_with_all_locations(
     else:
         xml_files = directory.glob(pattern)
 
-    for xml_path in xml_files:
-        file_result = extract_strings_with_locations(xml_path)
+    for file_result in _scan_files(extract_strings_with_locations, list(xml_files)):
         for text, locations in file_result.items():
             if text not in result:
                 result[text] = []
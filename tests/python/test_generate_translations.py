@@ -383,6 +383,19 @@ class TestGenerateLvI18nCode:
         assert "ru_plurals_few" in c_code
         assert "ru_plurals_many" in c_code
 
+    def test_generate_c_skips_empty_singulars_array(self, sample_translations_dict):
+        """A locale without singular strings gets no (unreferenced) singulars array."""
+        from generate_translations import generate_lv_i18n_c
+
+        singulars = dict(sample_translations_dict, ru={})
+        plurals = {"ru": {"file_count": {"one": "%d файл", "other": "%d файлов"}}}
+
+        c_code = generate_lv_i18n_c(singulars, plurals)
+
+        assert "static const char * en_singulars[]" in c_code
+        assert "ru_singulars" not in c_code
+        assert "static const lv_i18n_lang_t ru_lang" in c_code
+
     def test_generate_c_language_struct(self, sample_translations_dict):
         """C code includes language struct definition."""
         from generate_translations import generate_lv_i18n_c
@@ -411,6 +424,20 @@ class TestGenerateLvI18nCode:
         assert "plural_fn" in c_code
         assert "LV_I18N_PLURAL_TYPE_ONE" in c_code
 
+    def test_render_plural_fn_from_spec(self):
+        """Plural functions are rendered from the locale's rule spec."""
+        from generate_translations import PLURAL_RULE_SPECS, render_plural_fn
+
+        ru_fn = render_plural_fn("ru", PLURAL_RULE_SPECS["ru"])
+        assert "static uint8_t ru_plural_fn(int32_t num)" in ru_fn
+        assert "uint32_t i10 = i % 10;" in ru_fn
+        assert "return LV_I18N_PLURAL_TYPE_FEW;" in ru_fn
+        assert "return LV_I18N_PLURAL_TYPE_MANY;" in ru_fn
+
+        fr_fn = render_plural_fn("fr", PLURAL_RULE_SPECS["fr"])
+        assert "if ((i == 0 || i == 1)) return LV_I18N_PLURAL_TYPE_ONE;" in fr_fn
+        assert "op_v" not in fr_fn
+
     def test_generate_c_escapes_strings(self):
         """C strings are properly escaped."""
         from generate_translations import generate_lv_i18n_c
@@ -428,6 +455,16 @@ class TestGenerateLvI18nCode:
         assert r'\"' in c_code  # Escaped double quotes
         assert r'\\' in c_code  # Escaped backslashes
 
+    def test_escape_c_string_preserves_literal_escapes(self):
+        """Literal C escape sequences from YAML pass through unchanged."""
+        from generate_translations import escape_c_string
+
+        assert escape_c_string(r'a\nb') == r'a\nb'
+        assert escape_c_string(r'say \"hi\"') == r'say \"hi\"'
+        assert escape_c_string(r'C:\dir') == r'C:\\dir'
+        assert escape_c_string('tail\\') == 'tail\\\\'
+        assert escape_c_string('tab\there "q"') == r'tab\there \"q\"'
+
     def test_generate_header_file(self, sample_translations_dict):
         """Header file includes necessary declarations."""
         from generate_translations import generate_lv_i18n_h
@@ -154,6 +154,48 @@ class TestExtractSkipsBindText:
         assert "status_text" not in result
         assert "printer_type" not in result
 
+    def test_skip_bind_text_on_continuation_line(self, tmp_path):
+        """bind_text on a later line of the same element still skips its text."""
+        xml_file = tmp_path / "test.xml"
+        xml_file.write_text(dedent("""\
+            <?xml version="1.0"?>
+            <component>
+              <text_muted name="status"
+                          text="Placeholder"
+                          bind_text="status_text"/>
+              <text_body text="Static"/><text_body text="Bound" bind_text="b"/>
+            </component>
+        """))
+
+        from translations.extractor import extract_strings_from_xml
+
+        result = extract_strings_from_xml(xml_file)
+
+        assert "Placeholder" not in result
+        assert "Bound" not in result
+        assert "Static" in result
+
+    def test_keep_bind_text_with_translation_tag(self, tmp_path):
+        """A translation_tag keeps the initial text of a bind_text element."""
+        xml_file = tmp_path / "test.xml"
+        xml_file.write_text(dedent("""\
+            <?xml version="1.0"?>
+            <component>
+              <text_muted name="heater"
+                          text="Extruder PID Tuning" translation_tag="Extruder PID Tuning"
+                          bind_text="pid_heater"/>
+              <text_body text="a > b" bind_text="x"/><text_body text="Kept"/>
+            </component>
+        """))
+
+        from translations.extractor import extract_strings_from_xml
+
+        result = extract_strings_from_xml(xml_file)
+
+        assert "Extruder PID Tuning" in result
+        assert "a > b" not in result
+        assert "Kept" in result
+
 
 class TestExtractSkipsIcons:
     """Test that icon references (#icon_*) are skipped."""
@@ -243,6 +285,28 @@ class TestExtractTrackSourceLocations:
         locations = result["Print Files"]
         assert any("sample.xml" in str(loc[0]) for loc in locations)
 
+    def test_locations_match_extracted_strings(self, tmp_path):
+        """Location tracking skips bind_text elements like plain extraction."""
+        xml_file = tmp_path / "test.xml"
+        xml_file.write_text(dedent("""\
+            <?xml version="1.0"?>
+            <component>
+              <text_body text="Static"/>
+              <text_body text="Placeholder" bind_text="status_text"/>
+            </component>
+        """))
+
+        from translations.extractor import (
+            extract_strings_from_xml,
+            extract_strings_with_locations,
+        )
+
+        result = extract_strings_with_locations(xml_file)
+
+        assert set(result) == extract_strings_from_xml(xml_file)
+        assert "Placeholder" not in result
+        assert result["Static"] == [("test.xml", 3)]
+
 
 class TestExtractFromDirectory:
     """Test extracting from all XML files in a directory."""
@@ -304,6 +368,23 @@ class TestExtractSpecialCharacters:
         # XML entity &amp; should be decoded to &
         assert "Save & Exit" in result
 
+    def test_escaped_entity_decoded_once(self, tmp_path):
+        """&amp;lt; decodes to the literal text &lt;, not to <."""
+        xml_file = tmp_path / "test.xml"
+        xml_file.write_text(dedent("""\
+            <?xml version="1.0"?>
+            <component>
+              <text_body text="Use &amp;lt; for less than"/>
+            </component>
+        """))
+
+        from translations.extractor import extract_strings_from_xml
+
+        result = extract_strings_from_xml(xml_file)
+
+        assert "Use &lt; for less than" in result
+        assert "Use < for less than" not in result
+
     def test_extract_unicode(self, sample_xml_path):
         """Handles unicode characters correctly."""
         from translations.extractor import extract_strings_from_xml
@@ -564,6 +645,60 @@ class TestObsoleteDetection:
         assert "Another Unused" in result
         assert "Used Key" not in result
 
+    def test_tagged_and_multiline_labels_are_not_obsolete(self, tmp_path):
+        """translation_tag labels and multi-line start tags keep their keys.
+
+        Guards `obsolete --action delete` against extractor changes that
+        drop live strings.
+        """
+        yaml_dir = tmp_path / "translations"
+        yaml_dir.mkdir()
+
+        (yaml_dir / "en.yml").write_text(dedent("""\
+            locale: en
+            translations:
+              "Plain Label": "Plain Label"
+              "Tagged Label": "Tagged Label"
+              "Wrapped Label": "Wrapped Label"
+              "Bound Fallback": "Bound Fallback"
+              "Stale Key": "Stale Key"
+        """))
+
+        xml_dir = tmp_path / "ui_xml"
+        (xml_dir / "components").mkdir(parents=True)
+
+        (xml_dir / "panel.xml").write_text(dedent("""\
+            <?xml version="1.0"?>
+            <component>
+              <text_body text="Plain Label"/>
+              <text_body text="Tagged Label" bind_text="status_subject"
+                         translation_tag="true"/>
+              <text_body text="Bound Fallback" bind_text="other_subject"/>
+            </component>
+        """))
+        (xml_dir / "components" / "row.xml").write_text(dedent("""\
+            <?xml version="1.0"?>
+            <component>
+              <text_body
+                  name="wrapped"
+                  hint="a > b"
+                  text="Wrapped Label"/>
+            </component>
+        """))
+
+        from translations.extractor import extract_strings_from_directory
+        from translations.obsolete import find_obsolete_keys
+
+        assert extract_strings_from_directory(xml_dir) == {
+            "Plain Label",
+            "Tagged Label",
+            "Wrapped Label",
+        }
+        assert find_obsolete_keys(xml_dir, yaml_dir) == {
+            "Bound Fallback",
+            "Stale Key",
+        }
+
 
 class TestObsoleteActions:
     """Test actions for handling obsolete keys."""